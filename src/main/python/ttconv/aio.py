@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Coroutine versions of the conversion steps, for use within an asyncio event loop
+
+The CPU-bound work runs on `executor`, which is either a `concurrent.futures.ThreadPoolExecutor`, a
+`concurrent.futures.ProcessPoolExecutor` or `None`, in which case the default executor of the event loop is used.
+When a process pool is used, the arguments and the return value must be picklable, and the iteration functions, which
+share state across steps, are not available.
+
+Example:
+
+  doc = await aio.to_model(srt_reader.to_model, io.StringIO(srt_text))
+  doc = await aio.apply_filters(doc, [LCDFilter(LCDFilterConfig())])
+  async for chunk in aio.iter_output(vtt_writer.from_model_to_stream, doc):
+    await response.write(chunk.encode("utf-8"))
+'''
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import threading
+import typing
+from fractions import Fraction
+
+import ttconv.model as model
+from ttconv.filters.document_filter import DocumentFilter
+from ttconv.isd import ISD, TimeGrid
+
+_T = typing.TypeVar("_T")
+
+async def run(func: typing.Callable[..., _T], *args, executor: typing.Optional[concurrent.futures.Executor] = None,
+  **kwargs) -> _T:
+  '''Returns `func(*args, **kwargs)`, which is run on `executor`'''
+  loop = asyncio.get_running_loop()
+  return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+async def to_model(reader: typing.Callable[..., model.ContentDocument], *args,
+  executor: typing.Optional[concurrent.futures.Executor] = None, **kwargs) -> model.ContentDocument:
+  '''Returns the document read by `reader(*args, **kwargs)`, where `reader` is the `to_model()` function of one of the
+  readers, e.g. `ttconv.srt.reader.to_model`'''
+  return await run(reader, *args, executor=executor, **kwargs)
+
+def _apply_filters(doc: model.ContentDocument, filters: typing.Sequence[DocumentFilter]) -> model.ContentDocument:
+  for doc_filter in filters:
+    doc_filter.process(doc)
+  return doc
+
+async def apply_filters(doc: model.ContentDocument, filters: typing.Sequence[DocumentFilter],
+  executor: typing.Optional[concurrent.futures.Executor] = None) -> model.ContentDocument:
+  '''Applies `filters`, in order, to `doc` and returns the filtered document. The document is modified in place, unless
+  `executor` is a process pool, in which case a filtered copy is returned.'''
+  return await run(_apply_filters, doc, filters, executor=executor)
+
+async def from_model(writer: typing.Callable[..., _T], doc: model.ContentDocument, *args,
+  executor: typing.Optional[concurrent.futures.Executor] = None, **kwargs) -> _T:
+  '''Returns the output of `writer(doc, *args, **kwargs)`, where `writer` is the `from_model()` function of one of the
+  writers, e.g. `ttconv.vtt.writer.from_model`'''
+  return await run(writer, doc, *args, executor=executor, **kwargs)
+
+def _check_in_process(executor: typing.Optional[concurrent.futures.Executor]):
+  if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+    raise ValueError("Iteration is not supported on a process pool")
+
+_END = object()
+
+async def iter_isd_sequence(
+  doc: model.ContentDocument,
+  executor: typing.Optional[concurrent.futures.Executor] = None,
+  progress_callback=lambda _: None,
+  coalesce: bool = False,
+  time_grid: typing.Optional[TimeGrid] = None,
+  begin: typing.Optional[Fraction] = None,
+  end: typing.Optional[Fraction] = None
+  ) -> typing.AsyncIterator[typing.Tuple[Fraction, ISD]]:
+  '''Asynchronous version of `ISD.iter_isd_sequence()`, where each ISD is computed on `executor`. The event loop
+  is free to run other tasks between ISDs.'''
+
+  _check_in_process(executor)
+
+  isds = ISD.iter_isd_sequence(doc, progress_callback, coalesce, time_grid, begin, end)
+
+  while True:
+    item = await run(next, isds, _END, executor=executor)
+
+    if item is _END:
+      break
+
+    yield item
+
+class _Aborted(Exception):
+  '''Raised within the writer when the consumer of the output stops iterating'''
+
+DEFAULT_MAX_PENDING_CHUNKS = 16
+'''Default number of chunks written by the writer and not yet consumed, beyond which `iter_output()` blocks the
+writer'''
+
+class _QueueSink:
+  '''Text sink that forwards the writes of a writer running on an executor to the event loop. A write blocks while
+  `max_pending_chunks` chunks have not been consumed, so that the output does not accumulate in memory when the
+  consumer is slower than the writer.'''
+
+  def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, max_pending_chunks: int):
+    self._loop = loop
+    self._queue = queue
+    self._room = threading.Semaphore(max_pending_chunks)
+    self.is_aborted = False
+
+  def write(self, s: str) -> int:
+    if self.is_aborted:
+      raise _Aborted()
+
+    if len(s) > 0:
+      self._room.acquire()
+
+      if self.is_aborted:
+        raise _Aborted()
+
+      self._loop.call_soon_threadsafe(self._queue.put_nowait, s)
+
+    return len(s)
+
+  def flush(self):
+    pass
+
+  def consumed(self):
+    '''Called when a chunk is consumed'''
+    self._room.release()
+
+  def abort(self):
+    '''Interrupts the writer at its next write, or at its current write if it is blocked'''
+    self.is_aborted = True
+    self._room.release()
+
+async def iter_output(writer: typing.Callable[..., None], doc: model.ContentDocument, *args,
+  executor: typing.Optional[concurrent.futures.Executor] = None,
+  max_pending_chunks: int = DEFAULT_MAX_PENDING_CHUNKS, **kwargs) -> typing.AsyncIterator[str]:
+  '''Returns the output of `writer(doc, sink, *args, **kwargs)` as a sequence of strings, as they are written to
+  `sink`, where `writer` is the `from_model_to_stream()` function of one of the writers, e.g.
+  `ttconv.srt.writer.from_model_to_stream`. The writer waits while `max_pending_chunks` strings have not been
+  consumed. If the iteration is stopped early, the writer is interrupted at its next write.'''
+
+  _check_in_process(executor)
+
+  if max_pending_chunks < 1:
+    raise ValueError("At least one pending chunk is required")
+
+  loop = asyncio.get_running_loop()
+  # holds at most the pending chunks and the end marker
+  queue: asyncio.Queue = asyncio.Queue(max_pending_chunks + 1)
+  sink = _QueueSink(loop, queue, max_pending_chunks)
+
+  def _write():
+    try:
+      writer(doc, sink, *args, **kwargs)
+    finally:
+      loop.call_soon_threadsafe(queue.put_nowait, _END)
+
+  task = loop.run_in_executor(executor, _write)
+
+  try:
+    while True:
+      chunk = await queue.get()
+
+      if chunk is _END:
+        break
+
+      sink.consumed()
+
+      yield chunk
+
+    await task
+
+  finally:
+    if not task.done():
+      sink.abort()
+      # the writer fails with _Aborted, which is of no interest to anyone
+      task.add_done_callback(lambda t: t.cancelled() or t.exception())
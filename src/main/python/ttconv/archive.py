@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Compressed files and archive members
+
+A path ending in `.gz`, `.bz2` or `.xz` designates a compressed file, which is decompressed as it is read and
+compressed as it is written. A path of the form `<archive>!/<member>`, where `<archive>` ends in `.zip`, `.tar`,
+`.tar.gz`, `.tgz`, `.tar.bz2` or `.tar.xz`, designates a member of an archive, e.g. `archive.zip!/ep01.stl`.
+
+Example:
+
+  with archive.open_source("archive.zip!/ep01.stl") as f:
+    doc = stl_reader.to_model_from_file(f)
+
+  with archive.open_target("ep01.vtt.gz") as f:
+    vtt_writer.from_model_to_file(doc, f)
+'''
+
+from __future__ import annotations
+
+import bz2
+import contextlib
+import gzip
+import io
+import lzma
+import os
+import tarfile
+import time
+import typing
+import zipfile
+
+from ttconv.utils import FileOrPath
+
+MEMBER_SEPARATOR = "!/"
+'''Separates the path of an archive from the name of one of its members'''
+
+_COMPRESSED_FILE_OPENERS = {
+  ".gz": gzip.open,
+  ".bz2": bz2.open,
+  ".xz": lzma.open
+}
+
+_ZIP_SUFFIXES = (".zip",)
+
+_TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+def _is_zip(path: str) -> bool:
+  return path.lower().endswith(_ZIP_SUFFIXES)
+
+def _is_tar(path: str) -> bool:
+  return path.lower().endswith(_TAR_SUFFIXES)
+
+def is_archive(path: str) -> bool:
+  '''Returns whether `path` designates a zip or tar archive'''
+  return _is_zip(path) or _is_tar(path)
+
+def split_member_path(path: str) -> typing.Tuple[str, typing.Optional[str]]:
+  '''Returns the path of the archive and the name of the member designated by `path`, or `path` and `None` if `path`
+  does not designate an archive member'''
+
+  archive_path, sep, member = path.partition(MEMBER_SEPARATOR)
+
+  if not sep or not member or not is_archive(archive_path):
+    return (path, None)
+
+  return (archive_path, member)
+
+def member_path(archive_path: str, member: str) -> str:
+  '''Returns the path that designates `member` of the archive at `archive_path`'''
+  return f"{archive_path}{MEMBER_SEPARATOR}{member}"
+
+def _compression_suffix(path: str) -> typing.Optional[str]:
+  ext = os.path.splitext(path)[1].lower()
+  return ext if ext in _COMPRESSED_FILE_OPENERS else None
+
+def content_extension(path: str) -> str:
+  '''Returns the file name extension of the content designated by `path`, i.e. ignoring the archive, if any, and the
+  compression suffix, if any, e.g. `.stl` for `archive.zip!/ep01.stl` and `.srt` for `ep01.srt.gz`'''
+
+  _archive_path, member = split_member_path(path)
+
+  name = member if member is not None else path
+
+  if _compression_suffix(name) is not None:
+    name = os.path.splitext(name)[0]
+
+  return os.path.splitext(name)[1]
+
+def is_plain_path(path: str) -> bool:
+  '''Returns whether `path` designates a file that is neither compressed nor an archive member'''
+  return split_member_path(path)[1] is None and _compression_suffix(path) is None
+
+def iter_members(archive_path: str) -> typing.Iterator[str]:
+  '''Returns the names of the regular files contained in the archive at `archive_path`, in archive order'''
+
+  if _is_zip(archive_path):
+    with zipfile.ZipFile(archive_path) as zip_file:
+      for info in zip_file.infolist():
+        if not info.is_dir():
+          yield info.filename
+
+  elif _is_tar(archive_path):
+    with tarfile.open(archive_path) as tar_file:
+      for info in tar_file:
+        if info.isfile():
+          yield info.name
+
+  else:
+    raise ValueError(f"{archive_path} is not a zip or tar archive")
+
+@contextlib.contextmanager
+def open_source(path: str) -> typing.Iterator[FileOrPath]:
+  '''Opens the input document designated by `path`. A compressed file or archive member is returned as a binary file
+  object, which is decompressed as it is read, and any other path is returned unchanged so that the reader can open
+  it.'''
+
+  archive_path, member = split_member_path(path)
+
+  if member is not None:
+    if _is_zip(archive_path):
+      with zipfile.ZipFile(archive_path) as zip_file, zip_file.open(member) as member_file:
+        yield member_file
+
+    else:
+      with tarfile.open(archive_path) as tar_file:
+        try:
+          member_file = tar_file.extractfile(member)
+        except KeyError:
+          member_file = None
+
+        if member_file is None:
+          raise KeyError(f"There is no file named {member!r} in the archive {archive_path}")
+
+        with member_file:
+          yield member_file
+
+    return
+
+  compression_suffix = _compression_suffix(path)
+
+  if compression_suffix is not None:
+    with _COMPRESSED_FILE_OPENERS[compression_suffix](path, "rb") as compressed_file:
+      yield compressed_file
+
+    return
+
+  yield path
+
+def _add_member(archive_path: str, member: str, data: bytes):
+  if _is_zip(archive_path):
+    with zipfile.ZipFile(archive_path, "a", compression=zipfile.ZIP_DEFLATED) as zip_file:
+      if member in zip_file.namelist():
+        raise ValueError(f"The archive {archive_path} already contains {member!r}")
+
+      zip_file.writestr(member, data)
+
+  else:
+    with tarfile.open(archive_path, "a") as tar_file:
+      if member in tar_file.getnames():
+        raise ValueError(f"The archive {archive_path} already contains {member!r}")
+
+      info = tarfile.TarInfo(member)
+      info.size = len(data)
+      info.mtime = int(time.time())
+      tar_file.addfile(info, io.BytesIO(data))
+
+@contextlib.contextmanager
+def open_target(path: str) -> typing.Iterator[FileOrPath]:
+  '''Opens the output document designated by `path`. A compressed file is returned as a binary file object, which is
+  compressed as it is written, and is removed if an exception is raised. An archive member is returned as a binary file
+  object, whose content is added to the archive, which is created if necessary, only if no exception is raised. Members
+  cannot be added to compressed tar archives or replaced. Any other path is returned unchanged so that the writer can
+  open it.'''
+
+  archive_path, member = split_member_path(path)
+
+  if member is not None:
+    if _is_tar(archive_path) and not archive_path.lower().endswith(".tar"):
+      raise ValueError(f"Members cannot be added to the compressed archive {archive_path}")
+
+    buffer = io.BytesIO()
+
+    yield buffer
+
+    _add_member(archive_path, member, buffer.getvalue())
+
+    return
+
+  compression_suffix = _compression_suffix(path)
+
+  if compression_suffix is not None:
+    try:
+      with _COMPRESSED_FILE_OPENERS[compression_suffix](path, "wb") as compressed_file:
+        yield compressed_file
+    except BaseException:
+      # do not leave a truncated output file behind
+      if os.path.exists(path):
+        os.remove(path)
+      raise
+
+    return
+
+  yield path
@@ -0,0 +1,436 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Incremental batch conversion
+
+`build()` converts a set of input documents to an output directory using a pool of worker processes. A manifest, stored
+in the output directory by default, records for each output document the hash of its input document, the hash of the
+conversion parameters and the version of ttconv that produced it, so that output documents that are up to date are
+not converted again.
+
+The inputs are files, directories, whose files are converted recursively, and zip or tar archives, whose members are
+converted (see `ttconv.archive`). The output document of `<input>/<name>.<ext>` is `<output>/<name>.<output ext>`.
+'''
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import typing
+from dataclasses import dataclass, field
+
+import ttconv.archive as archive
+import ttconv.formats as formats
+from ttconv.utils import ttconv_version
+
+LOGGER = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".ttconv-manifest.json"
+'''Name of the manifest file in the output directory, unless specified otherwise'''
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+@dataclass(frozen=True)
+class BatchJob:
+  '''Conversion of the document at `input_path`, which may designate a compressed file or an archive member, to
+  `output_name` within the output directory'''
+  input_path: str
+  output_name: str
+
+@dataclass
+class BatchResult:
+  '''Output documents, identified by their name within the output directory, that were converted, skipped because they
+  were up to date, or that failed to convert, with the corresponding error message'''
+  converted: typing.List[str] = field(default_factory=list)
+  skipped: typing.List[str] = field(default_factory=list)
+  failed: typing.Dict[str, str] = field(default_factory=dict)
+
+def _output_name(name: str, output_extension: str) -> str:
+  # drops the compression suffix, if any, along with the content extension
+  stem, ext = os.path.splitext(name)
+
+  if ext != archive.content_extension(name):
+    stem = os.path.splitext(stem)[0]
+
+  return f"{stem}.{output_extension}".replace(os.sep, "/")
+
+def _is_input_name(name: str, input_format: typing.Optional[formats.FileFormat]) -> bool:
+  file_format = formats.get_format_by_extension(archive.content_extension(name))
+
+  if input_format is not None:
+    return file_format is input_format
+
+  return file_format is not None and file_format.reader is not None
+
+def find_jobs(
+  inputs: typing.Iterable[str],
+  output_extension: str,
+  itype: typing.Optional[str] = None
+  ) -> typing.List[BatchJob]:
+  '''Returns the conversion jobs for `inputs`. Within directories and archives, only files whose extension is that of
+  the `itype` format, or of any readable format if `itype` is `None`, are converted. Raises `ValueError` if several
+  inputs would be converted to the same output document.'''
+
+  input_format = formats.get_format(itype) if itype is not None else None
+
+  jobs: typing.List[BatchJob] = []
+
+  for input_path in inputs:
+
+    if os.path.isdir(input_path):
+      for dir_path, dir_names, file_names in os.walk(input_path):
+        dir_names.sort()
+
+        for file_name in sorted(file_names):
+          if not _is_input_name(file_name, input_format):
+            continue
+
+          file_path = os.path.join(dir_path, file_name)
+          jobs.append(BatchJob(file_path, _output_name(os.path.relpath(file_path, input_path), output_extension)))
+
+    elif archive.is_archive(input_path) and os.path.isfile(input_path):
+      for member in archive.iter_members(input_path):
+        if _is_input_name(member, input_format):
+          jobs.append(BatchJob(archive.member_path(input_path, member), _output_name(member, output_extension)))
+
+    else:
+      _archive_path, member = archive.split_member_path(input_path)
+      name = os.path.basename(member if member is not None else input_path)
+      jobs.append(BatchJob(input_path, _output_name(name, output_extension)))
+
+  input_paths: typing.Dict[str, str] = {}
+
+  for job in jobs:
+    if job.output_name in input_paths:
+      raise ValueError(f"{input_paths[job.output_name]} and {job.input_path} would both be converted to {job.output_name}")
+    input_paths[job.output_name] = job.input_path
+
+  return jobs
+
+def hash_input(input_path: str) -> str:
+  '''Returns the SHA-256 hash of the content of the document at `input_path`, after decompression if any'''
+
+  with archive.open_source(input_path) as source:
+    with (open(source, "rb") if source is input_path else source) as f:
+      return _hash_stream(f)
+
+def hash_output(output_path: str) -> str:
+  '''Returns the SHA-256 hash of the content of the output document at `output_path`'''
+
+  with open(output_path, "rb") as f:
+    return _hash_stream(f)
+
+def _hash_stream(f: typing.BinaryIO) -> str:
+  h = hashlib.sha256()
+
+  for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+    h.update(chunk)
+
+  return h.hexdigest()
+
+def hash_parameters(
+  otype: str,
+  itype: typing.Optional[str] = None,
+  filters: typing.Sequence[str] = (),
+  begin: typing.Optional[str] = None,
+  end: typing.Optional[str] = None,
+  config_data: typing.Optional[dict] = None
+  ) -> str:
+  '''Returns a hash of the conversion parameters that affect the output documents. The document cache configuration and
+  the general configuration, except for the document language, are ignored.'''
+
+  config_data = dict(config_data or {})
+
+  config_data.pop("document_cache", None)
+
+  general_config = config_data.pop("general", None) or {}
+
+  if general_config.get("document_lang") is not None:
+    config_data["general"] = {"document_lang": general_config["document_lang"]}
+
+  params = {
+    "itype": itype.lower() if itype is not None else None,
+    "otype": otype.lower(),
+    "filters": list(filters),
+    "begin": begin,
+    "end": end,
+    "config": config_data
+  }
+
+  return hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+
+class BuildManifest:
+  '''Records the provenance of the output documents, keyed by their name within the output directory'''
+
+  def __init__(self, path: str):
+    self.path = path
+    self._entries: typing.Dict[str, dict] = {}
+
+    try:
+      with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f).get("outputs", {})
+
+      if not isinstance(entries, dict):
+        raise ValueError("Bad manifest")
+
+      self._entries = entries
+
+    except FileNotFoundError:
+      pass
+
+    except (ValueError, AttributeError):
+      LOGGER.warning("Ignoring unreadable manifest %s", path)
+
+  def get(self, output_name: str) -> typing.Optional[dict]:
+    '''Returns the entry of `output_name`, if any'''
+    return self._entries.get(output_name)
+
+  def put(self, output_name: str, entry: dict):
+    '''Sets the entry of `output_name` to `entry`'''
+    self._entries[output_name] = entry
+
+  def remove(self, output_name: str):
+    '''Removes the entry of `output_name`, if any'''
+    self._entries.pop(output_name, None)
+
+  def is_up_to_date(self, output_name: str, output_path: str, entry: dict) -> bool:
+    '''Returns whether the output document `output_name`, at `output_path`, exists, has not been modified since it was
+    recorded and was produced by the conversion described by `entry`'''
+
+    recorded_entry = self._entries.get(output_name)
+
+    if recorded_entry is None:
+      return False
+
+    for key, value in entry.items():
+      if recorded_entry.get(key) != value:
+        return False
+
+    try:
+      # the size is checked first since it is cheap, but an edit can leave it unchanged
+      return os.path.getsize(output_path) == recorded_entry.get("output_size") \
+        and hash_output(output_path) == recorded_entry.get("output_hash")
+    except OSError:
+      return False
+
+  def save(self):
+    '''Writes the manifest, replacing the previous one atomically'''
+
+    directory = os.path.dirname(os.path.abspath(self.path))
+
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+      with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"outputs": self._entries}, f, indent=2, sort_keys=True)
+      os.replace(temp_path, self.path)
+    except BaseException:
+      os.remove(temp_path)
+      raise
+
+#
+# worker process
+#
+
+_worker_log_level = logging.INFO
+
+def _init_worker(log_level: int):
+  global _worker_log_level  # pylint: disable=global-statement
+
+  # pylint: disable=import-outside-toplevel
+  import ttconv.tt as tt
+
+  _worker_log_level = log_level
+  tt.progress.display_progress_bar = False
+
+def _convert(args: argparse.Namespace) -> typing.Optional[str]:
+  '''Converts a single document and returns `None`, or an error message if the conversion fails. Called in a worker
+  process.'''
+
+  # pylint: disable=import-outside-toplevel
+  import ttconv.tt as tt
+
+  # the configuration of a conversion must not leak to the next one
+  tt.LOGGER.setLevel(_worker_log_level)
+  tt.progress.display_progress_bar = False
+
+  try:
+    tt.convert(args)
+  except SystemExit as e:
+    return str(e.code)
+  except Exception as e:  # pylint: disable=broad-except
+    # the original exception may not be transferable to the main process
+    return f"{type(e).__name__}: {e}"
+
+  if not os.path.exists(args.output):
+    return "The conversion did not produce a single output document"
+
+  return None
+
+#
+# main process
+#
+
+def build(
+  inputs: typing.Sequence[str],
+  output_dir: str,
+  otype: str,
+  itype: typing.Optional[str] = None,
+  filters: typing.Sequence[str] = (),
+  begin: typing.Optional[str] = None,
+  end: typing.Optional[str] = None,
+  config: typing.Optional[str] = None,
+  manifest_path: typing.Optional[str] = None,
+  workers: typing.Optional[int] = None,
+  force: bool = False
+  ) -> BatchResult:
+  '''Converts `inputs` (see `find_jobs()`) to `otype` documents in `output_dir`, on a pool of `workers` processes.
+  `itype`, `filters`, `begin`, `end` and the JSON configuration `config` are as in `tt convert`. Unless `force` is
+  `True`, output documents that are up to date according to the manifest at `manifest_path`, which defaults to
+  `<output_dir>/.ttconv-manifest.json`, are skipped. The manifest is updated as documents are converted.'''
+
+  writer_format = formats.get_format(otype)
+
+  if writer_format is None or writer_format.writer is None:
+    raise ValueError(f"Output type {otype} is not supported")
+
+  if itype is not None and formats.get_format(itype) is None:
+    raise ValueError(f"Input type {itype} is not supported")
+
+  workers = workers if workers is not None else (os.cpu_count() or 1)
+
+  if workers < 1:
+    raise ValueError("At least one worker is required")
+
+  try:
+    config_data = json.loads(config) if config is not None else {}
+  except ValueError:
+    raise ValueError("The configuration must be a JSON object") from None
+
+  if not isinstance(config_data, dict):
+    raise ValueError("The configuration must be a JSON object")
+
+  jobs = find_jobs(inputs, writer_format.extensions[0] if writer_format.extensions else writer_format.name, itype)
+
+  manifest = BuildManifest(manifest_path if manifest_path is not None else os.path.join(output_dir, MANIFEST_NAME))
+
+  parameters_hash = hash_parameters(otype, itype, filters, begin, end, config_data)
+
+  version = ttconv_version()
+
+  result = BatchResult()
+
+  pending: typing.List[typing.Tuple[BatchJob, str, dict]] = []
+
+  for job in jobs:
+    output_path = os.path.join(output_dir, *job.output_name.split("/"))
+
+    try:
+      input_hash = hash_input(job.input_path)
+    except (OSError, KeyError, ValueError) as e:
+      LOGGER.error("Cannot read %s: %s", job.input_path, e)
+      result.failed[job.output_name] = str(e)
+      continue
+
+    entry = {
+      "input": job.input_path,
+      "input_hash": input_hash,
+      "parameters_hash": parameters_hash,
+      "version": version
+    }
+
+    if not force and manifest.is_up_to_date(job.output_name, output_path, entry):
+      result.skipped.append(job.output_name)
+      continue
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+
+    pending.append((job, output_path, entry))
+
+  LOGGER.info("%d document(s) up to date, %d document(s) to convert", len(result.skipped), len(pending))
+
+  if len(pending) == 0:
+    manifest.save()
+    return result
+
+  with concurrent.futures.ProcessPoolExecutor(
+    max_workers=min(workers, len(pending)),
+    initializer=_init_worker,
+    initargs=(logging.getLogger("ttconv").getEffectiveLevel(),)
+    ) as executor:
+
+    futures = {}
+
+    for job, output_path, entry in pending:
+      args = argparse.Namespace(
+        input=job.input_path,
+        output=output_path,
+        itype=itype,
+        otype=otype,
+        filter=list(filters),
+        begin=begin,
+        end=end,
+        config=config,
+        config_file=None
+      )
+
+      futures[executor.submit(_convert, args)] = (job, output_path, entry)
+
+    try:
+      for future in concurrent.futures.as_completed(futures):
+        job, output_path, entry = futures[future]
+
+        error = future.result()
+
+        if error is None:
+          manifest.put(
+            job.output_name,
+            dict(entry, output_size=os.path.getsize(output_path), output_hash=hash_output(output_path))
+          )
+          result.converted.append(job.output_name)
+          LOGGER.info("Converted %s to %s", job.input_path, output_path)
+        else:
+          # the output document, if any, can no longer be trusted
+          manifest.remove(job.output_name)
+          result.failed[job.output_name] = error
+          LOGGER.error("Cannot convert %s: %s", job.input_path, error)
+
+    except BaseException:
+      for future in futures:
+        future.cancel()
+      raise
+
+    finally:
+      # conversions that completed are recorded even if the batch is interrupted
+      manifest.save()
+
+  return result
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Content-addressed on-disk cache of documents'''
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import typing
+from dataclasses import dataclass
+
+import ttconv.model as model
+import ttconv.serialization as serialization
+from ttconv.config import ModuleConfiguration
+from ttconv.utils import ttconv_version
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".ttcv"
+
+_READ_CHUNK_SIZE = 1024 * 1024
+
+@dataclass
+class DocumentCacheConfiguration(ModuleConfiguration):
+  """Document cache configuration"""
+
+  # directory where the cache entries are stored. No cache is used if `None`.
+  directory: typing.Optional[str] = None
+
+  # maximum total size of the cache entries, in bytes
+  max_size: typing.Optional[int] = DEFAULT_MAX_SIZE
+
+  @classmethod
+  def name(cls):
+    return "document_cache"
+
+class DocumentCache:
+  '''Caches documents in a directory, where each document is stored, using `ttconv.serialization`, in a file named
+  after its key. Keys are typically computed using `DocumentCache.make_key()` from the source of the document,
+  e.g. the input file and the reader configuration.
+
+  When the total size of the entries exceeds `max_size`, the least recently used entries are evicted.
+
+  Several processes can share the same directory: entries are written to a temporary file that atomically
+  replaces the entry, and an entry that is evicted or corrupted is treated as a miss.
+  '''
+
+  def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+    if max_size is None or max_size < 0:
+      raise ValueError("The maximum size of the cache must be a non-negative number of bytes")
+
+    self._directory = directory
+    self._max_size = max_size
+
+    os.makedirs(directory, exist_ok=True)
+
+  @staticmethod
+  def make_key(data: typing.Union[bytes, typing.BinaryIO], *params: str) -> str:
+    '''Returns a key computed from the content `data`, either bytes or a binary stream that is read to its end,
+    and the parameters `params`, e.g. the name and configuration of the reader. The key also depends on the
+    version of ttconv, so that documents read by a previous version are not returned after an upgrade.'''
+
+    h = hashlib.sha256()
+
+    for param in params:
+      encoded_param = str(param).encode("utf-8")
+      h.update(len(encoded_param).to_bytes(8, "little"))
+      h.update(encoded_param)
+
+    for param in (str(serialization.FORMAT_VERSION), ttconv_version()):
+      encoded_param = param.encode("utf-8")
+      h.update(len(encoded_param).to_bytes(8, "little"))
+      h.update(encoded_param)
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+      h.update(data)
+    else:
+      for chunk in iter(lambda: data.read(_READ_CHUNK_SIZE), b""):
+        h.update(chunk)
+
+    return h.hexdigest()
+
+  def _entry_path(self, key: str) -> str:
+    if not key.isalnum():
+      raise ValueError("Invalid cache key")
+    return os.path.join(self._directory, key + _ENTRY_SUFFIX)
+
+  def get(self, key: str) -> typing.Optional[model.ContentDocument]:
+    '''Returns the document stored under `key`, or `None` if there is none'''
+
+    path = self._entry_path(key)
+
+    try:
+      with open(path, "rb") as f:
+        data = f.read()
+    except FileNotFoundError:
+      return None
+
+    try:
+      doc = serialization.loads(data)
+    except ValueError:
+      LOGGER.warning("Discarding unreadable document cache entry %s", path)
+      self._remove(path)
+      return None
+
+    # the modification time of an entry is its last use
+    try:
+      os.utime(path)
+    except FileNotFoundError:
+      pass
+
+    return doc
+
+  def put(self, key: str, doc: model.ContentDocument):
+    '''Stores `doc` under `key`, replacing any document already stored under `key`, and evicts the least recently
+    used entries if the cache is full'''
+
+    data = serialization.dumps(doc)
+
+    if len(data) > self._max_size:
+      LOGGER.debug("Document is larger than the document cache")
+      return
+
+    fd, temp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+
+    try:
+      with os.fdopen(fd, "wb") as f:
+        f.write(data)
+      os.replace(temp_path, self._entry_path(key))
+    except BaseException:
+      self._remove(temp_path)
+      raise
+
+    self._evict()
+
+  def clear(self):
+    '''Removes all entries'''
+    for entry in self._iter_entries():
+      self._remove(entry.path)
+
+  def _iter_entries(self) -> typing.Iterator[os.DirEntry]:
+    with os.scandir(self._directory) as entries:
+      for entry in entries:
+        if entry.name.endswith(_ENTRY_SUFFIX) and entry.is_file():
+          yield entry
+
+  def _evict(self):
+    entries = []
+
+    for entry in self._iter_entries():
+      try:
+        stat = entry.stat()
+      except FileNotFoundError:
+        continue
+      entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total_size = sum(size for _, size, _ in entries)
+
+    if total_size <= self._max_size:
+      return
+
+    entries.sort()
+
+    for _, size, path in entries:
+      if total_size <= self._max_size:
+        break
+      self._remove(path)
+      total_size -= size
+
+  @staticmethod
+  def _remove(path: str):
+    try:
+      os.remove(path)
+    except FileNotFoundError:
+      pass
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Cooperative cancellation of conversions
+
+Readers, writers and ISD generation call their `progress_callback` regularly. A `CancellationToken` wraps a progress
+callback so that the conversion is aborted, with a `ConversionCancelledError`, at the first progress point after the
+token is cancelled or its deadline has passed, e.g.
+
+  token = CancellationToken(timeout=10)
+  doc = srt_reader.to_model(f, None, token.wrap())
+  vtt = vtt_writer.from_model(doc, None, token.wrap())
+
+Since cancellation is checked only at progress points, a conversion can run past its deadline by the time it takes to
+reach the next progress point.
+'''
+
+from __future__ import annotations
+
+import threading
+import time
+import typing
+
+class ConversionCancelledError(Exception):
+  '''Raised when a conversion is cancelled'''
+
+class DeadlineExceededError(ConversionCancelledError):
+  '''Raised when a conversion is not complete by its deadline'''
+
+class CancellationToken:
+  '''Signals to a conversion that it should stop, either because `cancel()` was called, possibly from another thread,
+  or because `timeout` seconds have passed since the token was created'''
+
+  def __init__(self, timeout: typing.Optional[float] = None):
+    if timeout is not None and timeout < 0:
+      raise ValueError("The timeout must be non-negative")
+
+    self._deadline = time.monotonic() + timeout if timeout is not None else None
+    self._cancelled = threading.Event()
+
+  def cancel(self):
+    '''Requests the conversion to stop at the next progress point'''
+    self._cancelled.set()
+
+  def is_cancelled(self) -> bool:
+    '''Returns whether `cancel()` was called'''
+    return self._cancelled.is_set()
+
+  def remaining(self) -> typing.Optional[float]:
+    '''Returns the number of seconds until the deadline, which is negative if it has passed, or `None` if there is
+    no deadline'''
+    return self._deadline - time.monotonic() if self._deadline is not None else None
+
+  def check(self):
+    '''Raises `ConversionCancelledError` if `cancel()` was called, or `DeadlineExceededError` if the deadline has
+    passed'''
+
+    if self._cancelled.is_set():
+      raise ConversionCancelledError("The conversion was cancelled")
+
+    if self._deadline is not None and time.monotonic() >= self._deadline:
+      raise DeadlineExceededError("The conversion did not complete by its deadline")
+
+  def wrap(self, progress_callback: typing.Optional[typing.Callable[[float], typing.Any]] = None
+    ) -> typing.Callable[[float], None]:
+    '''Returns a progress callback that calls `check()` and then `progress_callback`, if any'''
+
+    def _progress_callback(percent_progress: float):
+      self.check()
+      if progress_callback is not None:
+        progress_callback(percent_progress)
+
+    return _progress_callback
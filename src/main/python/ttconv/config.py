@@ -89,6 +89,8 @@ class GeneralConfiguration(ModuleConfiguration):
   log_level: Optional[str] = "INFO"
   progress_bar: Optional[bool] = True
   document_lang: Optional[str] = None
+  # maximum duration of a conversion, in seconds
+  timeout: Optional[float] = None
 
   @classmethod
   def name(cls):
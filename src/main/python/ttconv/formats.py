@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Registry of the file formats supported by the `tt` command line application
+
+Each format is described by a `FileFormat`, which references its reader, writer and configuration classes by name, so
+that their modules are imported only when a conversion uses them.
+
+Formats provided by other packages are discovered through the `ttconv.formats` entry point group, where the name of
+each entry point is the name of the format and the entry point references a `FileFormat` instance, e.g.
+
+  entry_points={"ttconv.formats": ["dfxp = my_package.dfxp:DFXP_FORMAT"]}
+
+A reader is called as `reader(file, config, progress_callback)` and returns a `ttconv.model.ContentDocument`, or `None`
+if the input is not valid. A writer is called as `writer(doc, file, config, progress_callback, isd_config)`. In both
+cases, `file` is either a path or a binary file object, e.g. `sys.stdin.buffer` or `sys.stdout.buffer`. When
+resource limits are configured, readers and writers are also passed a `limits` keyword argument (see `ttconv.limits`).
+'''
+
+from __future__ import annotations
+
+import importlib
+import logging
+import typing
+from dataclasses import dataclass
+
+LOGGER = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "ttconv.formats"
+
+def load_object(name: str) -> typing.Any:
+  '''Returns the object referenced by `name`, which is of the form `<module>:<qualified name>`'''
+
+  module_name, _, qualname = name.partition(":")
+
+  obj = importlib.import_module(module_name)
+
+  for attr in filter(None, qualname.split(".")):
+    obj = getattr(obj, attr)
+
+  return obj
+
+@dataclass(frozen=True)
+class FileFormat:
+  '''Describes a file format. The reader, writer and configuration classes are specified as `<module>:<qualified name>`
+  references, and are `None` if the format cannot be read or written, or has no configuration.'''
+
+  name: str
+  extensions: typing.Tuple[str, ...] = ()
+  reader: typing.Optional[str] = None
+  reader_config: typing.Optional[str] = None
+  writer: typing.Optional[str] = None
+  writer_config: typing.Optional[str] = None
+
+  def load_reader(self) -> typing.Optional[typing.Callable]:
+    '''Returns the reader function, if any'''
+    return load_object(self.reader) if self.reader is not None else None
+
+  def load_reader_config(self) -> typing.Optional[type]:
+    '''Returns the reader configuration class, if any'''
+    return load_object(self.reader_config) if self.reader_config is not None else None
+
+  def load_writer(self) -> typing.Optional[typing.Callable]:
+    '''Returns the writer function, if any'''
+    return load_object(self.writer) if self.writer is not None else None
+
+  def load_writer_config(self) -> typing.Optional[type]:
+    '''Returns the writer configuration class, if any'''
+    return load_object(self.writer_config) if self.writer_config is not None else None
+
+_formats: typing.Dict[str, FileFormat] = {}
+
+def register_format(file_format: FileFormat):
+  '''Registers `file_format`, replacing any format with the same name'''
+  _formats[file_format.name.lower()] = file_format
+
+register_format(FileFormat(
+  "ttml",
+  extensions=("ttml",),
+  reader="ttconv.imsc.reader:to_model_from_file",
+  writer="ttconv.imsc.writer:from_model_to_file",
+  writer_config="ttconv.imsc.config:IMSCWriterConfiguration"
+))
+
+register_format(FileFormat(
+  "scc",
+  extensions=("scc",),
+  reader="ttconv.scc.reader:to_model_from_file",
+  reader_config="ttconv.scc.config:SccReaderConfiguration",
+  writer="ttconv.scc.writer:from_model_to_file",
+  writer_config="ttconv.scc.config:SccWriterConfiguration"
+))
+
+register_format(FileFormat(
+  "srt",
+  extensions=("srt",),
+  reader="ttconv.srt.reader:to_model_from_file",
+  reader_config="ttconv.srt.config:SRTReaderConfiguration",
+  writer="ttconv.srt.writer:from_model_to_file",
+  writer_config="ttconv.srt.config:SRTWriterConfiguration"
+))
+
+register_format(FileFormat(
+  "stl",
+  extensions=("stl",),
+  reader="ttconv.stl.reader:to_model_from_file",
+  reader_config="ttconv.stl.config:STLReaderConfiguration"
+))
+
+register_format(FileFormat(
+  "vtt",
+  extensions=("vtt",),
+  reader="ttconv.vtt.reader:to_model_from_file",
+  writer="ttconv.vtt.writer:from_model_to_file",
+  writer_config="ttconv.vtt.config:VTTWriterConfiguration"
+))
+
+_BUILTIN_FORMATS = frozenset(_formats)
+
+def _iter_entry_points():
+  try:
+    import importlib.metadata as metadata  # pylint: disable=import-outside-toplevel
+  except ImportError:
+    # Python 3.7
+    try:
+      import importlib_metadata as metadata  # pylint: disable=import-outside-toplevel
+    except ImportError:
+      return []
+
+  entry_points = metadata.entry_points()
+
+  if hasattr(entry_points, "select"):
+    return entry_points.select(group=ENTRY_POINT_GROUP)
+
+  return entry_points.get(ENTRY_POINT_GROUP, [])
+
+_are_entry_points_loaded = False
+
+def _load_entry_points():
+  global _are_entry_points_loaded  # pylint: disable=global-statement
+
+  if _are_entry_points_loaded:
+    return
+
+  _are_entry_points_loaded = True
+
+  for entry_point in _iter_entry_points():
+    if entry_point.name.lower() in _formats:
+      continue
+
+    try:
+      file_format = entry_point.load()
+    except Exception:  # pylint: disable=broad-except
+      LOGGER.exception("Cannot load the %s format", entry_point.name)
+      continue
+
+    if not isinstance(file_format, FileFormat):
+      LOGGER.error("The %s entry point does not reference a FileFormat", entry_point.name)
+      continue
+
+    register_format(file_format)
+
+def get_format(name: str) -> typing.Optional[FileFormat]:
+  '''Returns the format called `name`, if any. Formats provided by other packages are loaded only if `name` is not
+  the name of a built-in format.'''
+
+  name = name.lower()
+
+  if name not in _formats:
+    _load_entry_points()
+
+  return _formats.get(name)
+
+def get_format_by_extension(extension: str) -> typing.Optional[FileFormat]:
+  '''Returns the format that uses the file name extension `extension`, e.g. `.srt`, if any'''
+
+  extension = extension.lower().lstrip(".")
+
+  for _ in range(2):
+    for file_format in _formats.values():
+      if extension in file_format.extensions:
+        return file_format
+
+    if _are_entry_points_loaded:
+      break
+
+    _load_entry_points()
+
+  return None
+
+def list_formats() -> typing.List[FileFormat]:
+  '''Returns all formats, including those provided by other packages'''
+
+  _load_entry_points()
+
+  return list(_formats.values())
+
+def builtin_formats() -> typing.List[FileFormat]:
+  '''Returns the formats provided by ttconv'''
+  return [_formats[name] for name in sorted(_BUILTIN_FORMATS)]
@@ -27,18 +27,34 @@
 
 import logging
 import typing
+import xml.etree.ElementTree as et
 
 import ttconv.imsc.elements as imsc_elements
 import ttconv.model as model
+from ttconv.limits import ResourceLimits
+from ttconv.utils import FileOrPath
 
 LOGGER = logging.getLogger(__name__)
 
 
-def to_model(xml_tree, progress_callback=lambda _: None) -> typing.Optional[model.ContentDocument]:
-  '''Convers an IMSC document to the data model'''
+def to_model(
+  xml_tree,
+  progress_callback=lambda _: None,
+  limits: typing.Optional[ResourceLimits] = None
+  ) -> typing.Optional[model.ContentDocument]:
+  '''Convers an IMSC document to the data model. If specified, `limits.max_elements` is checked against the number of
+  XML elements before the document is converted, and against the converted document.'''
 
   xml_element = xml_tree.getroot()
 
+  if limits is not None and limits.max_elements is not None:
+    xml_element_count = 0
+    for _ in xml_element.iter():
+      xml_element_count += 1
+      if xml_element_count > limits.max_elements:
+        break
+    ResourceLimits.check("max_elements", limits.max_elements, xml_element_count)
+
   if not imsc_elements.TTElement.is_instance(xml_element):
     LOGGER.fatal("A tt element is not the root element")
     return None
@@ -49,5 +65,17 @@ def to_model(xml_tree, progress_callback=lambda _: None) -> typing.Optional[mode
     LOGGER.fatal("Invalid TT element")
     return None 
 
+  if limits is not None:
+    limits.check_document(tt_element.doc)
+
   return tt_element.doc
-  
\ No newline at end of file
+
+def to_model_from_file(
+  file: FileOrPath,
+  _config = None,
+  progress_callback=lambda _: None,
+  limits: typing.Optional[ResourceLimits] = None
+  ) -> typing.Optional[model.ContentDocument]:
+  '''Converts the IMSC document read from `file`, which is a path or a binary file object, to the data model'''
+
+  return to_model(et.parse(file), progress_callback, limits)
@@ -25,8 +25,10 @@
 
 '''IMSC writer'''
 
+import io
 import logging
 import numbers
+import os
 import typing
 import xml.etree.ElementTree as et
 import ttconv.imsc.elements as imsc_elements
@@ -34,6 +36,8 @@
 import ttconv.model as model
 import ttconv.imsc.config as imsc_config
 from ttconv.imsc.attributes import TimeExpressionSyntaxEnum
+from ttconv.limits import ResourceLimits
+from ttconv.utils import FileOrPath, open_binary
 
 LOGGER = logging.getLogger(__name__)
 
@@ -87,3 +91,45 @@ def from_model(
       config.profile_signaling
     )
   )
+
+def from_model_to_file(
+  model_doc: model.ContentDocument,
+  file: FileOrPath,
+  config: typing.Optional[imsc_config.IMSCWriterConfiguration] = None,
+  progress_callback: typing.Callable[[numbers.Real], typing.NoReturn] = lambda _: None,
+  isd_config = None,
+  limits: typing.Optional[ResourceLimits] = None
+  ):
+  '''Converts the data model to an IMSC document, which is written to `file`, a path or a binary file object. The
+  conversion window, if any, specified by `isd_config` is not supported and is ignored. If `limits.max_output_size` is
+  exceeded, no file is left at the path and nothing is written to the file object.
+  '''
+
+  if isd_config is not None and (isd_config.begin is not None or isd_config.end is not None):
+    LOGGER.warning("The conversion window is not supported by the TTML writer and is ignored")
+
+  tree = from_model(model_doc, config, progress_callback)
+
+  max_output_size = limits.max_output_size if limits is not None else None
+
+  if isinstance(file, (str, os.PathLike)):
+    with open_binary(file, "w") as f:
+      tree.write(f, encoding="utf-8")
+
+    if max_output_size is not None:
+      size = os.path.getsize(file)
+
+      if size > max_output_size:
+        os.remove(file)
+        ResourceLimits.check("max_output_size", max_output_size, size)
+
+  elif max_output_size is not None:
+    # the document is buffered so that nothing is written to the file object if it exceeds the limit
+
+    buffer = io.BytesIO()
+    tree.write(buffer, encoding="utf-8")
+    ResourceLimits.check("max_output_size", max_output_size, buffer.tell())
+    file.write(buffer.getvalue())
+
+  else:
+    tree.write(file, encoding="utf-8")
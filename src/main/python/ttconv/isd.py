@@ -27,19 +27,25 @@
 
 from __future__ import annotations
 
+import bisect
+import collections
+import concurrent.futures
+import functools
 import inspect
+import math
 import typing
 import numbers
 import re
 import sys
 import os
 import multiprocessing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from fractions import Fraction
 
 import ttconv.model as model
 import ttconv.style_properties as styles
 from ttconv.config import ModuleConfiguration
+from ttconv.limits import ResourceLimits, ResourceLimitExceededError
 from ttconv.utils import DisjointIntervals
 
 
@@ -78,24 +84,101 @@ def offsets(self) -> typing.Tuple[Fraction,...]:
 
 @dataclass(frozen=True)
 class _SingleRegionDocumentCache:
-  """Cache for a single region document.
+  """Cache for a single region document. The cache is not modified once constructed, except for entries added to
+  `lwsp_cache` and `region_styles`, and can therefore be shared by threads that compute ISDs concurrently.
 
   `interval_cache`: maps every element in the document to its absolute temporal interval
   `doc`: document containing a single region
   `content_intervals`: set of temporal intervals during which the document is active
+  `lwsp_cache`: maps a paragraph and its text (see `_construct_text_list()`) to the text after LWSP processing
+  `region_styles`: maps a region without animation to its computed style property values, which are the same in all
+  ISDs. Since the default region is created for each ISD, it is identified by its id.
+
+  Since an entry of `lwsp_cache` or `region_styles` depends only on its key, a concurrent addition of the same entry is
+  harmless.
   """
   interval_cache: typing.Mapping[model.ContentElement, typing.Tuple[Fraction, Fraction]]
   doc: model.ContentDocument
   content_intervals: typing.Optional[DisjointIntervals]
+  lwsp_cache: typing.Dict[tuple, typing.Tuple[typing.Optional[str], ...]] = field(default_factory=dict)
+  region_styles: typing.Dict[typing.Union[model.Region, str], tuple] = field(default_factory=dict)
+
+@dataclass(frozen=True)
+class ISDSequenceEstimate:
+  """Estimated cost of generating the ISD sequence of a document (see `ISD.estimate_sequence()`).
+
+  `significant_times`: number of significant times, i.e. of ISDs
+  `max_isd_elements`: upper bound of the number of elements in any single ISD
+  `total_isd_elements`: upper bound of the total number of elements across all ISDs, which is proportional to the
+  cost of generating the sequence
+  """
+  significant_times: int
+  max_isd_elements: int
+  total_isd_elements: int
+
+  def check(self, limits: ResourceLimits):
+    """Raises `ResourceLimitExceededError` if generating the ISD sequence would exceed `limits`"""
+    ResourceLimits.check("max_significant_times", limits.max_significant_times, self.significant_times)
+    ResourceLimits.check("max_isd_elements", limits.max_isd_elements, self.max_isd_elements)
+
+@dataclass(frozen=True)
+class TimeGrid:
+  """Grid of temporal offsets onto which significant times are snapped, e.g. the frames of a frame-based
+  output format.
+
+  `rate`: number of grid points per second, e.g. the frame rate
+  `round_down`: whether a temporal offset is snapped to the preceding grid point, instead of the nearest one
+  """
+  rate: Fraction
+  round_down: bool = False
+
+  def __post_init__(self):
+    if self.rate <= 0:
+      raise ValueError("Time grid rate must be larger than 0")
+
+  def snap(self, offset: Fraction) -> Fraction:
+    """Returns the grid point onto which the temporal offset `offset` is snapped"""
+    ticks = offset * self.rate
+    return Fraction(math.floor(ticks) if self.round_down else round(ticks)) / self.rate
 
 ISD_NO_MULTIPROC_ENV = "ISD_NO_MULTIPROC"
 
 
+def _decode_offset(value: typing.Optional[typing.Union[str, numbers.Number]]) -> typing.Optional[Fraction]:
+  if value is None:
+    return None
+
+  offset = Fraction(str(value))
+
+  if offset < 0:
+    raise ValueError(f"Invalid temporal offset '{value}'. Expect a non-negative number of seconds.")
+
+  return offset
+
+def _decode_worker_threads(value: typing.Optional[int]) -> typing.Optional[int]:
+  if value is None:
+    return None
+
+  if not isinstance(value, int) or value < 1:
+    raise ValueError(f"Invalid number of worker threads '{value}'. Expect a positive integer.")
+
+  return value
+
 @dataclass
 class ISDConfiguration(ModuleConfiguration):
   """ISD configuration"""
   multi_thread: bool = True
 
+  # begin of the window of the ISD sequence, in seconds
+  begin: typing.Optional[Fraction] = field(default=None, metadata={"decoder": _decode_offset})
+
+  # end of the window of the ISD sequence, in seconds
+  end: typing.Optional[Fraction] = field(default=None, metadata={"decoder": _decode_offset})
+
+  # number of threads used to compute ISDs, which defaults to the number of CPUs on free-threaded Python builds and
+  # to 1, i.e. ISDs are computed by the calling thread, otherwise
+  worker_threads: typing.Optional[int] = field(default=None, metadata={"decoder": _decode_worker_threads})
+
   @classmethod
   def name(cls):
     return "isd"
@@ -163,6 +246,9 @@ def __init__(self, doc: typing.Optional[model.ContentDocument]):
 
     self._regions: typing.Mapping[str, ISD.Region] = {}
 
+    self._content_key: typing.Optional[tuple] = None
+    self._fingerprint: typing.Optional[int] = None
+
     if doc is not None:
       self.set_active_area(doc.get_active_area())
       self.set_cell_resolution(doc.get_cell_resolution())
@@ -182,11 +268,17 @@ def put_region(self, region: ISD.Region):
 
     self._regions[region.get_id()] = region
 
+    self._content_key = None
+    self._fingerprint = None
+
   def remove_region(self, region_id: str):
     '''Removes the region with `id == region_id` from the ISD.'''
 
     del self._regions[region_id]
 
+    self._content_key = None
+    self._fingerprint = None
+
   def get_region(self, region_id) -> typing.Optional[ISD.Region]:
     '''Returns the region with `id == region_id` or None, if none exists.'''
     return self._regions.get(region_id)
@@ -203,6 +295,34 @@ def __len__(self) -> int:
     '''Returns the number of regions of the ISD.'''
     return len(self._regions)
 
+  # structural fingerprint
+
+  def _get_content_key(self) -> tuple:
+    if self._content_key is None:
+      self._content_key = tuple(_make_content_key(region) for region in self._regions.values())
+      self._fingerprint = hash(self._content_key)
+    return self._content_key
+
+  def fingerprint(self) -> int:
+    '''Returns a hash of the content of the ISD, i.e. its regions and their descendants, including
+    text, styles, language and white space handling, but excluding element identifiers. The fingerprint
+    is computed by `ISD.from_model`, or on first use, and is not updated by subsequent modifications to
+    the elements of the ISD.
+    '''
+    self._get_content_key()
+    return self._fingerprint
+
+  def has_same_content(self, other: ISD) -> bool:
+    '''Returns whether the ISD `other` has the same content as the ISD, as defined by `fingerprint()`.
+    '''
+    if self is other:
+      return True
+
+    if self.fingerprint() != other.fingerprint():
+      return False
+
+    return self._get_content_key() == other._get_content_key()
+
   @staticmethod
   def _make_absolute(
       begin_offset: typing.Optional[Fraction],
@@ -269,9 +389,15 @@ def _region_always_has_background(region: typing.Type[model.Region]) -> bool:
     return True
 
   @staticmethod
-  def significant_times(doc: model.ContentDocument) -> SignificantTimes:
+  def significant_times(
+    doc: model.ContentDocument,
+    limits: typing.Optional[ResourceLimits] = None
+    ) -> SignificantTimes:
     '''Returns a list of the temporal offsets at which the document `doc` changes, sorted in
-    increasing order'''
+    increasing order. Raises `ResourceLimitExceededError` as soon as the number of significant times exceeds
+    `limits.max_significant_times`, if specified.'''
+
+    max_sig_times = limits.max_significant_times if limits is not None else None
 
     def compute_sig_times(
       interval_cache,
@@ -315,6 +441,9 @@ def compute_sig_times(
         if anim_end_time is not None:
           s_times.add(anim_end_time)
 
+      if max_sig_times is not None and len(s_times) > max_sig_times:
+        raise ResourceLimitExceededError("max_significant_times", max_sig_times)
+
       # add signficant times for the children of the element 
 
       for child_element in iter(element):
@@ -366,6 +495,8 @@ def from_model(
     sig_times: typing.Optional[SignificantTimes] = None) -> typing.Optional[ISD]:
     '''Creates an ISD from a snapshot of a ContentDocument `doc` at a given time offset `offset`.
     A `SignificantTimes` instance generated from `doc` can be provided to speed-up the generation process.
+    Neither `doc` nor `sig_times` is modified, so ISDs of the same document can be created concurrently by
+    multiple threads.
     '''
     isd = ISD(doc)
 
@@ -382,15 +513,17 @@ def from_model(
 
       if regions:
         for region in regions:
-          isd_region = ISD._process_element(cached_doc.interval_cache, activity_cache, isd, offset, region, None, None, None, None, region)
+          isd_region = ISD._process_element(cached_doc, activity_cache, isd, offset, region, None, None, None, None, region)
           if isd_region is not None:
             isd.put_region(isd_region)
       else:
         default_region = model.Region(ISD.DEFAULT_REGION_ID, doc)
-        isd_region = ISD._process_element(cached_doc.interval_cache, activity_cache, isd, offset, None, None, None, None, None, default_region)
+        isd_region = ISD._process_element(cached_doc, activity_cache, isd, offset, None, None, None, None, None, default_region)
         if isd_region is not None:
           isd.put_region(isd_region)
 
+    isd._get_content_key()
+
     return isd
 
   # TODO: remove is_multithreaded
@@ -398,26 +531,148 @@ def from_model(
   def generate_isd_sequence(
     doc: model.ContentDocument,
     progress_callback=lambda _: None,
-    is_multithreaded: bool = True       # pylint: disable=unused-argument
+    is_multithreaded: bool = True,      # pylint: disable=unused-argument
+    coalesce: bool = False,
+    time_grid: typing.Optional[TimeGrid] = None,
+    begin: typing.Optional[Fraction] = None,
+    end: typing.Optional[Fraction] = None,
+    worker_threads: typing.Optional[int] = None,
+    limits: typing.Optional[ResourceLimits] = None
     ) -> typing.List[typing.Tuple[Fraction, ISD]]:
     """ Returns a list of duples, each consisting of a significant time in the ContentDocument `doc`
     and the corresponding `ISD` instance. The duples are sorted in order of increasing significant time.
+    If `coalesce` is `True`, an ISD that has the same content as the preceding ISD (see `ISD.has_same_content()`)
+    is omitted from the list, i.e. the preceding ISD extends until the next significant time.
+    If `time_grid` is specified, significant times are snapped onto the grid before any ISD is computed and,
+    when multiple significant times are snapped onto the same grid point, only the ISD at the latest of them
+    is computed.
+    If `begin` or `end` is specified, ISDs are computed only within the window `[begin, end)`: the list starts with
+    the ISD at `begin` and, if `end` is specified, ends with an ISD at `end` that contains no regions.
+    ISDs are computed by a pool of `worker_threads` threads (see `ISDConfiguration.worker_threads` for the default).
+    If specified, `limits.max_significant_times` and `limits.max_isd_elements` are enforced.
     The `is_multithreaded` flag is not used and is kept for backwards compatibility only.
     """
+
+    return list(
+      ISD.iter_isd_sequence(
+        doc,
+        progress_callback,
+        coalesce=coalesce,
+        time_grid=time_grid,
+        begin=begin,
+        end=end,
+        worker_threads=worker_threads,
+        limits=limits
+      )
+    )
+
+  @staticmethod
+  def iter_isd_sequence(
+    doc: model.ContentDocument,
+    progress_callback=lambda _: None,
+    coalesce: bool = False,
+    time_grid: typing.Optional[TimeGrid] = None,
+    begin: typing.Optional[Fraction] = None,
+    end: typing.Optional[Fraction] = None,
+    worker_threads: typing.Optional[int] = None,
+    limits: typing.Optional[ResourceLimits] = None
+    ) -> typing.Iterator[typing.Tuple[Fraction, ISD]]:
+    """Same as `generate_isd_sequence()` but each duple is computed only when the iterator reaches it, which
+    allows the ISDs to be processed, and released, as they are generated. When multiple threads are used, at most
+    a few ISDs per thread are computed ahead of the iterator.
+    """
+
+    if begin is not None and end is not None and end <= begin:
+      raise ValueError("The end of the window must be larger than its begin")
   
-    sig_times = ISD.significant_times(doc)
+    sig_times = ISD.significant_times(doc, limits)
 
     progress_callback(0.1)
 
-    # Compute ISDs
+    max_isd_elements = limits.max_isd_elements if limits is not None else None
+
+    offsets = _snap_offsets(sig_times, time_grid) if time_grid is not None else list(zip(sig_times, sig_times))
+
+    if begin is not None or end is not None:
+      offsets = _window_offsets(offsets, begin, end)
+
+    # Compute ISDs. The content of the last ISD is captured before it is yielded since the caller
+    # can modify the ISD, e.g. filter it, before the next ISD is computed
+
+    last_content: typing.Optional[typing.Tuple[int, tuple]] = None
+
+    def _is_repeated(isd: ISD) -> bool:
+      nonlocal last_content
+      content = (isd.fingerprint(), isd._get_content_key())
+      is_repeated = coalesce and last_content is not None and content == last_content
+      if not is_repeated:
+        last_content = content
+      return is_repeated
+
+    if worker_threads is None:
+      worker_threads = _default_worker_threads()
+    elif worker_threads < 1:
+      raise ValueError("At least one worker thread is required")
+
+    if worker_threads > 1 and len(offsets) > 1:
+      isds = _iter_isds_threaded(doc, [offset for _, offset in offsets], sig_times, worker_threads)
+    else:
+      isds = (ISD.from_model(doc, offset, sig_times) for _, offset in offsets)
+
+    for i, ((grid_offset, _), isd) in enumerate(zip(offsets, isds)):
+      if max_isd_elements is not None:
+        ResourceLimits.check("max_isd_elements", max_isd_elements, _count_isd_elements(isd))
+      if not _is_repeated(isd):
+        yield (grid_offset, isd)
+      progress_callback(0.1 + 0.9 * (i + 1) / len(offsets))
+
+    if end is not None:
+      isd = ISD(doc)
+      if not _is_repeated(isd):
+        yield (end, isd)
+
+
+  @staticmethod
+  def estimate_sequence(
+    doc: model.ContentDocument,
+    sig_times: typing.Optional[SignificantTimes] = None
+    ) -> ISDSequenceEstimate:
+    '''Estimates the cost of generating the ISD sequence of `doc`, without computing any ISD. The estimate
+    assumes that every element is part of the ISDs during its active interval, and is therefore an upper bound.
+    The `SignificantTimes` of `doc` are computed if not provided.'''
+
+    if sig_times is None:
+      sig_times = ISD.significant_times(doc)
 
-    isds = []
-    for i, isd in enumerate(map(_generate_isd, [(doc, offset, sig_times) for offset in sig_times])):
-      isds.append(isd)
-      progress_callback(0.1 + 0.9 * (i + 1) / len(sig_times))
+    offsets = sig_times.offsets()
 
-    return list(zip(sig_times, isds))
+    # number of elements active at each significant time, computed from the changes in the number of active
+    # elements at the beginning and end of the active interval of each element
 
+    changes = [0] * (len(offsets) + 1)
+
+    for cached_doc in sig_times.cache():
+      if not tuple(cached_doc.doc.iter_regions()):
+        # default region
+        changes[0] += 1
+
+      for begin, end in cached_doc.interval_cache.values():
+        if end is not None and end <= begin:
+          continue
+        changes[bisect.bisect_left(offsets, begin)] += 1
+        if end is not None:
+          changes[bisect.bisect_left(offsets, end)] -= 1
+
+    max_isd_elements = 0
+    total_isd_elements = 0
+    active_elements = 0
+
+    for change in changes[:len(offsets)]:
+      active_elements += change
+      max_isd_elements = max(max_isd_elements, active_elements)
+      total_isd_elements += active_elements
+
+    return ISDSequenceEstimate(len(offsets), max_isd_elements, total_isd_elements)
 
   _ORDERED_STYLE_PROPS = (
     styles.StyleProperties.FontSize,
@@ -447,97 +702,24 @@ def _compute_styles(
         StyleProcessors.BY_STYLE_PROP[style_prop].compute(isd_parent, isd_element)
 
   @staticmethod
-  def _process_element(
-      interval_cache,
-      activity_cache,
-      isd: ISD,
-      absolute_offset: Fraction,
-      selected_region: model.Region,
-      inherited_region: typing.Optional[model.Region],
+  def _resolve_styles(
       parent: typing.Optional[model.ContentElement],
-      parent_computed_begin: typing.Optional[Fraction],
-      parent_computed_end: typing.Optional[Fraction],
-      element: model.ContentElement
-  ) -> typing.Optional[model.ContentElement]:
-    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
-
-    # first check the activity cache and return immediate if the element is not active
-
-    is_active = activity_cache.get(element)
-
-    if is_active is False:
-
-      return None
-
-    # compute the temporal extent of the element, hopefully from the cache
-
-    element_interval = interval_cache.get(element)
-
-    if element_interval is None:
-      element_interval = ISD._make_absolute(
-        element.get_begin(),
-        element.get_end(),
-        parent_computed_begin,
-        parent_computed_end
-      )
-      interval_cache[element] = element_interval
-
-    begin_time, end_time = element_interval
-
-    if end_time is not None and end_time <= begin_time:
-      return None
-
-    # update the activity cache if the element was not present
-      
-    if is_active is None:
-
-      if (
-        (begin_time is not None and begin_time > absolute_offset) or
-        (end_time is not None and end_time <= absolute_offset)
-      ) :
-        activity_cache[element] = False
-        return None
-
-      activity_cache[element] = True
-
-    # associated region is that associated with the element, or inherited otherwise
-
-    associated_region = element.get_region() if element.get_region() is not None else inherited_region
-
-    # prune the element if either:
-    # * the element has children and the associated region is neither the default nor the root region
-    # * the element has no children and the associated region is not the root region
-
-    if (
-        not isinstance(element, model.Region) and
-        associated_region is not selected_region and
-        (not element.has_children() or associated_region is not None)
-      ):
-      return None
-
-    # create an ISD element
+      element: model.ContentElement,
+      isd_element: model.ContentElement,
+      begin_time: typing.Optional[Fraction],
+      end_time: typing.Optional[Fraction],
+      absolute_offset: Fraction
+    ):
+    '''Sets the computed style property values of `isd_element`, which is created from `element`, at `absolute_offset`,
+    where `begin_time` and `end_time` are the temporal extent of `element`'''
+    # pylint: disable=too-many-arguments,protected-access
 
     doc = element.get_doc()
 
-    if isinstance(element, model.Region):
-      isd_element = ISD.Region(element.get_id(), isd)
-    else:
-      isd_element = element.__class__(isd)
-      isd_element.set_id(element.get_id())
-
-    if not isinstance(element, (model.Br, model.Text)): 
-      isd_element.set_lang(element.get_lang())
-      isd_element.set_space(element.get_space())
-
     # keep track of specified style properties
 
     styles_to_be_computed: typing.Set[typing.Type[model.StyleProperty]] = set()
 
-    # copy text nodes
-
-    if isinstance(element, model.Text):
-      isd_element.set_text(element.get_text())
-
     # apply animation
 
     for anim_step in element.iter_animation_steps():
@@ -559,7 +741,7 @@ def _process_element(
         continue
 
       styles_to_be_computed.add(anim_step.style_property)
-      isd_element.set_style(anim_step.style_property, anim_step.value)
+      isd_element._set_trusted_style(anim_step.style_property, anim_step.value)
 
     # copy specified styles
 
@@ -570,7 +752,7 @@ def _process_element(
         continue
 
       styles_to_be_computed.add(spec_style_prop)
-      isd_element.set_style(spec_style_prop, element.get_style(spec_style_prop))
+      isd_element._set_trusted_style(spec_style_prop, element.get_style(spec_style_prop))
 
     # direction special semantics
     # https://www.w3.org/TR/ttml2/#style-attribute-direction-special-semantics
@@ -581,7 +763,7 @@ def _process_element(
       styles_to_be_computed.add(styles.StyleProperties.Direction)
       direction = styles.DirectionType.ltr if element.get_style(styles.StyleProperties.WritingMode) == styles.WritingModeType.lrtb \
                   else styles.DirectionType.rtl
-      isd_element.set_style(styles.StyleProperties.Direction, direction)
+      isd_element._set_trusted_style(styles.StyleProperties.Direction, direction)
 
     # inherited styling
 
@@ -617,12 +799,124 @@ def _process_element(
 
         styles_to_be_computed.add(initial_style)
 
-        isd_element.set_style(initial_style, initial_value)
+        isd_element._set_trusted_style(initial_style, initial_value)
 
     # compute style properties
 
     ISD._compute_styles(styles_to_be_computed, parent, isd_element)
 
+  @staticmethod
+  def _process_element(
+      doc_cache: _SingleRegionDocumentCache,
+      activity_cache,
+      isd: ISD,
+      absolute_offset: Fraction,
+      selected_region: model.Region,
+      inherited_region: typing.Optional[model.Region],
+      parent: typing.Optional[model.ContentElement],
+      parent_computed_begin: typing.Optional[Fraction],
+      parent_computed_end: typing.Optional[Fraction],
+      element: model.ContentElement
+  ) -> typing.Optional[model.ContentElement]:
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches,protected-access
+
+    # style property values copied from the element, its parent or the document are not validated again
+
+    # first check the activity cache and return immediate if the element is not active
+
+    is_active = activity_cache.get(element)
+
+    if is_active is False:
+
+      return None
+
+    # compute the temporal extent of the element, hopefully from the cache
+
+    element_interval = doc_cache.interval_cache.get(element)
+
+    if element_interval is None:
+      # the interval cache is shared across ISDs and threads, and is therefore not updated
+      element_interval = ISD._make_absolute(
+        element.get_begin(),
+        element.get_end(),
+        parent_computed_begin,
+        parent_computed_end
+      )
+
+    begin_time, end_time = element_interval
+
+    if end_time is not None and end_time <= begin_time:
+      return None
+
+    # update the activity cache if the element was not present
+      
+    if is_active is None:
+
+      if (
+        (begin_time is not None and begin_time > absolute_offset) or
+        (end_time is not None and end_time <= absolute_offset)
+      ) :
+        activity_cache[element] = False
+        return None
+
+      activity_cache[element] = True
+
+    # associated region is that associated with the element, or inherited otherwise
+
+    associated_region = element.get_region() if element.get_region() is not None else inherited_region
+
+    # prune the element if either:
+    # * the element has children and the associated region is neither the default nor the root region
+    # * the element has no children and the associated region is not the root region
+
+    if (
+        not isinstance(element, model.Region) and
+        associated_region is not selected_region and
+        (not element.has_children() or associated_region is not None)
+      ):
+      return None
+
+    # create an ISD element
+
+    doc = element.get_doc()
+
+    if isinstance(element, model.Region):
+      isd_element = ISD.Region(element.get_id(), isd)
+    else:
+      isd_element = element.__class__(isd)
+      isd_element.set_id(element.get_id())
+
+    if not isinstance(element, (model.Br, model.Text)): 
+      isd_element.set_lang(element.get_lang())
+      isd_element.set_space(element.get_space())
+
+    # copy text nodes
+
+    if isinstance(element, model.Text):
+      isd_element.set_text(element.get_text())
+
+    # resolve the styles of the element. The computed styles of a region without animation are the same in all ISDs,
+    # and are therefore reused.
+
+    region_key = None
+    region_styles = None
+
+    if isinstance(element, model.Region):
+      region_key = element if doc.get_region(element.get_id()) is element else element.get_id()
+      region_styles = doc_cache.region_styles.get(region_key)
+
+    if region_styles is None:
+      ISD._resolve_styles(parent, element, isd_element, begin_time, end_time, absolute_offset)
+
+      if region_key is not None and next(element.iter_animation_steps(), None) is None:
+        doc_cache.region_styles[region_key] = tuple(
+          (style_prop, isd_element.get_style(style_prop)) for style_prop in isd_element.iter_styles()
+        )
+
+    else:
+      for style_prop, value in region_styles:
+        isd_element._set_trusted_style(style_prop, value)
+
     # prune element is display is "none"
 
     if isd_element.get_style(styles.StyleProperties.Display) is styles.DisplayType.none:
@@ -636,7 +930,7 @@ def _process_element(
 
       if doc.get_body() is not None:
         isd_body_element = ISD._process_element(
-          interval_cache,
+          doc_cache,
           activity_cache,
           isd,
           absolute_offset,
@@ -655,7 +949,7 @@ def _process_element(
 
       for child_element in element:
         isd_element_child = ISD._process_element(
-              interval_cache,
+              doc_cache,
               activity_cache,
               isd,
               absolute_offset,
@@ -675,15 +969,33 @@ def _process_element(
 
       if isinstance(isd_element, (model.P, model.Rt, model.Rtc)):
         text_node_list = []
-        _construct_text_list(isd_element, text_node_list)
-        _process_lwsp(text_node_list)
+        lwsp_key_items = []
+        _construct_text_list(isd_element, text_node_list, lwsp_key_items)
+
+        # the paragraph is typically active, with the same children, across several ISDs, so the result of LWSP
+        # processing is reused
+
+        lwsp_key = (element, tuple(lwsp_key_items))
+
+        processed_texts = doc_cache.lwsp_cache.get(lwsp_key)
+
+        if processed_texts is None:
+          _process_lwsp(text_node_list)
+          doc_cache.lwsp_cache[lwsp_key] = tuple(
+            None if isinstance(node, model.Br) else node.get_text() for node in text_node_list
+          )
+        else:
+          for node, processed_text in zip(text_node_list, processed_texts):
+            if processed_text is not None:
+              node.set_text(processed_text)
+
         _prune_empty_spans(isd_element)
 
     # remove styles that are not applicable
 
     for style_prop in list(isd_element.iter_styles()):
       if not isd_element.is_style_applicable(style_prop):
-        isd_element.set_style(style_prop, None)
+        isd_element._set_trusted_style(style_prop, None)
     
     # prune or keep the element
 
@@ -701,6 +1013,20 @@ def _process_element(
 
     return None
 
+def _make_content_key(element: model.ContentElement) -> tuple:
+  '''Returns a hashable value that captures the content of `element` and its descendants, excluding
+  element identifiers'''
+  if isinstance(element, model.Text):
+    return (model.Text, element.get_text())
+
+  return (
+    type(element),
+    element.get_lang(),
+    element.get_space(),
+    frozenset((style_prop, element.get_style(style_prop)) for style_prop in element.iter_styles()),
+    tuple(_make_content_key(child) for child in element)
+  )
+
 def _prune_empty_spans(element: model.ContentElement):
   children = list(element)
   for child in children:
@@ -711,13 +1037,38 @@ def _prune_empty_spans(element: model.ContentElement):
       element.remove_child(child)
 
 
-def _construct_text_list(element: model.ContentElement, text_node_list: typing.List[typing.Union[model.Text, model.Br]]):
-  '''Constructs a list of all text and br elements in dfs order, excluding rt, rtc and rp elements'''
+def _construct_text_list(
+  element: model.ContentElement,
+  text_node_list: typing.List[typing.Union[model.Text, model.Br]],
+  lwsp_key_items: typing.Optional[list] = None
+  ):
+  '''Constructs a list of all text and br elements in dfs order, excluding rt, rtc and rp elements. If `lwsp_key_items`
+  is specified, the input of `_process_lwsp()` for each element, i.e. `None` for a br element, and the text and
+  whether white space is preserved for a text element, is appended to it.'''
+  is_space_preserved = None
+
   for child in element:
-    if isinstance(child, model.Br) or (isinstance(child, model.Text) and child.get_text()):
+    if isinstance(child, model.Br):
       text_node_list.append(child)
+
+      if lwsp_key_items is not None:
+        lwsp_key_items.append(None)
+
+    elif isinstance(child, model.Text):
+      text = child.get_text()
+
+      if not text:
+        continue
+
+      text_node_list.append(child)
+
+      if lwsp_key_items is not None:
+        if is_space_preserved is None:
+          is_space_preserved = element.get_space() is model.WhiteSpaceHandling.PRESERVE
+        lwsp_key_items.append((text, is_space_preserved))
+
     elif not isinstance(child, (model.Rt, model.Rtc, model.Rp)):
-      _construct_text_list(child, text_node_list)
+      _construct_text_list(child, text_node_list, lwsp_key_items)
 
 def _process_lwsp(text_node_list: typing.List[typing.Union[model.Text, model.Br]]):
   '''Processes LWSP according to the space property'''
@@ -848,6 +1199,35 @@ def _make_rw_length(value: numbers.Number) -> styles.LengthType:
     units=styles.LengthType.Units.rw
   )
 
+_ROOT_HEIGHT = _make_rh_length(100)
+
+_ROOT_WIDTH = _make_rw_length(100)
+
+@dataclass(frozen=True)
+class _ReferenceLengths:
+  """Lengths of a cell (`c_h` and `c_w`) and of a pixel (`px_h` and `px_w`) of a document, expressed in `rh` and
+  `rw` units, which are used to compute lengths expressed in `c` and `px` units"""
+  c_h: styles.LengthType
+  c_w: styles.LengthType
+  px_h: styles.LengthType
+  px_w: styles.LengthType
+
+@functools.lru_cache(maxsize=16)
+def _make_reference_lengths(
+  cell_resolution: model.CellResolutionType,
+  px_resolution: model.PixelResolutionType
+  ) -> _ReferenceLengths:
+  return _ReferenceLengths(
+    c_h=_make_rh_length(100 / cell_resolution.rows),
+    c_w=_make_rw_length(100 / cell_resolution.columns),
+    px_h=_make_rh_length(100 / px_resolution.height),
+    px_w=_make_rw_length(100 / px_resolution.width)
+  )
+
+def _get_reference_lengths(doc: model.Document) -> _ReferenceLengths:
+  '''Returns the reference lengths of `doc`, which are computed once for each cell and pixel resolution'''
+  return _make_reference_lengths(doc.get_cell_resolution(), doc.get_px_resolution())
+
 def _get_writing_mode(isd_parent: model.ContentElement, isd_element: model.ContentElement) -> styles.WritingModeType:
 
   while isd_parent is not None:
@@ -876,10 +1256,11 @@ def inherit(cls, parent: model.ContentElement, element: model.ContentElement):
     '''Inherit the style property from the parent to the element
     '''
     if cls.style_prop.is_inherited and not element.has_style(cls.style_prop):
-      element.set_style(cls.style_prop, parent.get_style(cls.style_prop))
+      element._set_trusted_style(cls.style_prop, parent.get_style(cls.style_prop))  # pylint: disable=protected-access
 
 class StyleProcessors:
-  '''Processes style properties during the style resolution process
+  '''Processes style properties during the style resolution process. Processors hold no state, and can therefore be
+  used by multiple threads concurrently.
   
   Class variables:
 
@@ -912,26 +1293,28 @@ class Extent(StyleProcessor):
     @classmethod
     def compute(cls, parent: model.ContentElement, element: model.ContentElement):
 
+      ref_lengths = _get_reference_lengths(element.get_doc())
+
       style_value: styles.ExtentType = element.get_style(cls.style_prop)
 
       # height
 
       height = _compute_length(
         style_value.height,
-        _make_rh_length(100),
+        _ROOT_HEIGHT,
         element.get_style(styles.StyleProperties.FontSize),
-        _make_rh_length(100 / element.get_doc().get_cell_resolution().rows),
-        _make_rh_length(100 / element.get_doc().get_px_resolution().height)
+        ref_lengths.c_h,
+        ref_lengths.px_h
       )
 
       # width
 
       width = _compute_length(
         style_value.width,
-        _make_rw_length(100),
+        _ROOT_WIDTH,
         element.get_style(styles.StyleProperties.FontSize),
-        _make_rw_length(100 / element.get_doc().get_cell_resolution().columns),
-        _make_rw_length(100 / element.get_doc().get_px_resolution().width)
+        ref_lengths.c_w,
+        ref_lengths.px_w
       )
 
       element.set_style(
@@ -974,11 +1357,13 @@ def inherit(cls, parent: model.ContentElement, element: model.ContentElement):
     @classmethod
     def compute(cls, parent: model.ContentElement, element: model.ContentElement):
 
+      ref_lengths = _get_reference_lengths(element.get_doc())
+
       style_value = element.get_style(cls.style_prop)
       parent_value = parent.get_style(cls.style_prop) if parent is not None else None
 
       pct_ref = parent_value if parent_value is not None \
-         else _make_rh_length(100/element.get_doc().get_cell_resolution().rows)
+         else ref_lengths.c_h
 
       element.set_style(
         cls.style_prop,
@@ -986,8 +1371,8 @@ def compute(cls, parent: model.ContentElement, element: model.ContentElement):
           style_value,
           pct_ref,
           pct_ref,
-          _make_rh_length(100 / element.get_doc().get_cell_resolution().rows),
-          _make_rh_length(100 / element.get_doc().get_px_resolution().height)
+          ref_lengths.c_h,
+          ref_lengths.px_h
         )
       )      
 
@@ -1005,6 +1390,8 @@ class LineHeight(StyleProcessor):
 
     @classmethod
     def compute(cls, parent: model.ContentElement, element: model.ContentElement):
+      ref_lengths = _get_reference_lengths(element.get_doc())
+
       value = element.get_style(cls.style_prop)
 
       if value is styles.SpecialValues.normal:
@@ -1016,8 +1403,8 @@ def compute(cls, parent: model.ContentElement, element: model.ContentElement):
           value,
           element.get_style(styles.StyleProperties.FontSize),
           element.get_style(styles.StyleProperties.FontSize),
-          _make_rh_length(100 / element.get_doc().get_cell_resolution().rows),
-          _make_rh_length(100 / element.get_doc().get_px_resolution().height)
+          ref_lengths.c_h,
+          ref_lengths.px_h
         )
 
       element.set_style(cls.style_prop, computed_value)
@@ -1027,14 +1414,16 @@ class LinePadding(StyleProcessor):
 
     @classmethod
     def compute(cls, parent: model.ContentElement, element: model.ContentElement):
+      ref_lengths = _get_reference_lengths(element.get_doc())
+
       element.set_style(
         cls.style_prop,
         _compute_length(
           element.get_style(cls.style_prop),
           element.get_style(styles.StyleProperties.FontSize),
           element.get_style(styles.StyleProperties.FontSize),
-          _make_rh_length(100 / element.get_doc().get_cell_resolution().rows),
-          _make_rh_length(100 / element.get_doc().get_px_resolution().height)
+          ref_lengths.c_h,
+          ref_lengths.px_h
         )
       )
 
@@ -1053,26 +1442,28 @@ class Origin(StyleProcessor):
     @classmethod
     def compute(cls, parent: model.ContentElement, element: model.ContentElement):
 
+      ref_lengths = _get_reference_lengths(element.get_doc())
+
       style_value: styles.CoordinateType = element.get_style(cls.style_prop)
 
       # height
 
       y = _compute_length(
         style_value.y,
-        _make_rh_length(100),
+        _ROOT_HEIGHT,
         None,
-        _make_rh_length(100 / element.get_doc().get_cell_resolution().rows),
-        _make_rh_length(100 / element.get_doc().get_px_resolution().height)
+        ref_lengths.c_h,
+        ref_lengths.px_h
       )
 
       # width
 
       x = _compute_length(
         style_value.x,
-        _make_rw_length(100),
+        _ROOT_WIDTH,
         None,
-        _make_rw_length(100 / element.get_doc().get_cell_resolution().columns),
-        _make_rw_length(100 / element.get_doc().get_px_resolution().width)
+        ref_lengths.c_w,
+        ref_lengths.px_w
       )
 
       element.set_style(
@@ -1092,6 +1483,8 @@ class Padding(StyleProcessor):
     @classmethod
     def compute(cls, parent: model.ContentElement, element: model.ContentElement):
 
+      ref_lengths = _get_reference_lengths(element.get_doc())
+
       padding_value: styles.PaddingType = element.get_style(cls.style_prop)
 
       wm: styles.WritingModeType = element.get_style(styles.StyleProperties.WritingMode)
@@ -1100,10 +1493,10 @@ def compute(cls, parent: model.ContentElement, element: model.ContentElement):
 
       is_vertical = wm in (styles.WritingModeType.tblr, styles.WritingModeType.tbrl)
 
-      c_h = _make_rh_length(100 / element.get_doc().get_cell_resolution().rows)
-      px_h = _make_rh_length(100 / element.get_doc().get_px_resolution().height)
-      c_w = _make_rw_length(100 / element.get_doc().get_cell_resolution().columns)
-      px_w = _make_rw_length(100 / element.get_doc().get_px_resolution().width)
+      c_h = ref_lengths.c_h
+      px_h = ref_lengths.px_h
+      c_w = ref_lengths.c_w
+      px_w = ref_lengths.px_w
 
       c_before = _compute_length(
         padding_value.before,
@@ -1148,6 +1541,8 @@ class Position(StyleProcessor):
     @classmethod
     def compute(cls, parent: model.ContentElement, element: model.ContentElement):
 
+      ref_lengths = _get_reference_lengths(element.get_doc())
+
       position : styles.PositionType = element.get_style(styles.StyleProperties.Position)
 
       if position is None:
@@ -1175,8 +1570,8 @@ def compute(cls, parent: model.ContentElement, element: model.ContentElement):
         position.v_offset,
         _make_rh_length(100 - extent.height.value),
         None,
-        _make_rh_length(100 / element.get_doc().get_cell_resolution().rows),
-        _make_rh_length(100 / element.get_doc().get_px_resolution().height)
+        ref_lengths.c_h,
+        ref_lengths.px_h
       )
       
       if position.v_edge is styles.PositionType.VEdge.bottom:
@@ -1189,8 +1584,8 @@ def compute(cls, parent: model.ContentElement, element: model.ContentElement):
         position.h_offset,
         _make_rw_length(100 - extent.width.value),
         None,
-        _make_rw_length(100 / element.get_doc().get_cell_resolution().columns),
-        _make_rw_length(100 / element.get_doc().get_px_resolution().width)
+        ref_lengths.c_w,
+        ref_lengths.px_w
       )
 
       if position.h_edge is styles.PositionType.HEdge.right:
@@ -1228,6 +1623,8 @@ class RubyReserve(StyleProcessor):
 
     @classmethod
     def compute(cls, parent: model.ContentElement, element: model.ContentElement):
+      ref_lengths = _get_reference_lengths(element.get_doc())
+
       value: typing.Union[styles.SpecialValues.none, styles.RubyReserveType] = element.get_style(cls.style_prop)
 
       if value is styles.SpecialValues.none:
@@ -1241,8 +1638,8 @@ def compute(cls, parent: model.ContentElement, element: model.ContentElement):
             value.length,
             element.get_style(styles.StyleProperties.FontSize),
             element.get_style(styles.StyleProperties.FontSize),
-            _make_rh_length(100 / element.get_doc().get_cell_resolution().rows),
-            _make_rh_length(100 / element.get_doc().get_px_resolution().height)
+            ref_lengths.c_h,
+            ref_lengths.px_h
           )
         )
 
@@ -1337,6 +1734,8 @@ class TextOutline(StyleProcessor):
 
     @classmethod
     def compute(cls, parent: model.ContentElement, element: model.ContentElement):
+      ref_lengths = _get_reference_lengths(element.get_doc())
+
       value: typing.Union[styles.SpecialValues.none, styles.TextOutlineType] = element.get_style(cls.style_prop)
 
       if value is styles.SpecialValues.none:
@@ -1351,8 +1750,8 @@ def compute(cls, parent: model.ContentElement, element: model.ContentElement):
             value.thickness,
             element.get_style(styles.StyleProperties.FontSize),
             element.get_style(styles.StyleProperties.FontSize),
-            _make_rh_length(100 / element.get_doc().get_cell_resolution().rows),
-            _make_rh_length(100 / element.get_doc().get_px_resolution().height)
+            ref_lengths.c_h,
+            ref_lengths.px_h
           )
         )
         
@@ -1363,6 +1762,8 @@ class TextShadow(StyleProcessor):
 
     @classmethod
     def compute(cls, parent: model.ContentElement, element: model.ContentElement):
+      ref_lengths = _get_reference_lengths(element.get_doc())
+
       value: typing.Union[styles.SpecialValues.none, styles.TextShadowType] = element.get_style(cls.style_prop)
 
       if value is styles.SpecialValues.none:
@@ -1381,22 +1782,22 @@ def compute(cls, parent: model.ContentElement, element: model.ContentElement):
                 shadow.x_offset,
                 element.get_style(styles.StyleProperties.FontSize),
                 element.get_style(styles.StyleProperties.FontSize),
-                _make_rh_length(100 / element.get_doc().get_cell_resolution().rows),
-                _make_rh_length(100 / element.get_doc().get_px_resolution().height)
+                ref_lengths.c_h,
+                ref_lengths.px_h
               ),
               y_offset=_compute_length(
                 shadow.y_offset,
                 element.get_style(styles.StyleProperties.FontSize),
                 element.get_style(styles.StyleProperties.FontSize),
-                _make_rh_length(100 / element.get_doc().get_cell_resolution().rows),
-                _make_rh_length(100 / element.get_doc().get_px_resolution().height)
+                ref_lengths.c_h,
+                ref_lengths.px_h
               ),
               blur_radius=None if shadow.blur_radius is None else _compute_length(
                 shadow.blur_radius,
                 element.get_style(styles.StyleProperties.FontSize),
                 element.get_style(styles.StyleProperties.FontSize),
-                _make_rh_length(100 / element.get_doc().get_cell_resolution().rows),
-                _make_rh_length(100 / element.get_doc().get_px_resolution().height)
+                ref_lengths.c_h,
+                ref_lengths.px_h
               )
             )
           )
@@ -1424,10 +1825,94 @@ class WritingMode(StyleProcessor):
 
 # pylint: enable=missing-class-docstring
 
+def _snap_offsets(
+  sig_times: typing.Iterable[Fraction],
+  time_grid: TimeGrid
+  ) -> typing.List[typing.Tuple[Fraction, Fraction]]:
+  '''Returns a list of duples, each consisting of a grid point and the latest of the significant times `sig_times`
+  that are snapped onto it, in increasing order'''
+  offsets = []
+
+  for offset in sig_times:
+    grid_offset = time_grid.snap(offset)
+
+    if len(offsets) > 0 and offsets[-1][0] == grid_offset:
+      offsets[-1] = (grid_offset, offset)
+    else:
+      offsets.append((grid_offset, offset))
+
+  return offsets
+
+def _window_offsets(
+  offsets: typing.Sequence[typing.Tuple[Fraction, Fraction]],
+  begin: typing.Optional[Fraction],
+  end: typing.Optional[Fraction]
+  ) -> typing.List[typing.Tuple[Fraction, Fraction]]:
+  '''Returns the duples of `offsets` that fall within the window `[begin, end)`, where the first duple is
+  moved to `begin`'''
+  windowed_offsets = []
+
+  for grid_offset, offset in offsets:
+    if end is not None and grid_offset >= end:
+      break
+
+    if begin is not None and grid_offset <= begin:
+      # the document does not change between the significant time and the begin of the window
+      windowed_offsets = [(begin, offset)]
+    else:
+      windowed_offsets.append((grid_offset, offset))
+
+  if begin is not None and (len(windowed_offsets) == 0 or windowed_offsets[0][0] != begin):
+    windowed_offsets.insert(0, (begin, begin))
+
+  return windowed_offsets
+
 def _generate_isd(args):
   doc, offset, sig_times = args
   return ISD.from_model(doc, offset, sig_times)
 
+def _count_isd_elements(isd: ISD) -> int:
+  return sum(sum(1 for _ in region.dfs_iterator()) for region in isd.iter_regions())
+
+def _default_worker_threads() -> int:
+  is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+
+  if is_gil_enabled is None or is_gil_enabled():
+    # threads would only add overhead
+    return 1
+
+  return os.cpu_count() or 1
+
+def _iter_isds_threaded(
+  doc: model.ContentDocument,
+  offsets: typing.Sequence[Fraction],
+  sig_times: SignificantTimes,
+  worker_threads: int
+  ) -> typing.Iterator[ISD]:
+  '''Returns the ISDs of `doc` at `offsets`, in order, as computed by a pool of `worker_threads` threads'''
+
+  pending = collections.deque()
+
+  max_pending = 2 * worker_threads
+
+  executor = concurrent.futures.ThreadPoolExecutor(max_workers=worker_threads, thread_name_prefix="ttconv-isd")
+
+  try:
+    next_offset = 0
+
+    while next_offset < len(offsets) or pending:
+
+      while next_offset < len(offsets) and len(pending) < max_pending:
+        pending.append(executor.submit(ISD.from_model, doc, offsets[next_offset], sig_times))
+        next_offset += 1
+
+      yield pending.popleft().result()
+
+  finally:
+    for future in pending:
+      future.cancel()
+    executor.shutdown()
+
 
 def _clone_doc_with_one_region(doc: model.ContentDocument, region_id: str):
 
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Resource limits
+
+Some documents, e.g. with many overlapping regions or animation steps, result in a large number of ISDs or in very
+large ISDs. `ResourceLimits` caps the resources used by a conversion, and is enforced as early as possible:
+
+* `max_elements` by the readers, before or as soon as the document is read;
+* `max_significant_times` by `ISD.significant_times()`, before any ISD is computed;
+* `max_isd_elements` by `ISD.iter_isd_sequence()` as each ISD is computed; and
+* `max_output_size` by the writers as the output document is written.
+
+`ResourceLimitExceededError` is raised when a limit is exceeded. `ISD.estimate_sequence()` can also be used to
+estimate the cost of ISD generation before committing to it.
+'''
+
+from __future__ import annotations
+
+import typing
+from dataclasses import dataclass, field
+
+from ttconv.config import ModuleConfiguration
+
+class ResourceLimitExceededError(Exception):
+  '''Raised when a conversion exceeds one of its resource limits'''
+
+  def __init__(self, limit_name: str, limit: int, value: typing.Optional[int] = None):
+    if value is None:
+      msg = f"Resource limit {limit_name} ({limit}) exceeded"
+    else:
+      msg = f"Resource limit {limit_name} ({limit}) exceeded: {value}"
+
+    super().__init__(msg)
+
+    self.limit_name = limit_name
+    self.limit = limit
+    self.value = value
+
+def _decode_limit(value: typing.Optional[int]) -> typing.Optional[int]:
+  if value is None:
+    return None
+
+  if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+    raise ValueError(f"Invalid resource limit '{value}'. Expect a non-negative integer.")
+
+  return value
+
+@dataclass
+class ResourceLimits(ModuleConfiguration):
+  '''Resource limits of a conversion, where `None` means no limit'''
+
+  # maximum number of elements in the input document, including regions
+  max_elements: typing.Optional[int] = field(default=None, metadata={"decoder": _decode_limit})
+
+  # maximum number of significant times in the input document, i.e. of ISDs
+  max_significant_times: typing.Optional[int] = field(default=None, metadata={"decoder": _decode_limit})
+
+  # maximum number of elements in any single ISD, including regions
+  max_isd_elements: typing.Optional[int] = field(default=None, metadata={"decoder": _decode_limit})
+
+  # maximum size of the output document, in characters for text formats and bytes otherwise
+  max_output_size: typing.Optional[int] = field(default=None, metadata={"decoder": _decode_limit})
+
+  @classmethod
+  def name(cls):
+    return "limits"
+
+  @staticmethod
+  def check(limit_name: str, limit: typing.Optional[int], value: int):
+    '''Raises `ResourceLimitExceededError` if `value` exceeds `limit`, unless `limit` is `None`'''
+    if limit is not None and value > limit:
+      raise ResourceLimitExceededError(limit_name, limit, value)
+
+  def check_document(self, doc) -> None:
+    '''Raises `ResourceLimitExceededError` if the `ContentDocument` `doc` exceeds `max_elements`'''
+
+    if self.max_elements is None:
+      return
+
+    count = sum(1 for _ in doc.iter_regions())
+
+    body = doc.get_body()
+
+    if body is not None:
+      for _ in body.dfs_iterator():
+        count += 1
+        if count > self.max_elements:
+          break
+
+    ResourceLimits.check("max_elements", self.max_elements, count)
+
+class LimitedTextSink:
+  '''Text sink that forwards writes to `sink` and raises `ResourceLimitExceededError` before the total number of
+  characters written exceeds `max_size`'''
+
+  def __init__(self, sink: typing.TextIO, max_size: int):
+    self._sink = sink
+    self._max_size = max_size
+    self._size = 0
+
+  def write(self, s: str) -> int:
+    self._size += len(s)
+
+    if self._size > self._max_size:
+      raise ResourceLimitExceededError("max_output_size", self._max_size)
+
+    return self._sink.write(s)
+
+  def flush(self):
+    self._sink.flush()
+
+def limit_sink(sink: typing.TextIO, limits: typing.Optional[ResourceLimits]) -> typing.TextIO:
+  '''Returns `sink`, wrapped in a `LimitedTextSink` if `limits` specifies a maximum output size'''
+
+  if limits is None or limits.max_output_size is None:
+    return sink
+
+  return LimitedTextSink(sink, limits.max_output_size)
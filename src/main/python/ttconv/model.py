@@ -91,9 +91,10 @@ def __init__(self, doc=None):
     self._previous_sibling = None
     self._next_sibling = None
 
-    # styles
+    # styles, which can be shared with other elements until either element modifies them (see `copy_to()`)
 
     self._styles = {}
+    self._is_styles_shared = False
 
     # animation
 
@@ -124,9 +125,8 @@ def copy_to(self, dest: ContentElement):
     dest.set_id(self.get_id())
     dest.set_lang(self.get_lang())
     dest.set_space(self.get_space())
-    
-    for style_prop in self.iter_styles():
-      dest.set_style(style_prop, self.get_style(style_prop))
+
+    self._copy_styles_to(dest)
 
     for anim_step in self.iter_animation_steps():
       dest.add_animation_step(anim_step)
@@ -341,16 +341,42 @@ def set_style(self, style_prop: typing.Type[StyleProperty], value: typing.Any):
     if style_prop not in StyleProperties.ALL:
       raise ValueError("Invalid style property")
 
-    if value is None:
+    if value is not None and not style_prop.validate(value):
+      raise ValueError(f"Invalid value {value} for style property {style_prop}")
 
-      self._styles.pop(style_prop, None)
+    self._set_trusted_style(style_prop, value)
+
+  def _set_trusted_style(self, style_prop: typing.Type[StyleProperty], value: typing.Any):
+    '''Sets the value for the style property `style_prop` to `value`, or removes it if `value` is `None`, without
+    validation. Reserved to values that are known to be valid for `style_prop`, e.g. values copied from another
+    element or document.'''
+    if self._is_styles_shared:
+      self._styles = dict(self._styles)
+      self._is_styles_shared = False
 
+    if value is None:
+      self._styles.pop(style_prop, None)
     else:
+      self._styles[style_prop] = value
 
-      if not style_prop.validate(value):
-        raise ValueError(f"Invalid value {value} for style property {style_prop}")
+  def _copy_styles_to(self, dest: ContentElement):
+    '''Copies the style properties of the element to `dest`. If `dest` has no style properties, the two elements
+    share the same style properties until either element modifies them.'''
 
-      self._styles[style_prop] = value
+    # pylint: disable=W0212
+
+    if dest is self:
+      return
+
+    if len(dest._styles) == 0:
+      dest._styles = self._styles
+      dest._is_styles_shared = True
+      self._is_styles_shared = True
+    else:
+      for style_prop, value in self._styles.items():
+        dest._set_trusted_style(style_prop, value)
+
+    # pylint: enable=W0212
 
   _applicableStyles: typing.Set[StyleProperty] = frozenset()
 
@@ -565,9 +591,8 @@ def copy_to(self, dest: Br):
     dest.set_id(self.get_id())
     dest.set_lang(self.get_lang())
     dest.set_space(self.get_space())
-    
-    for style_prop in self.iter_styles():
-      dest.set_style(style_prop, self.get_style(style_prop))
+
+    self._copy_styles_to(dest)
 
     for anim_step in self.iter_animation_steps():
       dest.add_animation_step(anim_step)
@@ -850,9 +875,8 @@ def copy_to(self, dest: Region):
 
     dest.set_begin(self.get_begin())
     dest.set_end(self.get_end())
-    
-    for style_prop in self.iter_styles():
-      dest.set_style(style_prop, self.get_style(style_prop))
+
+    self._copy_styles_to(dest)
 
     for anim_step in self.iter_animation_steps():
       dest.add_animation_step(anim_step)
@@ -30,7 +30,7 @@
 from typing import Optional
 
 from ttconv.scc.codes import SccCode
-from ttconv.style_properties import ColorType, NamedColors, TextDecorationType
+from ttconv.style_properties import ColorType, NamedColors, TextDecorationType, UNDERLINE_TEXT_DECORATION
 
 
 class SccAttributeCode(SccCode):
@@ -75,7 +75,7 @@ def is_background(self) -> bool:
   def get_text_decoration(self) -> Optional[TextDecorationType]:
     """Returns the corresponding text decoration"""
     if self is SccAttributeCode.FAU:
-      return TextDecorationType(underline=True)
+      return UNDERLINE_TEXT_DECORATION
     return None
 
   @staticmethod
@@ -30,7 +30,7 @@
 import typing
 
 from ttconv.scc.codes import SccCode, SCC_COLOR_MAPPING
-from ttconv.style_properties import FontStyleType, TextDecorationType, ColorType
+from ttconv.style_properties import FontStyleType, TextDecorationType, ColorType, UNDERLINE_TEXT_DECORATION
 
 
 class SccMidRowCode(SccCode):
@@ -76,7 +76,7 @@ def get_text_decoration(self) -> typing.Optional[TextDecorationType]:
     style_bits = self._channel_1 & 0x000F
 
     if style_bits % 2 == 1:
-      return TextDecorationType(underline=True)
+      return UNDERLINE_TEXT_DECORATION
 
     return None
 
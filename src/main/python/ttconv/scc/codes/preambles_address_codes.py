@@ -31,7 +31,7 @@
 
 from ttconv.scc.codes import SCC_COLOR_MAPPING, SccChannel
 from ttconv.style_properties import NamedColors, TextDecorationType, \
-  FontStyleType, ColorType
+  FontStyleType, ColorType, UNDERLINE_TEXT_DECORATION
 
 _ROW_MAPPING = {
   (0x01, 0x40): 1,
@@ -154,7 +154,7 @@ def get_font_style(self) -> Optional[FontStyleType]:
 
   def get_text_decoration(self) -> Optional[TextDecorationType]:
     """Returns PAC text decoration"""
-    return TextDecorationType(underline=True) if self._is_underline else None
+    return UNDERLINE_TEXT_DECORATION if self._is_underline else None
 
   def get_channel(self) -> SccChannel:
     """Returns PAC channel"""
@@ -29,9 +29,9 @@
 
 import copy
 import logging
-from typing import Optional, Type, Tuple
+from typing import Callable, Optional, Type, Tuple
 
-from ttconv.model import Div
+from ttconv.model import Div, P
 from ttconv.scc.caption_paragraph import SccCaptionParagraph
 from ttconv.scc.caption_style import SccCaptionStyle
 from ttconv.scc.codes import SccChannel
@@ -52,10 +52,14 @@
 class SccContext:
   """SCC context for reader"""
 
-  def __init__(self, safe_area_x_offset: int, safe_area_y_offset: int, config: Optional[SccReaderConfiguration] = None):
+  def __init__(self, safe_area_x_offset: int, safe_area_y_offset: int, config: Optional[SccReaderConfiguration] = None,
+               paragraph_callback: Callable[[P], None] = lambda _: None):
     # Caption paragraphs container
     self.div: Optional[Div] = None
 
+    # Called with each caption paragraph once it is pushed into the data model
+    self.paragraph_callback = paragraph_callback
+
     # Caption paragraphs counter
     self.count: int = 0
 
@@ -159,7 +163,9 @@ def push_active_caption_to_model(self, time_code: SmpteTimeCode, clear_active_ca
         self.active_caption = None
 
       if not previous_caption.is_empty():
-        self.div.push_child(previous_caption.to_paragraph(self.div.get_doc()))
+        paragraph = previous_caption.to_paragraph(self.div.get_doc())
+        self.div.push_child(paragraph)
+        self.paragraph_callback(paragraph)
 
   def backspace(self, time_code: SmpteTimeCode):
     """Move the cursors in a column to the left"""
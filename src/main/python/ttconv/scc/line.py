@@ -27,9 +27,13 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import re
-from typing import List, Optional
+import sys
+from array import array
+from typing import Iterator, List, Optional
 
 from ttconv.scc.caption_style import SccCaptionStyle
 from ttconv.scc.codes import SccChannel
@@ -41,7 +45,7 @@
 from ttconv.scc.codes.special_characters import SccSpecialCharacter
 from ttconv.scc.context import SccContext
 from ttconv.scc.disassembly import get_scc_word_disassembly
-from ttconv.scc.word import SccWord
+from ttconv.scc.word import SccWord, PARITY_BIT_MASK
 from ttconv.time_code import SmpteTimeCode, FPS_29_97
 
 LOGGER = logging.getLogger(__name__)
@@ -56,6 +60,11 @@
                               '(?P<df_f>[0-9]{2})'])
 SCC_LINE_PATTERN = '((' + NDF_PATTERN + ')|(' + DF_PATTERN + '))\t.*'
 
+_SCC_LINE_REGEX = re.compile(SCC_LINE_PATTERN)
+
+# bytes.translate() table that removes the odd parity bit of each byte
+_PARITY_STRIP_TABLE = bytes(byte & PARITY_BIT_MASK for byte in range(256))
+
 
 class SccLine:
   """SCC line definition"""
@@ -70,8 +79,7 @@ def from_str(line: str) -> Optional[SccLine]:
     if not line:
       return None
 
-    regex = re.compile(SCC_LINE_PATTERN)
-    match = regex.match(line)
+    match = _SCC_LINE_REGEX.match(line)
 
     if match is None:
       return None
@@ -197,3 +205,84 @@ def process(self, context: SccContext) -> SmpteTimeCode:
     LOGGER.debug(debug)
 
     return self.time_code
+
+
+@functools.lru_cache(maxsize=None)
+def _get_scc_word(value: int) -> SccWord:
+  """Returns the SCC word of the specified parity-stripped value. SCC words are not modified once created,
+  and can therefore be shared between lines."""
+  return SccWord(value >> 8, value & 0xFF)
+
+
+class SccLineBuffer:
+  """SCC lines of a document, parsed in bulk. The parity-stripped words of all the lines are packed in a single
+  array, and the words of the line at index `i` are `words[offsets[i]:offsets[i + 1]]`."""
+
+  def __init__(self, time_codes: List[SmpteTimeCode], offsets: array, words: array):
+    self.time_codes = time_codes
+    self.offsets = offsets
+    self.words = words
+
+  @staticmethod
+  def from_str(scc_content: str) -> SccLineBuffer:
+    """Parses all the SCC lines of the specified document, ignoring lines that are not SCC caption lines"""
+    time_codes: List[SmpteTimeCode] = []
+    offsets = array('L', [0])
+    hex_words: List[str] = []
+
+    for line in scc_content.splitlines():
+      match = _SCC_LINE_REGEX.match(line)
+
+      if match is None:
+        continue
+
+      time_codes.append(SmpteTimeCode.parse(match.group(1), FPS_29_97))
+
+      for hex_word in line.split('\t')[1].split(' '):
+        if not hex_word:
+          continue
+        if len(hex_word) != 4:
+          raise ValueError(f"Expected a 2-bytes hexadecimal word, instead got {hex_word!r} in line: {line}")
+        hex_words.append(hex_word)
+
+      offsets.append(len(hex_words))
+
+    try:
+      data = bytes.fromhex(''.join(hex_words))
+    except ValueError:
+      raise SccLineBuffer._invalid_word_error(scc_content) from None
+
+    words = array('H')
+    words.frombytes(data.translate(_PARITY_STRIP_TABLE))
+
+    # SCC words are big-endian
+    if sys.byteorder == 'little':
+      words.byteswap()
+
+    return SccLineBuffer(time_codes, offsets, words)
+
+  @staticmethod
+  def _invalid_word_error(scc_content: str) -> ValueError:
+    """Returns an error that reports the first invalid word of the specified document. Words are converted in bulk,
+    and therefore only checked one at a time once the conversion has failed."""
+    for line in scc_content.splitlines():
+      if _SCC_LINE_REGEX.match(line) is None:
+        continue
+
+      for hex_word in line.split('\t')[1].split(' '):
+        if not hex_word:
+          continue
+        try:
+          bytes.fromhex(hex_word)
+        except ValueError:
+          return ValueError(f"Expected a 2-bytes hexadecimal word, instead got {hex_word!r} in line: {line}")
+
+    return ValueError("Invalid hexadecimal words")
+
+  def __len__(self) -> int:
+    return len(self.time_codes)
+
+  def __iter__(self) -> Iterator[SccLine]:
+    for (index, time_code) in enumerate(self.time_codes):
+      scc_words = [_get_scc_word(value) for value in self.words[self.offsets[index]:self.offsets[index + 1]]]
+      yield SccLine(copy.copy(time_code), scc_words)
@@ -27,16 +27,21 @@
 
 from __future__ import annotations
 
+import copy
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
-from ttconv.model import ContentDocument, Body, Div, CellResolutionType, ActiveAreaType
+from ttconv.model import ContentDocument, Body, Div, CellResolutionType, ActiveAreaType, P
 from ttconv.scc.caption_paragraph import SCC_SAFE_AREA_CELL_RESOLUTION_ROWS, \
   SCC_SAFE_AREA_CELL_RESOLUTION_COLUMNS, SCC_ROOT_CELL_RESOLUTION_ROWS, SCC_ROOT_CELL_RESOLUTION_COLUMNS
+from ttconv.limits import ResourceLimits
 from ttconv.scc.config import SccReaderConfiguration
 from ttconv.scc.context import SccContext
-from ttconv.scc.line import SccLine
+from ttconv.scc.line import SccLine, SccLineBuffer
+from ttconv.scc.word import SccWord
 from ttconv.style_properties import StyleProperties, LengthType, GenericFontFamilyType
+from ttconv.time_code import SmpteTimeCode
+from ttconv.utils import FileOrPath, open_text
 
 LOGGER = logging.getLogger(__name__)
 
@@ -45,78 +50,129 @@
 # SCC reader
 #
 
-def to_model(scc_content: str, config: Optional[SccReaderConfiguration] = None, progress_callback=lambda _: None):
-  """Converts a SCC document to the data model"""
+class SccIncrementalReader:
+  """Incremental SCC reader, which converts SCC lines or caption data to the data model as they are received,
+  e.g. from a live source.
 
-  document = ContentDocument()
+  `paragraph_callback` is called with each caption paragraph (`model.P`) as soon as its end time is known. The paragraph
+  is also added to the document returned by `get_document()`, unless the callback detaches it using `P.remove()`, which
+  bounds the memory used when processing unbounded sources.
+  """
 
-  # Safe area must be a 32x15 grid, that represents 80% of the root area
-  root_cell_resolution = CellResolutionType(rows=SCC_ROOT_CELL_RESOLUTION_ROWS, columns=SCC_ROOT_CELL_RESOLUTION_COLUMNS)
-  document.set_cell_resolution(root_cell_resolution)
+  def __init__(self, config: Optional[SccReaderConfiguration] = None,
+               paragraph_callback: Callable[[P], None] = lambda _: None):
+    self._document = ContentDocument()
 
-  safe_area_x_offset = int((root_cell_resolution.columns - SCC_SAFE_AREA_CELL_RESOLUTION_COLUMNS) / 2)
-  safe_area_y_offset = int((root_cell_resolution.rows - SCC_SAFE_AREA_CELL_RESOLUTION_ROWS) / 2)
+    # Safe area must be a 32x15 grid, that represents 80% of the root area
+    root_cell_resolution = CellResolutionType(rows=SCC_ROOT_CELL_RESOLUTION_ROWS, columns=SCC_ROOT_CELL_RESOLUTION_COLUMNS)
+    self._document.set_cell_resolution(root_cell_resolution)
 
-  context = SccContext(safe_area_x_offset, safe_area_y_offset, config)
+    safe_area_x_offset = int((root_cell_resolution.columns - SCC_SAFE_AREA_CELL_RESOLUTION_COLUMNS) / 2)
+    safe_area_y_offset = int((root_cell_resolution.rows - SCC_SAFE_AREA_CELL_RESOLUTION_ROWS) / 2)
 
-  # The active area is equivalent to the safe area
-  active_area = ActiveAreaType(
-    left_offset=context.safe_area_x_offset / root_cell_resolution.columns,
-    top_offset=context.safe_area_y_offset / root_cell_resolution.rows,
-    width=(root_cell_resolution.columns - (context.safe_area_x_offset * 2)) / root_cell_resolution.columns,
-    height=(root_cell_resolution.rows - (context.safe_area_y_offset * 2)) / root_cell_resolution.rows,
-  )
-  document.set_active_area(active_area)
+    self._context = SccContext(safe_area_x_offset, safe_area_y_offset, config, paragraph_callback)
 
-  body = Body()
-  body.set_doc(document)
-  document.set_body(body)
+    # The active area is equivalent to the safe area
+    active_area = ActiveAreaType(
+      left_offset=self._context.safe_area_x_offset / root_cell_resolution.columns,
+      top_offset=self._context.safe_area_y_offset / root_cell_resolution.rows,
+      width=(root_cell_resolution.columns - (self._context.safe_area_x_offset * 2)) / root_cell_resolution.columns,
+      height=(root_cell_resolution.rows - (self._context.safe_area_y_offset * 2)) / root_cell_resolution.rows,
+    )
+    self._document.set_active_area(active_area)
 
-  # the default value of LineHeight ("normal") typically translates to 125% of the font size, which causes regions to overflow.
-  body.set_style(StyleProperties.LineHeight, LengthType(value=100, units=LengthType.Units.pct))
+    body = Body()
+    body.set_doc(self._document)
+    self._document.set_body(body)
 
-  # use a more readable font than the default Courier
-  body.set_style(StyleProperties.FontFamily, ("Consolas", "Monaco", GenericFontFamilyType.monospace))
+    # the default value of LineHeight ("normal") typically translates to 125% of the font size, which causes regions to overflow.
+    body.set_style(StyleProperties.LineHeight, LengthType(value=100, units=LengthType.Units.pct))
 
-  # add line padding
-  body.set_style(StyleProperties.LinePadding, LengthType(value=0.25, units=LengthType.Units.c))
+    # use a more readable font than the default Courier
+    body.set_style(StyleProperties.FontFamily, ("Consolas", "Monaco", GenericFontFamilyType.monospace))
 
-  context.div = Div()
-  context.div.set_doc(document)
-  body.push_child(context.div)
+    # add line padding
+    body.set_style(StyleProperties.LinePadding, LengthType(value=0.25, units=LengthType.Units.c))
 
-  lines = scc_content.splitlines()
-  nb_lines = len(lines)
+    self._context.div = Div()
+    self._context.div.set_doc(self._document)
+    body.push_child(self._context.div)
+
+  def get_document(self) -> ContentDocument:
+    """Returns the document being built"""
+    return self._document
 
-  for (index, line) in enumerate(lines):
+  def push_line(self, line: str):
+    """Processes a SCC line, e.g. `00:00:00;22\t9425 9425 94ad 94ad`. Lines that are not
+    SCC caption lines (header, blank lines) are ignored."""
     LOGGER.debug(line)
     scc_line = SccLine.from_str(line)
 
-    progress_callback((index + 1) / nb_lines)
+    if scc_line is not None:
+      self.push_scc_line(scc_line)
+
+  def push_bytes(self, time_code: SmpteTimeCode, data: bytes):
+    """Processes caption data, i.e. a sequence of byte pairs (including parity bits), the first of which is
+    received at `time_code`"""
+    if len(data) % 2 != 0:
+      raise ValueError("Caption data must consist of byte pairs")
+
+    scc_words = [SccWord.from_bytes(data[i], data[i + 1]) for i in range(0, len(data), 2)]
 
-    if scc_line is None:
-      continue
+    self.push_scc_line(SccLine(copy.copy(time_code), scc_words))
 
-    scc_line.process(context)
+  def push_scc_line(self, scc_line: SccLine):
+    """Processes a parsed SCC line"""
+    scc_line.process(self._context)
 
-  context.flush()
+  def flush(self) -> ContentDocument:
+    """Ends the processing, pushes the remaining caption into the data model and returns the document"""
+    self._context.flush()
 
-  return document
+    return self._document
+
+
+def to_model(scc_content: str, config: Optional[SccReaderConfiguration] = None, progress_callback=lambda _: None):
+  """Converts a SCC document to the data model"""
+
+  reader = SccIncrementalReader(config)
+
+  lines = SccLineBuffer.from_str(scc_content)
+  nb_lines = len(lines)
+
+  for (index, scc_line) in enumerate(lines):
+    reader.push_scc_line(scc_line)
+
+    progress_callback((index + 1) / nb_lines)
+
+  return reader.flush()
 
 
 def to_disassembly(scc_content: str, show_channels = False) -> str:
   """Dumps an SCC document into the disassembly format"""
   disassembly = ""
-  for line in scc_content.splitlines():
-    LOGGER.debug(line)
-    scc_line = SccLine.from_str(line)
-
-    if scc_line is None:
-      continue
-
+  for scc_line in SccLineBuffer.from_str(scc_content):
     line_to_disassembly = scc_line.to_disassembly(show_channels)
     LOGGER.debug(line_to_disassembly)
 
     disassembly += line_to_disassembly + "\n"
 
   return disassembly
+
+
+def to_model_from_file(
+  file: FileOrPath,
+  config: Optional[SccReaderConfiguration] = None,
+  progress_callback=lambda _: None,
+  limits: Optional[ResourceLimits] = None
+  ):
+  """Converts the SCC document read from `file`, which is a path or a binary file object, to the data model. If
+  specified, `limits.max_elements` is checked against the converted document."""
+
+  with open_text(file, encoding=None) as f:
+    doc = to_model(f.read(), config, progress_callback)
+
+  if doc is not None and limits is not None:
+    limits.check_document(doc)
+
+  return doc
@@ -27,19 +27,22 @@
 
 from __future__ import annotations
 
+import io
 import logging
 from fractions import Fraction
 import re
-from typing import List, Optional, Sequence
+from typing import List, Optional, Sequence, TextIO
 
 import ttconv.model as model
-from ttconv.isd import ISD
+from ttconv.isd import ISD, ISDConfiguration, TimeGrid
+from ttconv.limits import ResourceLimits, limit_sink
 from ttconv.scc.codes.characters import unicode_to_scc
 from ttconv.scc.codes.preambles_address_codes import SccPreambleAddressCode
 from ttconv.scc.config import SccWriterConfiguration
 from ttconv.style_properties import StyleProperties, NamedColors, TextAlignType
 from ttconv.scc.codes.control_codes import SccControlCode
 from ttconv.time_code import FPS_29_97, FPS_30, SmpteTimeCode
+from ttconv.utils import FileOrPath, open_text
 
 LOGGER = logging.getLogger(__name__)
 
@@ -236,15 +239,59 @@ def _octet2hex(octet):
 #
 # scc writer
 #
-def from_model(doc: model.ContentDocument, config: Optional[SccWriterConfiguration] = None, progress_callback=lambda _: None) -> str:
-  """Converts the data model to an SCC document"""
+def from_model(
+  doc: model.ContentDocument,
+  config: Optional[SccWriterConfiguration] = None,
+  progress_callback=lambda _: None,
+  isd_config: Optional[ISDConfiguration] = None,
+  limits: Optional[ResourceLimits] = None
+  ) -> str:
+  """Converts the data model to an SCC document. If specified, `isd_config` restricts the conversion to a window
+  of the document."""
+
+  sink = io.StringIO()
+  from_model_to_stream(doc, sink, config, progress_callback, isd_config, limits)
+  return sink.getvalue()
+
+def from_model_to_stream(
+  doc: model.ContentDocument,
+  sink: TextIO,
+  config: Optional[SccWriterConfiguration] = None,
+  progress_callback=lambda _: None,
+  isd_config: Optional[ISDConfiguration] = None,
+  limits: Optional[ResourceLimits] = None
+  ):
+  """Converts the data model to an SCC document, which is written to `sink` as soon as each line of the document
+  is final. Roll-up detection requires all the captions of the document, which are therefore computed before
+  any line is written. If specified, `isd_config` restricts the conversion to a window of the document and
+  `limits` caps the resources used by the conversion."""
 
   # split progress between ISD construction and SCC writing
   def _isd_progress(progress: float):
     progress_callback(progress / 2)
 
   config : SccWriterConfiguration = config if config is not None else SccWriterConfiguration()
-  isds = ISD.generate_isd_sequence(doc, _isd_progress)
+  isd_config = isd_config if isd_config is not None else ISDConfiguration()
+
+  sink = limit_sink(sink, limits)
+
+  start_offset = 0
+  if config.start_tc is not None:
+    start_tc = SmpteTimeCode.parse(config.start_tc, config.frame_rate.fps)
+    if start_tc.is_drop_frame() != config.frame_rate.df:
+      raise RuntimeError("The drop-frame status of the specified start_timecode does not match the drop-frame status of the specified frame_rate")
+    start_offset = start_tc.to_frames()
+
+  isds = ISD.generate_isd_sequence(
+    doc,
+    _isd_progress,
+    coalesce=True,
+    time_grid=TimeGrid(config.frame_rate.fps, round_down=True),
+    begin=isd_config.begin,
+    end=isd_config.end,
+    worker_threads=isd_config.worker_threads,
+    limits=limits
+  )
   is_rollup = None
   is_last_empty = True
 
@@ -321,10 +368,35 @@ def _isd_progress(progress: float):
     captions.append(caption)
 
   chunks : List[_Chunk] = []
+  written_count = 0
+  is_header_written = False
+
+  def _write_header():
+    # the header is written once the first chunk is known to be valid, so that nothing is written if it is not
+    nonlocal is_header_written
+    if not is_header_written:
+      sink.write("Scenarist_SCC V1.0\n\n")
+      is_header_written = True
+
+  def _write_chunks(count: int):
+    nonlocal written_count
+    for chunk in chunks[:count]:
+      if start_offset + chunk.get_begin() < 0:
+        raise RuntimeError("The SCC stream would start earlier than the specified start timecode")
+      _write_header()
+      if written_count > 0:
+        sink.write("\n\n")
+      written_count += 1
+      sink.write(chunk.to_string(config.frame_rate.fps, config.frame_rate.df, start_offset))
+    del chunks[:count]
+
   for i, caption in enumerate(captions):
     # 25% for SCC writing
     progress_callback(0.75 + (i + 1) / len(captions) / 4)
 
+    # the last two chunks are still needed to place the next chunk, see below
+    _write_chunks(len(chunks) - 2)
+
     if is_rollup is True and not config.force_popon:
       ru_chunk: _Chunk = _Chunk()
 
@@ -409,15 +481,21 @@ def _isd_progress(progress: float):
         edm_chunk.set_begin(int(caption.get_end() * config.frame_rate.fps))
         chunks.append(edm_chunk)
 
-  start_offset = 0
-  if config.start_tc is not None:
-    start_tc = SmpteTimeCode.parse(config.start_tc, config.frame_rate.fps)
-    if start_tc.is_drop_frame() != config.frame_rate.df:
-      raise RuntimeError("The drop-frame status of the specified start_timecode does not match the drop-frame status of the specified frame_rate")
-    start_offset = start_tc.to_frames()
+  _write_chunks(len(chunks))
+
+  # a document without captions consists of the header alone
+  _write_header()
 
-  for chunk in chunks:
-    if start_offset + chunk.get_begin() < 0:
-      raise RuntimeError("The SCC stream would start earlier than the specified start timecode")
+def from_model_to_file(
+  doc: model.ContentDocument,
+  file: FileOrPath,
+  config: Optional[SccWriterConfiguration] = None,
+  progress_callback=lambda _: None,
+  isd_config: Optional[ISDConfiguration] = None,
+  limits: Optional[ResourceLimits] = None
+  ):
+  """Converts the data model to a SCC document, which is written to `file`, a path or a binary file object, as it is
+  generated (see `from_model_to_stream()`)."""
 
-  return "Scenarist_SCC V1.0\n\n" + "\n\n".join(map(lambda e: e.to_string(config.frame_rate.fps, config.frame_rate.df, start_offset), chunks))
+  with open_text(file, "w") as scc_file:
+    from_model_to_stream(doc, scc_file, config, progress_callback, isd_config, limits)
@@ -0,0 +1,692 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Compact binary serialization of the data model
+
+A `model.ContentDocument` is serialized as:
+
+* a header, consisting of a magic number and the format version (`FORMAT_VERSION`)
+* a table of the strings used by the document (ids, languages, text, region references, style property names...)
+* a table of the values used by the document (style values, times, resolutions...), each stored once and in an
+  order such that an entry only refers to preceding entries
+* a flat sequence of integers that describes the document and its elements, in preorder, where strings and values
+  are referred to by their index in the tables above
+
+Values are limited to `None`, `bool`, `int`, `float`, `str`, `Fraction`, tuples, and the enumerations and
+dataclasses defined in `ttconv.style_properties` and `ttconv.model`.
+'''
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import struct
+import sys
+import typing
+from array import array
+from fractions import Fraction
+
+import ttconv.model as model
+import ttconv.style_properties as styles
+from ttconv.style_properties import StyleProperties
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"TTCVDOC\x00"
+
+_HEADER_STRUCT = struct.Struct("<8sH")
+
+_COUNT_STRUCT = struct.Struct("<I")
+
+_NONE = 0
+
+_NO_CONTENT_PROFILES = 0xFFFFFFFF
+
+# element types, identified by their index
+
+_ELEMENT_TYPES = (
+  model.Body,
+  model.Div,
+  model.P,
+  model.Span,
+  model.Br,
+  model.Ruby,
+  model.Rb,
+  model.Rbc,
+  model.Rp,
+  model.Rt,
+  model.Rtc,
+  model.Text,
+  model.Region
+)
+
+_ELEMENT_KINDS = {t: i for i, t in enumerate(_ELEMENT_TYPES)}
+
+_TEXT_KIND = _ELEMENT_KINDS[model.Text]
+
+_REGION_KIND = _ELEMENT_KINDS[model.Region]
+
+# an element record starts with the element kind and flags that signal which of the following fields are present,
+# i.e. `kind | (flags << _FLAGS_SHIFT)`, except for text nodes, which consist of the kind followed by the text
+
+_KIND_MASK = 0x0F
+_FLAGS_SHIFT = 4
+
+_F_CHILDREN = 0x001
+_F_ID = 0x002
+_F_LANG = 0x004
+_F_SPACE_PRESERVE = 0x008
+_F_REGION = 0x010
+_F_BEGIN = 0x020
+_F_END = 0x040
+_F_STYLES = 0x080
+_F_ANIMATION = 0x100
+
+# elements are built from the attributes of a pristine instance of their type, which avoids the per-element cost
+# of the constructor and of the setters
+
+def _element_attributes(element_type: type) -> dict:
+  if element_type is model.Region:
+    return vars(model.Region("_"))
+  return vars(element_type())
+
+_ELEMENT_ATTRIBUTES = tuple(_element_attributes(t) for t in _ELEMENT_TYPES)
+
+_STYLE_PROPERTIES = {prop.__name__: prop for prop in StyleProperties.ALL}
+
+# value tags
+
+_V_FALSE = 0
+_V_TRUE = 1
+_V_INT = 2
+_V_BIG_INT = 3
+_V_FLOAT = 4
+_V_STR = 5
+_V_FRACTION = 6
+_V_TUPLE = 7
+_V_ENUM = 8
+_V_DATACLASS = 9
+
+_TAG_STRUCT = struct.Struct("<B")
+_INT_STRUCT = struct.Struct("<q")
+_FLOAT_STRUCT = struct.Struct("<d")
+_INDEX_STRUCT = struct.Struct("<I")
+_PAIR_STRUCT = struct.Struct("<II")
+
+# types whose equal values are identical, other values being interned by their representation, since equal values can
+# differ, e.g. LengthType(100) and LengthType(100.0), or 0.0 and -0.0
+_EXACT_KEY_TYPES = frozenset((str, int, bool))
+
+_INT_MIN = -(1 << 63)
+_INT_MAX = (1 << 63) - 1
+
+def _collect_value_types() -> typing.Dict[str, type]:
+  value_types = {}
+
+  def _collect(scope):
+    for v in list(vars(scope).values()):
+      if isinstance(v, type) and (issubclass(v, enum.Enum) or dataclasses.is_dataclass(v)):
+        value_types[f"{v.__module__}.{v.__qualname__}"] = v
+        _collect(v)
+
+  for module in (styles, model):
+    _collect(module)
+
+  return value_types
+
+_VALUE_TYPES = _collect_value_types()
+
+#
+# dump
+#
+
+class _Encoder:
+
+  def __init__(self):
+    self.strings: typing.Dict[str, int] = {}
+    self.values: typing.Dict[typing.Tuple[type, typing.Any], int] = {}
+    self.value_data = bytearray()
+    self.ints = array("I")
+
+  def string_index(self, s: typing.Optional[str]) -> int:
+    if s is None:
+      return _NONE
+
+    i = self.strings.get(s)
+
+    if i is None:
+      i = len(self.strings) + 1
+      self.strings[s] = i
+
+    return i
+
+  def value_index(self, value: typing.Any) -> int:
+    if value is None:
+      return _NONE
+
+    value_type = type(value)
+
+    key = (value_type, value) if value_type in _EXACT_KEY_TYPES else (value_type, repr(value))
+
+    i = self.values.get(key)
+
+    if i is None:
+      # entries referenced by the value are written first
+      self.value_data += self._encode_value(value)
+      i = len(self.values) + 1
+      self.values[key] = i
+
+    return i
+
+  def _type_name(self, value: typing.Any) -> int:
+    name = f"{type(value).__module__}.{type(value).__qualname__}"
+
+    if _VALUE_TYPES.get(name) is not type(value):
+      raise ValueError(f"Unsupported value type {type(value)}")
+
+    return self.string_index(name)
+
+  def _encode_value(self, value: typing.Any) -> bytes:
+
+    if isinstance(value, bool):
+      return _TAG_STRUCT.pack(_V_TRUE if value else _V_FALSE)
+
+    if isinstance(value, enum.Enum):
+      return _TAG_STRUCT.pack(_V_ENUM) + _PAIR_STRUCT.pack(self._type_name(value), self.string_index(value.name))
+
+    if isinstance(value, int):
+      if _INT_MIN <= value <= _INT_MAX:
+        return _TAG_STRUCT.pack(_V_INT) + _INT_STRUCT.pack(value)
+      return _TAG_STRUCT.pack(_V_BIG_INT) + _INDEX_STRUCT.pack(self.string_index(str(value)))
+
+    if isinstance(value, float):
+      return _TAG_STRUCT.pack(_V_FLOAT) + _FLOAT_STRUCT.pack(value)
+
+    if isinstance(value, str):
+      return _TAG_STRUCT.pack(_V_STR) + _INDEX_STRUCT.pack(self.string_index(value))
+
+    if isinstance(value, Fraction):
+      return _TAG_STRUCT.pack(_V_FRACTION) + \
+        _PAIR_STRUCT.pack(self.value_index(value.numerator), self.value_index(value.denominator))
+
+    if isinstance(value, tuple):
+      indices = array("I", (self.value_index(e) for e in value))
+      return _TAG_STRUCT.pack(_V_TUPLE) + _INDEX_STRUCT.pack(len(indices)) + _to_le_bytes(indices)
+
+    if dataclasses.is_dataclass(value):
+      type_name = self._type_name(value)
+      indices = array("I", (self.value_index(getattr(value, f.name)) for f in dataclasses.fields(value)))
+      return _TAG_STRUCT.pack(_V_DATACLASS) + _PAIR_STRUCT.pack(type_name, len(indices)) + _to_le_bytes(indices)
+
+    raise ValueError(f"Unsupported value type {type(value)}")
+
+  def push_element(self, element: model.ContentElement, child_count: int):
+    kind = _ELEMENT_KINDS.get(type(element))
+
+    if kind is None:
+      raise ValueError(f"Unsupported element type {type(element)}")
+
+    if kind == _TEXT_KIND:
+      self.ints.extend((kind, self.string_index(element.get_text())))
+      return
+
+    flags = 0
+    fields = []
+
+    if child_count > 0:
+      flags |= _F_CHILDREN
+      fields.append(child_count)
+
+    element_id = element.get_id()
+    if element_id is not None:
+      flags |= _F_ID
+      fields.append(self.string_index(element_id))
+
+    lang = element.get_lang()
+    if lang != "":
+      flags |= _F_LANG
+      fields.append(self.string_index(lang))
+
+    if element.get_space() is model.WhiteSpaceHandling.PRESERVE:
+      flags |= _F_SPACE_PRESERVE
+
+    region = element.get_region()
+    if region is not None:
+      flags |= _F_REGION
+      fields.append(self.string_index(region.get_id()))
+
+    begin = element.get_begin()
+    if begin is not None:
+      flags |= _F_BEGIN
+      fields.append(self.value_index(begin))
+
+    end = element.get_end()
+    if end is not None:
+      flags |= _F_END
+      fields.append(self.value_index(end))
+
+    style_props = list(element.iter_styles())
+    if len(style_props) > 0:
+      flags |= _F_STYLES
+      fields.append(len(style_props))
+      for style_prop in style_props:
+        fields.append(self.string_index(style_prop.__name__))
+        fields.append(self.value_index(element.get_style(style_prop)))
+
+    steps = list(element.iter_animation_steps())
+    if len(steps) > 0:
+      flags |= _F_ANIMATION
+      fields.append(len(steps))
+      for step in steps:
+        fields.append(self.string_index(step.style_property.__name__))
+        fields.append(self.value_index(step.begin))
+        fields.append(self.value_index(step.end))
+        fields.append(self.value_index(step.value))
+
+    self.ints.append(kind | (flags << _FLAGS_SHIFT))
+    self.ints.extend(fields)
+
+  def push_tree(self, root: model.ContentElement):
+    # iterative preorder traversal, which is not limited by the depth of the tree
+    stack = [root]
+    while len(stack) > 0:
+      element = stack.pop()
+      children = list(element)
+      self.push_element(element, len(children))
+      children.reverse()
+      stack.extend(children)
+
+  def push_document(self, doc: model.ContentDocument):
+    ints = self.ints
+
+    ints.append(self.string_index(doc.get_lang()))
+
+    content_profiles = doc.get_content_profiles()
+    if content_profiles is None:
+      ints.append(_NO_CONTENT_PROFILES)
+    else:
+      ints.append(len(content_profiles))
+      for content_profile in sorted(content_profiles):
+        ints.append(self.string_index(content_profile))
+
+    ints.append(self.value_index(doc.get_cell_resolution()))
+    ints.append(self.value_index(doc.get_px_resolution()))
+    ints.append(self.value_index(doc.get_active_area()))
+    ints.append(self.value_index(doc.get_display_aspect_ratio()))
+
+    initial_values = list(doc.iter_initial_values())
+    ints.append(len(initial_values))
+    for style_prop, value in initial_values:
+      ints.append(self.string_index(style_prop.__name__))
+      ints.append(self.value_index(value))
+
+    regions = list(doc.iter_regions())
+    ints.append(len(regions))
+    for region in regions:
+      self.push_element(region, 0)
+
+    body = doc.get_body()
+    ints.append(0 if body is None else 1)
+    if body is not None:
+      self.push_tree(body)
+
+  def to_bytes(self) -> bytes:
+    strings = list(self.strings)
+    string_lengths = array("I", map(len, strings))
+    string_data = "".join(strings).encode("utf-8", "surrogatepass")
+
+    return b"".join((
+      _HEADER_STRUCT.pack(_MAGIC, FORMAT_VERSION),
+      _COUNT_STRUCT.pack(len(strings)),
+      _to_le_bytes(string_lengths),
+      _COUNT_STRUCT.pack(len(string_data)),
+      string_data,
+      _COUNT_STRUCT.pack(len(self.values)),
+      _COUNT_STRUCT.pack(len(self.value_data)),
+      self.value_data,
+      _COUNT_STRUCT.pack(len(self.ints)),
+      _to_le_bytes(self.ints)
+    ))
+
+def _to_le_bytes(a: array) -> bytes:
+  if sys.byteorder != "little":
+    a = array(a.typecode, a)
+    a.byteswap()
+  return a.tobytes()
+
+def _from_le_bytes(data: bytes) -> array:
+  a = array("I")
+  a.frombytes(data)
+  if sys.byteorder != "little":
+    a.byteswap()
+  return a
+
+def dumps(doc: model.ContentDocument) -> bytes:
+  '''Returns the binary serialization of `doc`'''
+  encoder = _Encoder()
+  encoder.push_document(doc)
+  return encoder.to_bytes()
+
+def dump(doc: model.ContentDocument, fp: typing.BinaryIO):
+  '''Writes the binary serialization of `doc` to the binary stream `fp`'''
+  fp.write(dumps(doc))
+
+#
+# load
+#
+
+class _Decoder:
+
+  def __init__(self, data: bytes):
+    self.data = memoryview(data)
+    self.offset = 0
+
+    magic, version = self._unpack(_HEADER_STRUCT)
+
+    if magic != _MAGIC:
+      raise ValueError("Not a serialized document")
+
+    if version != FORMAT_VERSION:
+      raise ValueError(f"Unsupported format version {version}")
+
+    # strings
+
+    string_count = self._count()
+    string_lengths = _from_le_bytes(self._read(4 * string_count))
+    string_data = str(self._read(self._count()), "utf-8", "surrogatepass")
+
+    self.strings: typing.List[typing.Optional[str]] = [None]
+    offset = 0
+    for length in string_lengths:
+      self.strings.append(string_data[offset:offset + length])
+      offset += length
+
+    # values
+
+    value_count = self._count()
+    value_data_end = self._count()
+    value_data_end += self.offset
+
+    self.values: typing.List[typing.Any] = [None]
+    for _ in range(value_count):
+      self.values.append(self._read_value())
+
+    if self.offset != value_data_end:
+      raise ValueError("Malformed value table")
+
+    # document
+
+    int_count = self._count()
+    self.ints = _from_le_bytes(self._read(4 * int_count))
+
+    if self.offset != len(self.data):
+      raise ValueError("Unexpected trailing data")
+
+    self._ints_iter = iter(self.ints)
+    self._next_int = self._ints_iter.__next__
+
+    # maps string table indices to style properties
+    self._style_props: typing.Dict[int, typing.Type[styles.StyleProperty]] = {}
+
+  def _read(self, length: int) -> memoryview:
+    if self.offset + length > len(self.data):
+      raise ValueError("Truncated data")
+    chunk = self.data[self.offset:self.offset + length]
+    self.offset += length
+    return chunk
+
+  def _unpack(self, s: struct.Struct) -> tuple:
+    return s.unpack(self._read(s.size))
+
+  def _count(self) -> int:
+    return self._unpack(_COUNT_STRUCT)[0]
+
+  def _value_type(self, type_index: int, base: type) -> type:
+    value_type = _VALUE_TYPES.get(self.strings[type_index])
+    if value_type is None or not issubclass(value_type, base):
+      raise ValueError(f"Unsupported value type {self.strings[type_index]}")
+    return value_type
+
+  def _read_value(self) -> typing.Any:
+    tag = self._unpack(_TAG_STRUCT)[0]
+
+    if tag == _V_FALSE:
+      return False
+
+    if tag == _V_TRUE:
+      return True
+
+    if tag == _V_INT:
+      return self._unpack(_INT_STRUCT)[0]
+
+    if tag == _V_BIG_INT:
+      return int(self.strings[self._unpack(_INDEX_STRUCT)[0]])
+
+    if tag == _V_FLOAT:
+      return self._unpack(_FLOAT_STRUCT)[0]
+
+    if tag == _V_STR:
+      return self.strings[self._unpack(_INDEX_STRUCT)[0]]
+
+    if tag == _V_FRACTION:
+      numerator, denominator = self._unpack(_PAIR_STRUCT)
+      return Fraction(self.values[numerator], self.values[denominator])
+
+    if tag == _V_TUPLE:
+      count = self._unpack(_INDEX_STRUCT)[0]
+      return tuple(self.values[i] for i in _from_le_bytes(self._read(4 * count)))
+
+    if tag == _V_ENUM:
+      type_index, name_index = self._unpack(_PAIR_STRUCT)
+      return self._value_type(type_index, enum.Enum)[self.strings[name_index]]
+
+    if tag == _V_DATACLASS:
+      type_index, count = self._unpack(_PAIR_STRUCT)
+      value_type = self._value_type(type_index, object)
+      if not dataclasses.is_dataclass(value_type):
+        raise ValueError(f"Unsupported value type {self.strings[type_index]}")
+      field_values = [self.values[i] for i in _from_le_bytes(self._read(4 * count))]
+      # values are validated by their constructor, once per distinct value
+      return value_type(**dict(zip((f.name for f in dataclasses.fields(value_type)), field_values)))
+
+    raise ValueError(f"Unknown value tag {tag}")
+
+  def _style_prop(self, string_index: int) -> typing.Type[styles.StyleProperty]:
+    style_prop = self._style_props.get(string_index)
+    if style_prop is None:
+      style_prop = _STYLE_PROPERTIES[self.strings[string_index]]
+      self._style_props[string_index] = style_prop
+    return style_prop
+
+  def read_element(self, doc: model.ContentDocument) -> typing.Tuple[model.ContentElement, int]:
+    '''Returns the next element and its number of children. The element is built without validation.'''
+
+    next_int = self._next_int
+    strings = self.strings
+    values = self.values
+
+    header = next_int()
+    kind = header & _KIND_MASK
+    element = object.__new__(_ELEMENT_TYPES[kind])
+    attributes = _ELEMENT_ATTRIBUTES[kind].copy()
+    attributes["_doc"] = doc
+    attributes["_styles"] = {}
+    attributes["_sets"] = []
+
+    if kind == _TEXT_KIND:
+      if header != kind:
+        raise ValueError("Malformed text node")
+      text = strings[next_int()]
+      if text is None:
+        raise ValueError("Text node without text")
+      attributes["_text"] = text
+      element.__dict__ = attributes
+      return element, 0
+
+    flags = header >> _FLAGS_SHIFT
+
+    child_count = next_int() if flags & _F_CHILDREN else 0
+
+    if flags & _F_ID:
+      attributes["_id"] = strings[next_int()]
+    elif kind == _REGION_KIND:
+      raise ValueError("Region without id")
+
+    if flags & _F_LANG:
+      attributes["_lang"] = strings[next_int()]
+
+    if flags & _F_SPACE_PRESERVE:
+      attributes["_space"] = model.WhiteSpaceHandling.PRESERVE
+
+    if flags & _F_REGION:
+      attributes["_region"] = doc.get_region(strings[next_int()])
+      if attributes["_region"] is None:
+        raise ValueError("Unknown region")
+
+    if flags & _F_BEGIN:
+      attributes["_begin"] = values[next_int()]
+
+    if flags & _F_END:
+      attributes["_end"] = values[next_int()]
+
+    if flags & _F_STYLES:
+      element_styles = attributes["_styles"]
+      for _ in range(next_int()):
+        style_prop = self._style_prop(next_int())
+        element_styles[style_prop] = values[next_int()]
+
+    if flags & _F_ANIMATION:
+      steps = attributes["_sets"]
+      for _ in range(next_int()):
+        step = object.__new__(model.DiscreteAnimationStep)
+        object.__setattr__(step, "style_property", self._style_prop(next_int()))
+        object.__setattr__(step, "begin", values[next_int()])
+        object.__setattr__(step, "end", values[next_int()])
+        object.__setattr__(step, "value", values[next_int()])
+        steps.append(step)
+
+    element.__dict__ = attributes
+
+    return element, child_count
+
+  def read_tree(self, doc: model.ContentDocument) -> model.ContentElement:
+    root, child_count = self.read_element(doc)
+
+    # stack of [parent, number of children left to read]
+    stack = [[root, child_count]]
+
+    while len(stack) > 0:
+      top = stack[-1]
+
+      if top[1] == 0:
+        stack.pop()
+        continue
+
+      top[1] -= 1
+
+      child, child_count = self.read_element(doc)
+      _append_child(top[0], child)
+
+      if child_count > 0:
+        stack.append([child, child_count])
+
+    return root
+
+  def read_document(self) -> model.ContentDocument:
+
+    # pylint: disable=W0212
+
+    next_int = self._next_int
+
+    doc = model.ContentDocument()
+
+    doc._lang = self.strings[next_int()]
+
+    content_profile_count = next_int()
+    if content_profile_count == _NO_CONTENT_PROFILES:
+      doc._content_profiles = None
+    else:
+      doc._content_profiles = set(self.strings[next_int()] for _ in range(content_profile_count))
+
+    doc._cell_resolution = self.values[next_int()]
+    doc._px_resolution = self.values[next_int()]
+    doc._active_area = self.values[next_int()]
+    doc._dar = self.values[next_int()]
+
+    for _ in range(next_int()):
+      style_prop = self._style_prop(next_int())
+      doc._initial_values[style_prop] = self.values[next_int()]
+
+    for _ in range(next_int()):
+      region, _ = self.read_element(doc)
+      if not isinstance(region, model.Region):
+        raise ValueError("Expected a region")
+      doc._regions[region.get_id()] = region
+
+    if next_int() != 0:
+      body = self.read_tree(doc)
+      if not isinstance(body, model.Body):
+        raise ValueError("Expected a body")
+      doc._body = body
+
+    # pylint: enable=W0212
+
+    if next(self._ints_iter, None) is not None:
+      raise ValueError("Unexpected trailing data")
+
+    return doc
+
+def _append_child(parent: model.ContentElement, child: model.ContentElement):
+  '''Appends `child` to the children of `parent`, without checking the type of either'''
+
+  # pylint: disable=W0212
+
+  child._parent = parent
+  child._previous_sibling = parent._last_child
+
+  if parent._last_child is not None:
+    parent._last_child._next_sibling = child
+  else:
+    parent._first_child = child
+
+  parent._last_child = child
+
+  # pylint: enable=W0212
+
+def loads(data: bytes) -> model.ContentDocument:
+  '''Returns the document serialized in `data`, as returned by `dumps()`. The document is built without the
+  validation performed by the data model setters, and `ValueError` is raised if `data` is not well-formed.'''
+
+  try:
+    decoder = _Decoder(data)
+    doc = decoder.read_document()
+  except (IndexError, KeyError, StopIteration, struct.error, UnicodeDecodeError, TypeError) as e:
+    raise ValueError("Malformed serialized document") from e
+
+  return doc
+
+def load(fp: typing.BinaryIO) -> model.ContentDocument:
+  '''Returns the document serialized in the binary stream `fp`, as written by `dump()`'''
+  return loads(fp.read())
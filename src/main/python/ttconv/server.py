@@ -0,0 +1,431 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Long-lived conversion service (`tt serve`)
+
+Conversion requests are received over HTTP, on either a local TCP port or a Unix socket, and are processed by a pool
+of worker processes that import the readers and writers once:
+
+* `POST /convert` converts the request body, or the file at the `input` query parameter if the body is empty, and
+  returns the converted document. The `itype`, `otype`, `config` (JSON), `filter` (repeatable), `begin` and `end`
+  query parameters have the same meaning as the `tt convert` options. The `timeout` query parameter limits the
+  duration of the conversion, in seconds, and is capped by the `timeout` of the server. Errors are returned as a JSON
+  object with an `error` member.
+* `GET /status` returns the number of pending requests.
+
+Requests beyond `max_pending` are rejected with status 503, rather than queued without bound. A request whose worker
+process terminates abruptly, e.g. because it runs out of memory, is also rejected with status 503, and the worker
+processes are restarted.
+'''
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import concurrent.futures.process
+import http.server
+import json
+import logging
+import os
+import socketserver
+import tempfile
+import threading
+import typing
+import urllib.parse
+from dataclasses import dataclass, field
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8620
+
+DEFAULT_MAX_INPUT_SIZE = 64 * 1024 * 1024
+
+_CONTENT_TYPES = {
+  "ttml": "application/ttml+xml",
+  "scc": "text/plain; charset=utf-8",
+  "srt": "application/x-subrip; charset=utf-8",
+  "vtt": "text/vtt; charset=utf-8",
+}
+
+class ConversionError(Exception):
+  '''Raised when a conversion request cannot be processed'''
+
+class ConversionTimeoutError(ConversionError):
+  '''Raised when a conversion request is not processed within its timeout'''
+
+class WorkerLostError(Exception):
+  '''Raised when a worker process terminates abruptly, e.g. it runs out of memory, while a conversion request is
+  pending'''
+
+@dataclass
+class ConversionRequest:
+  '''Conversion request, where the input is either `data` or the file at `input_path`'''
+  otype: str
+  itype: typing.Optional[str] = None
+  data: typing.Optional[bytes] = None
+  input_path: typing.Optional[str] = None
+  config: typing.Optional[str] = None
+  filters: typing.List[str] = field(default_factory=list)
+  begin: typing.Optional[str] = None
+  end: typing.Optional[str] = None
+  timeout: typing.Optional[float] = None
+
+#
+# worker process
+#
+
+_worker_log_level = logging.INFO
+
+def _init_worker(log_level: int):
+  global _worker_log_level  # pylint: disable=global-statement
+
+  # pylint: disable=import-outside-toplevel
+  import ttconv.tt as tt
+
+  _worker_log_level = log_level
+  tt.progress.display_progress_bar = False
+
+def convert(request: ConversionRequest) -> bytes:
+  '''Processes `request` and returns the converted document. Called in a worker process.'''
+
+  # pylint: disable=import-outside-toplevel
+  import ttconv.tt as tt
+  from ttconv.cancellation import ConversionCancelledError
+
+  # the configuration of a request must not leak to the next one
+  tt.LOGGER.setLevel(_worker_log_level)
+  tt.progress.display_progress_bar = False
+
+  with tempfile.TemporaryDirectory() as temp_dir:
+
+    if request.data is not None:
+      if request.itype is None:
+        raise ConversionError("The input type must be specified")
+      input_path = os.path.join(temp_dir, "input")
+      with open(input_path, "wb") as f:
+        f.write(request.data)
+    elif request.input_path is not None:
+      input_path = request.input_path
+    else:
+      raise ConversionError("No input was provided")
+
+    output_path = os.path.join(temp_dir, "output")
+
+    config = request.config
+
+    if request.timeout is not None:
+      try:
+        config_data = json.loads(config) if config is not None else {}
+        general_config = config_data.setdefault("general", {})
+      except (ValueError, AttributeError):
+        raise ConversionError("The configuration must be a JSON object") from None
+
+      if general_config.get("timeout") is None or general_config["timeout"] > request.timeout:
+        general_config["timeout"] = request.timeout
+
+      config = json.dumps(config_data)
+
+    args = argparse.Namespace(
+      input=input_path,
+      output=output_path,
+      itype=request.itype,
+      otype=request.otype,
+      filter=request.filters,
+      begin=request.begin,
+      end=request.end,
+      config=config,
+      config_file=None
+    )
+
+    try:
+      tt.convert(args)
+    except ConversionCancelledError as e:
+      raise ConversionTimeoutError(str(e)) from None
+    except SystemExit as e:
+      raise ConversionError(str(e.code)) from None
+    except Exception as e:
+      # the original exception may not be transferable to the server process
+      raise ConversionError(f"{type(e).__name__}: {e}") from None
+
+    if not os.path.exists(output_path):
+      raise ConversionError("The conversion did not produce a single output document")
+
+    with open(output_path, "rb") as f:
+      return f.read()
+
+#
+# server process
+#
+
+class ConversionService:
+  '''Runs conversion requests on a pool of `workers` processes, and holds at most `max_pending` requests, either
+  running or waiting for a worker'''
+
+  def __init__(self, workers: typing.Optional[int] = None, max_pending: typing.Optional[int] = None):
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    if workers < 1:
+      raise ValueError("At least one worker is required")
+
+    self.workers = workers
+    self.max_pending = max_pending if max_pending is not None else 2 * workers
+    self._pending = 0
+    self._lock = threading.Lock()
+    self._executor_lock = threading.Lock()
+    self._executor = self._make_executor()
+
+  def _make_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+    return concurrent.futures.ProcessPoolExecutor(
+      max_workers=self.workers,
+      initializer=_init_worker,
+      initargs=(logging.getLogger("ttconv").getEffectiveLevel(),)
+    )
+
+  def _replace_executor(self, broken_executor: concurrent.futures.ProcessPoolExecutor):
+    # the executor is replaced only once, even if several requests were pending on it
+    with self._executor_lock:
+      if self._executor is broken_executor:
+        LOGGER.error("A worker process terminated abruptly, restarting the worker processes")
+        broken_executor.shutdown(wait=False)
+        self._executor = self._make_executor()
+
+  def pending(self) -> int:
+    '''Returns the number of requests that are running or waiting for a worker'''
+    return self._pending
+
+  def try_convert(self, request: ConversionRequest) -> typing.Optional[bytes]:
+    '''Processes `request` and returns the converted document, or returns `None` immediately if `max_pending`
+    requests are already pending. Raises `ConversionError` if the conversion fails, and `WorkerLostError` if a worker
+    process terminates abruptly, in which case the worker processes are restarted so that later requests can be
+    processed.'''
+
+    with self._lock:
+      if self._pending >= self.max_pending:
+        return None
+      self._pending += 1
+
+    try:
+      executor = self._executor
+
+      try:
+        return executor.submit(convert, request).result()
+      except concurrent.futures.process.BrokenProcessPool as e:
+        self._replace_executor(executor)
+        raise WorkerLostError(str(e)) from None
+    finally:
+      with self._lock:
+        self._pending -= 1
+
+  def shutdown(self):
+    '''Stops the worker processes'''
+    with self._executor_lock:
+      self._executor.shutdown()
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+
+  server_version = "ttconv"
+
+  protocol_version = "HTTP/1.1"
+
+  def address_string(self):
+    # Unix socket clients have no address
+    return self.client_address[0] if isinstance(self.client_address, tuple) else "local"
+
+  def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+    LOGGER.debug("%s - %s", self.address_string(), format % args)
+
+  def _send(self, status: int, body: bytes, content_type: str, headers: typing.Optional[dict] = None):
+    self.send_response(status)
+    self.send_header("Content-Type", content_type)
+    self.send_header("Content-Length", str(len(body)))
+    for name, value in (headers or {}).items():
+      self.send_header(name, value)
+    self.end_headers()
+    self.wfile.write(body)
+
+  def _send_json(self, status: int, obj: typing.Any, headers: typing.Optional[dict] = None):
+    self._send(status, json.dumps(obj).encode("utf-8"), "application/json", headers)
+
+  def do_GET(self):  # pylint: disable=invalid-name
+    if urllib.parse.urlsplit(self.path).path != "/status":
+      self._send_json(404, {"error": "Unknown resource"})
+      return
+
+    service: ConversionService = self.server.service
+    self._send_json(200, {"pending": service.pending(), "max_pending": service.max_pending, "workers": service.workers})
+
+  def do_POST(self):  # pylint: disable=invalid-name
+    url = urllib.parse.urlsplit(self.path)
+
+    try:
+      length = int(self.headers.get("Content-Length", "0"))
+    except ValueError:
+      length = -1
+
+    if length < 0:
+      self.close_connection = True
+      self._send_json(400, {"error": "Bad Content-Length"})
+      return
+
+    if length > self.server.max_input_size:
+      self.close_connection = True
+      self._send_json(413, {"error": "Input too large"})
+      return
+
+    data = self.rfile.read(length)
+
+    if url.path != "/convert":
+      self._send_json(404, {"error": "Unknown resource"})
+      return
+
+    params = urllib.parse.parse_qs(url.query)
+
+    def _param(name: str) -> typing.Optional[str]:
+      values = params.get(name)
+      return values[-1] if values else None
+
+    otype = _param("otype")
+
+    if otype is None:
+      self._send_json(400, {"error": "The output type must be specified"})
+      return
+
+    request = ConversionRequest(
+      otype=otype,
+      itype=_param("itype"),
+      data=data if length > 0 else None,
+      input_path=_param("input"),
+      config=_param("config"),
+      filters=params.get("filter", []),
+      begin=_param("begin"),
+      end=_param("end")
+    )
+
+    timeout = self.server.conversion_timeout
+
+    if _param("timeout") is not None:
+      try:
+        timeout = float(_param("timeout"))
+      except ValueError:
+        timeout = -1
+
+      if not timeout >= 0:
+        self._send_json(400, {"error": "Bad timeout"})
+        return
+
+      if self.server.conversion_timeout is not None:
+        timeout = min(timeout, self.server.conversion_timeout)
+
+    request.timeout = timeout
+
+    try:
+      output = self.server.service.try_convert(request)
+    except ConversionTimeoutError as e:
+      self._send_json(504, {"error": str(e)})
+      return
+    except ConversionError as e:
+      self._send_json(400, {"error": str(e)})
+      return
+    except WorkerLostError as e:
+      self._send_json(503, {"error": str(e)}, {"Retry-After": "1"})
+      return
+    except Exception as e:  # pylint: disable=broad-except
+      LOGGER.exception("Conversion failed")
+      self._send_json(500, {"error": str(e)})
+      return
+
+    if output is None:
+      self._send_json(503, {"error": "Too many pending requests"}, {"Retry-After": "1"})
+      return
+
+    self._send(200, output, _CONTENT_TYPES.get(otype.lower(), "application/octet-stream"))
+
+class _TCPServer(http.server.ThreadingHTTPServer):
+  daemon_threads = True
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+  class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+def make_server(
+  service: ConversionService,
+  host: str = "127.0.0.1",
+  port: int = DEFAULT_PORT,
+  unix_socket: typing.Optional[str] = None,
+  max_input_size: int = DEFAULT_MAX_INPUT_SIZE,
+  timeout: typing.Optional[float] = None
+  ) -> socketserver.BaseServer:
+  '''Returns a server that forwards conversion requests to `service`. The server listens on `unix_socket` if
+  specified, and on `host`:`port` otherwise. If specified, `timeout` is the maximum duration of a conversion, in
+  seconds.'''
+
+  if unix_socket is not None:
+    if not hasattr(socketserver, "UnixStreamServer"):
+      raise ValueError("Unix sockets are not supported on this platform")
+    server = _UnixServer(unix_socket, _RequestHandler)
+  else:
+    server = _TCPServer((host, port), _RequestHandler)
+
+  server.service = service
+  server.max_input_size = max_input_size
+  server.conversion_timeout = timeout
+
+  return server
+
+def serve(
+  host: str = "127.0.0.1",
+  port: int = DEFAULT_PORT,
+  unix_socket: typing.Optional[str] = None,
+  workers: typing.Optional[int] = None,
+  max_pending: typing.Optional[int] = None,
+  max_input_size: int = DEFAULT_MAX_INPUT_SIZE,
+  timeout: typing.Optional[float] = None
+  ):
+  '''Processes conversion requests until interrupted'''
+
+  service = ConversionService(workers, max_pending)
+
+  try:
+    server = make_server(service, host, port, unix_socket, max_input_size, timeout)
+  except BaseException:
+    service.shutdown()
+    raise
+
+  LOGGER.info(
+    "Listening on %s with %d workers",
+    unix_socket if unix_socket is not None else f"{host}:{server.server_address[1]}",
+    service.workers
+  )
+
+  try:
+    server.serve_forever()
+  except KeyboardInterrupt:
+    pass
+  finally:
+    server.server_close()
+    service.shutdown()
+    if unix_socket is not None and os.path.exists(unix_socket):
+      os.remove(unix_socket)
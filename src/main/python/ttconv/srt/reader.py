@@ -29,13 +29,14 @@
 
 import typing
 import re
+import html
 import logging
 from enum import Enum
-from html.parser import HTMLParser
 
 from ttconv import model
 from ttconv import style_properties as styles
-from ttconv.utils import parse_color
+from ttconv.utils import FileOrPath, open_text, parse_color, stream_progress
+from ttconv.limits import ResourceLimits
 from ttconv.srt.config import SRTReaderConfiguration
 
 LOGGER = logging.getLogger(__name__)
@@ -49,9 +50,6 @@ def _none_terminated(iterator):
     yield item
   yield None
 
-# Alignment tag regex for ASS/SSA style tags {\an1} through {\an9}
-_ALIGNMENT_TAG_RE = re.compile(r"\{\\an([1-9])\}")
-
 class _SSAAlignment(Enum):
   """ASS/SSA alignment position codes ({\\anN} format).
   
@@ -75,20 +73,6 @@ def from_code(cls, code: int) -> "_SSAAlignment":
     """Get alignment by numeric code (1-9)."""
     return cls[f"an{code}"]
 
-def _extract_alignment(text: str) -> typing.Tuple[typing.Optional[_SSAAlignment], str]:
-  """Extract alignment from text and return (alignment, cleaned_text).
-  
-  If multiple alignment tags are present, uses the first one and removes all.
-  Returns (None, original_text) if no alignment tag found.
-  """
-  match = _ALIGNMENT_TAG_RE.search(text)
-  if match:
-    alignment = _SSAAlignment.from_code(int(match.group(1)))
-    # Remove all alignment tags from text
-    cleaned_text = _ALIGNMENT_TAG_RE.sub("", text)
-    return alignment, cleaned_text
-  return None, text
-
 def _get_region_for_alignment(
     doc: model.ContentDocument,
     alignment: _SSAAlignment,
@@ -140,66 +124,152 @@ def _get_region_for_alignment(
   
   return region
 
-class _TextParser(HTMLParser):
+# HTML-style tags, e.g. <b> or <font color="red">
+_HTML_TAG_PATTERN = r"<(?P<end>/?)(?P<tag>[a-zA-Z][^\s/>]*)(?P<attrs>[^>]*)>"
+
+# extended tags, e.g. {b} or {/italic}
+_EXTENDED_TAG_PATTERN = r"\{(?P<ext_end>/?)(?P<ext_tag>b|bold|i|italic|u|underline)\}"
+
+# ASS/SSA style alignment tags {\an1} through {\an9}
+_ALIGNMENT_TAG_PATTERN = r"\{\\an(?P<an>[1-9])\}"
 
-  def __init__(self, paragraph: model.P, line_number: int) -> None:
+# markup regexes indexed by (extended_tags, alignment_tags)
+_MARKUP_RE = {
+  (extended_tags, alignment_tags): re.compile("|".join(
+    [_HTML_TAG_PATTERN] + \
+    ([_EXTENDED_TAG_PATTERN] if extended_tags else []) + \
+    ([_ALIGNMENT_TAG_PATTERN] if alignment_tags else [])
+  ))
+  for extended_tags in (False, True) for alignment_tags in (False, True)
+}
+
+_EXTENDED_TAG_NAMES = {
+  "bold": "b",
+  "italic": "i",
+  "underline": "u"
+}
+
+_FONT_COLOR_RE = re.compile(r"""\bcolor\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE)
+
+class _TextParser:
+  """Converts the text of a cue, including its markup, to children of a paragraph"""
+
+  def __init__(self, paragraph: model.P, line_number: int, extended_tags: bool, alignment_tags: bool) -> None:
     self.line_num: int = line_number
     self.tag_stack: typing.List[str] = []
+    self.paragraph: model.P = paragraph
     self.parent: model.ContentElement = paragraph
-    super().__init__()
+    self.extended_tags = extended_tags
+    self.markup_re = _MARKUP_RE[(extended_tags, alignment_tags)]
+
+    # first alignment tag found in the text, if any
+    self.alignment: typing.Optional[_SSAAlignment] = None
+
+  def feed(self, text: str):
+    """Parses `text`"""
+
+    if "<" not in text and "{" not in text and "&" not in text:
+      # plain text
+      self.handle_data(text)
+      return
+
+    # text between tags that are ignored is merged into a single run
+    text_run: typing.List[str] = []
+    position = 0
+
+    for m in self.markup_re.finditer(text):
+      text_run.append(text[position:m.start()])
+      position = m.end()
+
+      if m.group("tag") is not None:
+        tag = m.group("tag").lower()
+        if self.extended_tags:
+          tag = _EXTENDED_TAG_NAMES.get(tag, tag)
+        is_end_tag = len(m.group("end")) > 0
+        attrs = m.group("attrs")
+      elif m.groupdict().get("ext_tag") is not None:
+        tag = _EXTENDED_TAG_NAMES.get(m.group("ext_tag"), m.group("ext_tag"))
+        is_end_tag = len(m.group("ext_end")) > 0
+        attrs = ""
+      else:
+        if self.alignment is None:
+          self.alignment = _SSAAlignment.from_code(int(m.group("an")))
+        continue
+
+      if tag not in ("b", "i", "u", "font"):
+        LOGGER.warning("Unknown tag %s at line %s", tag, self.line_num)
+        continue
+
+      self.handle_data(html.unescape("".join(text_run)))
+      text_run.clear()
+
+      if is_end_tag:
+        self.handle_endtag(tag)
+      else:
+        self.handle_starttag(tag, attrs)
+
+    text_run.append(text[position:])
+    self.handle_data(html.unescape("".join(text_run)))
 
-  def handle_starttag(self, tag, attrs):
+  def handle_starttag(self, tag: str, attrs: str):
 
     span = model.Span(self.parent.get_doc())
     self.parent.push_child(span)
     self.parent = span
+    self.tag_stack.append(tag)
 
-    if tag.lower() in ("b"):
+    if tag == "b":
       span.set_style(styles.StyleProperties.FontWeight, styles.FontWeightType.bold)
-    elif tag.lower() in ("i"):
+    elif tag == "i":
       span.set_style(styles.StyleProperties.FontStyle, styles.FontStyleType.italic)
-    elif tag.lower() in ("u"):
-      span.set_style(styles.StyleProperties.TextDecoration, styles.TextDecorationType(underline=True))
-    elif tag.lower() == "font":
-      for attr in attrs:
-        if attr[0] == "color":
-          color = parse_color(attr[1])
-          break
-      else:
+    elif tag == "u":
+      span.set_style(styles.StyleProperties.TextDecoration, styles.UNDERLINE_TEXT_DECORATION)
+    elif tag == "font":
+      m = _FONT_COLOR_RE.search(attrs)
+
+      if m is None:
         LOGGER.warning("Font tag without a color attribute at line %s", self.line_num)
         return
 
+      color_value = html.unescape(next(g for g in m.groups() if g is not None))
+      color = parse_color(color_value)
+
       if color is None:
-        LOGGER.warning("Unknown color %s at line %s", attrs["color"], self.line_num)
+        LOGGER.warning("Unknown color %s at line %s", color_value, self.line_num)
         return
 
       span.set_style(styles.StyleProperties.Color, color)
 
-    else:
-      LOGGER.warning("Unknown tag %s at line %s", tag, self.line_num)
-      return
-
-    self.tag_stack.append(tag.lower())
-
-  def handle_endtag(self, tag):
+  def handle_endtag(self, tag: str):
     if len(self.tag_stack) > 0:
       self.parent = self.parent.parent()
       opened_tag = self.tag_stack.pop()
-      if opened_tag != tag.lower():
+      if opened_tag != tag:
         LOGGER.error("Closing tag <%s> at line %s does not match closet opened tag <%s>", tag, self.line_num, opened_tag)
     else:
       # this handles the case where tags are being closed without ever having been opened
       LOGGER.error("Unbalanced tag <%s> at line %s", tag, self.line_num)
 
-  def handle_data(self, data):
-    lines = data.split("\n")
+  def handle_data(self, data: str):
+    if len(data) == 0:
+      return
 
-    for i, line in enumerate(lines):
+    doc = self.parent.get_doc()
+
+    for i, line in enumerate(data.split("\n")):
       if i > 0:
-        self.parent.push_child(model.Br(self.parent.get_doc()))
-      span = model.Span(self.parent.get_doc())
-      span.push_child(model.Text(self.parent.get_doc(), line))
-      self.parent.push_child(span)
+        self.parent.push_child(model.Br(doc))
+
+      if len(line) == 0:
+        continue
+
+      if self.parent is self.paragraph:
+        # text cannot be a direct child of a paragraph
+        span = model.Span(doc)
+        span.push_child(model.Text(doc, line))
+        self.parent.push_child(span)
+      else:
+        self.parent.push_child(model.Text(doc, line))
 
 class _State(Enum):
   COUNTER = 1
@@ -245,12 +315,16 @@ def to_model(data_file: typing.IO, _config: SRTReaderConfiguration = None, progr
 
   body.push_child(div)
 
-  lines : str = data_file.readlines()
+  progress = stream_progress(data_file)
+  consumed = 0
 
   state = _State.COUNTER
   current_p = None
  
-  for line_index, line in enumerate(_none_terminated(lines)):
+  for line_index, line in enumerate(_none_terminated(data_file)):
+
+    if line is not None:
+      consumed += len(line)
 
     if state is _State.COUNTER:
       if line is None:
@@ -263,7 +337,9 @@ def to_model(data_file: typing.IO, _config: SRTReaderConfiguration = None, progr
         LOGGER.fatal("Missing subtitle counter at line %s", line_index)
         return None
       
-      progress_callback(line_index/len(lines))
+      progress_value = progress(consumed)
+      if progress_value is not None:
+        progress_callback(progress_value)
 
       state = _State.TC
 
@@ -311,39 +387,11 @@ def to_model(data_file: typing.IO, _config: SRTReaderConfiguration = None, progr
 
         subtitle_text = subtitle_text.strip('\r\n').replace(r"\n\r", "\n")
 
-        # Extract and handle alignment tags if enabled
-        if alignment_tags:
-          alignment, subtitle_text = _extract_alignment(subtitle_text)
-          if alignment is not None:
-            aligned_region = _get_region_for_alignment(
-              doc, alignment, alignment_regions_cache
-            )
-            current_p.set_region(aligned_region)
-
-        if extended_tags:
-          subtitle_text = subtitle_text\
-            .replace(r"{b}", r"<b>")\
-            .replace(r"{/b}", r"</b>")\
-            .replace(r"{bold}", r"<b>")\
-            .replace(r"{/bold}", r"</b>")\
-            .replace(r"<bold>", r"<b>")\
-            .replace(r"</bold>", r"</b>")\
-            .replace(r"{i}", r"<i>")\
-            .replace(r"{/i}", r"</i>")\
-            .replace(r"{italic}", r"<i>")\
-            .replace(r"{/italic}", r"</i>")\
-            .replace(r"<italic>", r"<i>")\
-            .replace(r"</italic>", r"</i>")\
-            .replace(r"{u}", r"<u>")\
-            .replace(r"{/u}", r"</u>")\
-            .replace(r"{underline}", r"<u>")\
-            .replace(r"{/underline}", r"</u>")\
-            .replace(r"<underline>", r"<u>")\
-            .replace(r"</underline>", r"</u>")
-
-        parser = _TextParser(current_p, line_index)
+        parser = _TextParser(current_p, line_index, extended_tags, alignment_tags)
         parser.feed(subtitle_text)
-        parser.close()
+
+        if parser.alignment is not None:
+          current_p.set_region(_get_region_for_alignment(doc, parser.alignment, alignment_regions_cache))
 
         continue
 
@@ -358,3 +406,21 @@ def to_model(data_file: typing.IO, _config: SRTReaderConfiguration = None, progr
       continue
 
   return doc
+
+def to_model_from_file(
+  file: FileOrPath,
+  config: SRTReaderConfiguration = None,
+  progress_callback=lambda _: None,
+  limits: typing.Optional[ResourceLimits] = None
+  ):
+  """Converts the SRT document read from `file`, which is a path or a binary file object, to the data model. The
+  document is read as it is converted. If specified, `limits.max_elements` is checked against the converted
+  document."""
+
+  with open_text(file) as f:
+    doc = to_model(f, config, progress_callback)
+
+  if doc is not None and limits is not None:
+    limits.check_document(doc)
+
+  return doc
@@ -26,9 +26,10 @@
 """SRT writer"""
 
 from __future__ import annotations
+import io
 import logging
 from fractions import Fraction
-from typing import List, Optional, Tuple
+from typing import List, Optional, TextIO, Tuple
 
 import ttconv.model as model
 import ttconv.srt.style as style
@@ -37,10 +38,12 @@
 from ttconv.filters.isd.merge_paragraphs import ParagraphsMergingISDFilter
 from ttconv.filters.isd.merge_regions import RegionsMergingISDFilter
 from ttconv.filters.isd.supported_style_properties import SupportedStylePropertiesISDFilter
-from ttconv.isd import ISD
+from ttconv.isd import ISD, ISDConfiguration, TimeGrid
+from ttconv.limits import ResourceLimits, limit_sink
 from ttconv.srt.paragraph import SrtParagraph
 from ttconv.srt.config import SRTWriterConfiguration
 from ttconv.style_properties import StyleProperties, FontStyleType, NamedColors, FontWeightType, TextDecorationType
+from ttconv.utils import FileOrPath, open_text
 
 LOGGER = logging.getLogger(__name__)
 
@@ -74,13 +77,27 @@ class SrtContext:
     })
   )
 
-  def __init__(self, config: SRTWriterConfiguration):
+  def __init__(self, config: SRTWriterConfiguration, sink: Optional[TextIO] = None):
     self._captions_counter: int = 0
     self._begin: Fraction = Fraction(0)
     self._end: Fraction = Fraction(0)
     self._paragraphs: List[SrtParagraph] = []
     self._text_formatting = config.text_formatting
 
+    # if specified, paragraphs are written to the sink, and released, as soon as they are final
+    self._sink = sink
+    self._written_count: int = 0
+
+  def _write_paragraphs(self, count: int):
+    """Writes the first `count` paragraphs to the sink and releases them"""
+    for paragraph in self._paragraphs[:count]:
+      if self._written_count > 0:
+        self._sink.write("\n")
+      self._written_count += 1
+      self._sink.write(paragraph.to_string(self._written_count))
+
+    del self._paragraphs[:count]
+
   def append_element(self, element: model.ContentElement, begin: Fraction, end: Optional[Fraction]):
     """Converts model element to SRT content"""
 
@@ -176,6 +193,10 @@ def add_isd(self, isd, begin: Fraction, end: Optional[Fraction]):
     if is_isd_empty:
       LOGGER.debug("Skipping empty paragraph.")
 
+    if self._sink is not None:
+      # only the last paragraph can still be modified, see finish()
+      self._write_paragraphs(len(self._paragraphs) - 1)
+
   def finish(self):
     """Checks and processes the last paragraph"""
 
@@ -192,6 +213,9 @@ def finish(self):
         LOGGER.warning("Set a default end value to paragraph (begin + 10s).")
         self._paragraphs[-1].set_end(self._paragraphs[-1].get_begin().to_seconds() + 10.0)
 
+    if self._sink is not None:
+      self._write_paragraphs(len(self._paragraphs))
+
   def __str__(self) -> str:
     return "\n".join(p.to_string(id + 1) for id, p in enumerate(self._paragraphs))
 
@@ -201,35 +225,82 @@ def __str__(self) -> str:
 #
 
 
-def from_model(doc: model.ContentDocument, config: Optional[SRTWriterConfiguration] = None, progress_callback=lambda _: None) -> str:
-  """Converts the data model to a SRT document"""
+def from_model(
+  doc: model.ContentDocument,
+  config: Optional[SRTWriterConfiguration] = None,
+  progress_callback=lambda _: None,
+  isd_config: Optional[ISDConfiguration] = None,
+  limits: Optional[ResourceLimits] = None
+  ) -> str:
+  """Converts the data model to a SRT document. If specified, `isd_config` restricts the conversion to a window
+  of the document."""
+
+  sink = io.StringIO()
+
+  from_model_to_stream(doc, sink, config, progress_callback, isd_config, limits)
+
+  return sink.getvalue()
+
+
+def from_model_to_stream(
+  doc: model.ContentDocument,
+  sink: TextIO,
+  config: Optional[SRTWriterConfiguration] = None,
+  progress_callback=lambda _: None,
+  isd_config: Optional[ISDConfiguration] = None,
+  limits: Optional[ResourceLimits] = None
+  ):
+  """Converts the data model to a SRT document, which is written to `sink` one paragraph at a time, as soon as
+  each paragraph is final. If specified, `isd_config` restricts the conversion to a window of the document and
+  `limits` caps the resources used by the conversion."""
 
-  srt = SrtContext(config if config is not None else SRTWriterConfiguration())
+  isd_config = isd_config if isd_config is not None else ISDConfiguration()
 
-  # split progress between ISD construction and SRT writing
+  sink = limit_sink(sink, limits)
 
-  def _isd_progress(progress: float):
-    progress_callback(progress / 2)
+  srt = SrtContext(config if config is not None else SRTWriterConfiguration(), sink)
 
-  # Compute ISDs
+  # ISDs are computed as they are processed, and an ISD is processed once the next one, which
+  # determines its end, is available
 
-  isds = list(
-    ISD.generate_isd_sequence(doc, _isd_progress)
+  isds = ISD.iter_isd_sequence(
+    doc,
+    progress_callback,
+    coalesce=True,
+    time_grid=TimeGrid(Fraction(1000)),
+    begin=isd_config.begin,
+    end=isd_config.end,
+    worker_threads=isd_config.worker_threads,
+    limits=limits
   )
 
-  # process ISDs
+  previous: Optional[Tuple[Fraction, ISD]] = None
 
-  for i, (begin, isd) in enumerate(isds):
+  for begin, isd in isds:
 
-    end = isds[i + 1][0] if i + 1 < len(isds) else None
+    if previous is not None:
+      srt.add_isd(previous[1], previous[0], begin)
 
     for srt_filter in srt.filters:
       srt_filter.process(isd)
 
-    srt.add_isd(isd, begin, end)
+    previous = (begin, isd)
 
-    progress_callback(0.5 + (i + 1) / len(isds) / 2)
+  if previous is not None:
+    srt.add_isd(previous[1], previous[0], None)
 
   srt.finish()
 
-  return str(srt)
+def from_model_to_file(
+  doc: model.ContentDocument,
+  file: FileOrPath,
+  config: Optional[SRTWriterConfiguration] = None,
+  progress_callback=lambda _: None,
+  isd_config: Optional[ISDConfiguration] = None,
+  limits: Optional[ResourceLimits] = None
+  ):
+  """Converts the data model to an SRT document, which is written to `file`, a path or a binary file object, as it is
+  generated (see `from_model_to_stream()`)."""
+
+  with open_text(file, "w") as srt_file:
+    from_model_to_stream(doc, srt_file, config, progress_callback, isd_config, limits)
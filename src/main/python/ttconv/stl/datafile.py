@@ -177,6 +177,15 @@
     "TTI", ["SGN", "SN", "EBN", "CS", "TCIh", "TCIm", "TCIs", "TCIf", "TCOh", "TCOm", "TCOs", "TCOf", "VP", "JC", "CF", "TF"]
   )
 
+_TTI_STRUCT = struct.Struct('<BHBBBBBBBBBBBBB112s')
+
+# offset of the EBN field within a TTI block
+_TTI_EBN_OFFSET = 3
+
+def _is_user_data_ebn(ebn: int) -> bool:
+  """Returns whether the extension block number `ebn` signals a user data or reserved block"""
+  return 0xEF < ebn < 0xFF
+
 def _get_region_from_model(
   doc: model.ContentDocument,
   x_origin: Number,
@@ -318,6 +327,9 @@ def __init__(
 
     self.tti_tf = None
 
+    # text fields of the extension blocks of the current subtitle
+    self.tti_tf_parts: typing.List[bytes] = []
+
     self.fps = _DFC_FRACTION_MAP.get(self.gsi.DFC)
     if self.fps is None:
       LOGGER.error("Unknown GSI DFC value %s, defaulting to 25 fps", self.gsi.DFC)
@@ -426,29 +438,37 @@ def process_tti_block(self, tti_block: bytes):
     if tti_block is None:
       raise ValueError("tti_block should not be None")
 
-    tti = _TTIBlock._make(
-      struct.unpack(
-        '<BHBBBBBBBBBBBBB112s', tti_block
-      )
-    )
+    self._process_tti(_TTIBlock._make(_TTI_STRUCT.unpack(tti_block)))
+
+  def process_tti_blocks(self, tti_blocks: bytes, progress_callback=lambda _: None):
+    """Processes a sequence of contiguous TTI blocks, e.g. the remainder of the datafile after the GSI block
+    """
+    if len(tti_blocks) % _TTI_STRUCT.size != 0:
+      raise ValueError("Truncated TTI block")
+
+    tti_count = self.get_tti_count()
 
-    LOGGER.debug("Subtitle SN: %s", tti.SN)
-    LOGGER.debug("  EBN: %s", tti.EBN)
-    LOGGER.debug("  CS: %s", tti.CS)
-    LOGGER.debug("  SGN: %s", tti.SGN)
-    LOGGER.debug("  JC: %s", tti.JC)
-    LOGGER.debug("  VP: %s", tti.VP)
+    for i, offset in enumerate(range(0, len(tti_blocks), _TTI_STRUCT.size)):
 
-    if 0xEF < tti.EBN < 0xFF:
+      # skip user data and reserved blocks without unpacking them
+      if not _is_user_data_ebn(tti_blocks[offset + _TTI_EBN_OFFSET]):
+        self._process_tti(_TTIBlock._make(_TTI_STRUCT.unpack_from(tti_blocks, offset)))
+
+      progress_callback(i/tti_count)
+
+  def _process_tti(self, tti: _TTIBlock):
+
+    if LOGGER.isEnabledFor(logging.DEBUG):
+      LOGGER.debug("Subtitle SN: %s EBN: %s CS: %s SGN: %s JC: %s VP: %s", tti.SN, tti.EBN, tti.CS, tti.SGN, tti.JC, tti.VP)
+
+    if _is_user_data_ebn(tti.EBN):
       # skip user data and reserved blocks
       return
 
     if not self.is_in_extension:
-      self.tti_tf = b''
+      self.tti_tf_parts.clear()
 
-    self.tti_tf += tti.TF.strip(b'\x8f')
-
-    is_double_height_characters = tf.has_double_height_char(self.tti_tf)
+    self.tti_tf_parts.append(tti.TF.strip(b'\x8f'))
 
     # continue accumulating if we have an extension block
 
@@ -458,6 +478,10 @@ def process_tti_block(self, tti_block: bytes):
 
     self.is_in_extension = False
 
+    self.tti_tf = b''.join(self.tti_tf_parts)
+
+    is_double_height_characters = tf.has_double_height_char(self.tti_tf)
+
     # read TCI and TCO
     try:
       tci = SmpteTimeCode(tti.TCIh, tti.TCIm, tti.TCIs, tti.TCIf, self.get_fps())
@@ -466,8 +490,7 @@ def process_tti_block(self, tti_block: bytes):
       LOGGER.error("Invalid TTI timecode")
       return
 
-    LOGGER.debug("  Time in: %s", tci)
-    LOGGER.debug("  Time out: %s", tco)
+    LOGGER.debug("  Time in: %s Time out: %s", tci, tco)
 
     # compute begin and end time, including program start offset
     begin_time = tci.to_temporal_offset() - self.start_offset
@@ -26,7 +26,7 @@
 """Decoder for the ISO 6937 character set"""
 
 import codecs
-import io
+import re
 
 # from https://bugs.python.org/file45750/iso6937.py
 _CCT0_DECODE_MAP = {
@@ -307,36 +307,80 @@
     b'\xcfz': '\u017E',  # ž
 }
 
+# bytes that are combined with the following byte to form a single character
+_DIACRITIC_RE = re.compile(b'[\xc1-\xcf]')
+
+# charmap decoding table of single-byte characters, where U+FFFE marks undefined characters
+_DECODING_TABLE = ''.join(
+  chr(b) if 0x20 <= b <= 0x7E else _CCT0_DECODE_MAP.get(bytes((b,)), '\uFFFE') for b in range(256)
+)
+
+_PAIR_DECODE_MAP = {k: v for k, v in _CCT0_DECODE_MAP.items() if len(k) == 2}
+
+def _decode(byte_buffer, errors: str, final: bool):
+  """Decodes the characters of `byte_buffer` and returns the decoded string and the number of bytes consumed.
+  Unless `final` is `True`, a trailing diacritical mark is not consumed since it combines with the next byte.
+  """
+
+  chunks = []
+  length = len(byte_buffer)
+  i = 0
+
+  while i < length:
+    m = _DIACRITIC_RE.search(byte_buffer, i)
+    j = length if m is None else m.start()
+
+    # runs of single-byte characters, including plain ASCII, are decoded at once
+    if j > i:
+      try:
+        chunks.append(codecs.charmap_decode(byte_buffer[i:j], errors, _DECODING_TABLE)[0])
+      except UnicodeDecodeError as e:
+        raise UnicodeDecodeError("iso6937", bytes(byte_buffer), i + e.start, i + e.end, e.reason) from None
+
+    if j == length:
+      i = length
+      break
+
+    if j + 1 == length and not final:
+      i = j
+      break
+
+    end = min(j + 2, length)
+    c = _PAIR_DECODE_MAP.get(bytes(byte_buffer[j:end]))
+    if c is None:
+      b = bytes(byte_buffer[j:end])
+      c, end = codecs.lookup_error(errors)(
+        UnicodeDecodeError("iso6937", bytes(byte_buffer), j, end, f"Unknown character sequence: {str(b)}")
+      )
+    chunks.append(c)
+    i = end
+
+  return ("".join(chunks), i)
+
 def decode(byte_buffer: bytes, errors="strict"):
   """Decodes `byte_buffer` to a string according to ISO 6937 character set and returns it.
   """
 
-  # pylint: disable=unused-argument
-  handler = codecs.lookup_error(errors)
-  s = io.StringIO()
+  return _decode(byte_buffer, errors, True)
 
-  i = 0
-  while i < len(byte_buffer):
-    if 0x20 <= int(byte_buffer[i]) <= 0x7E:
-      s.write(chr(byte_buffer[i]))
-      i += 1
-    elif 0xC1 <= int(byte_buffer[i]) <= 0xCF:
-      b = bytes(byte_buffer[i:i+2])
-      c = _CCT0_DECODE_MAP.get(b)
-      if c is not None:
-        s.write(c)
-      else:
-        s.write("�")
-        handler(UnicodeDecodeError("iso6937", byte_buffer, i, i + 2, f"Unknown character sequence: {str(b)}"))
-      i += 2
-    else:
-      b = bytes(byte_buffer[i:i+1])
-      c = _CCT0_DECODE_MAP.get(b)
-      if c is not None:
-        s.write(c)
-      else:
-        s.write("�")
-        handler(UnicodeDecodeError("iso6937", byte_buffer, i, i + 1, f"Unknown character sequence: {str(b)}"))
-      i += 1
-
-  return (s.getvalue(), len(byte_buffer))
+def _encode(text: str, errors="strict"):
+  raise UnicodeEncodeError("iso6937", text, 0, len(text), "Encoding to ISO 6937 is not supported")
+
+class IncrementalDecoder(codecs.BufferedIncrementalDecoder):
+  """Incremental ISO 6937 decoder"""
+
+  def _buffer_decode(self, input, errors, final): # pylint: disable=redefined-builtin
+    return _decode(input, errors, final)
+
+def _search_codec(name: str):
+  if name not in ("iso6937", "iso_6937"):
+    return None
+
+  return codecs.CodecInfo(
+    name="iso6937",
+    encode=_encode,
+    decode=decode,
+    incrementaldecoder=IncrementalDecoder
+  )
+
+codecs.register(_search_codec)
@@ -28,11 +28,12 @@
 from __future__ import annotations
 
 import typing
-import itertools
 import logging
 
+from ttconv.limits import ResourceLimits
 from ttconv.stl.config import STLReaderConfiguration
 from ttconv.stl.datafile import DataFile
+from ttconv.utils import FileOrPath, open_binary
 
 LOGGER = logging.getLogger(__name__)
 
@@ -52,19 +53,27 @@ def to_model(data_file: typing.IO, config: typing.Optional[STLReaderConfiguratio
     max_row_count=None if config is None else config.max_row_count
     )
 
-  for i in itertools.count():
+  try:
+    m.process_tti_blocks(data_file.read(), progress_callback)
+  except:
+    LOGGER.error("Bad TTI block")
+    raise
 
-    buf = data_file.read(128)
+  return m.get_document()
 
-    if not buf:
-      break
+def to_model_from_file(
+  file: FileOrPath,
+  config: typing.Optional[STLReaderConfiguration] = None,
+  progress_callback=lambda _: None,
+  limits: typing.Optional[ResourceLimits] = None
+  ):
+  """Converts the STL document read from `file`, which is a path or a binary file object, to the data model. If
+  specified, `limits.max_elements` is checked against the converted document."""
 
-    try:
-      m.process_tti_block(buf)
-    except:
-      LOGGER.error("Bad TTI block")
-      raise
-    
-    progress_callback(i/m.get_tti_count())
+  with open_binary(file) as f:
+    doc = to_model(f, config, progress_callback)
 
-  return m.get_document()
+  if doc is not None and limits is not None:
+    limits.check_document(doc)
+
+  return doc
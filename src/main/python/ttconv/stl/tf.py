@@ -35,7 +35,7 @@
 LOGGER = logging.getLogger(__name__)
 
 _CHAR_DECODER_MAP = {
-  b'00': iso6937.decode,
+  b'00': codecs.getdecoder("iso6937"),
   b'01': codecs.getdecoder("iso8859_5"),
   b'02' : codecs.getdecoder("iso8859_6"),
   b'03': codecs.getdecoder("iso8859_7"),
@@ -176,7 +176,7 @@ def start_span(self):
       if self.get_underline():
         self.span.set_style(
           styles.StyleProperties.TextDecoration,
-          styles.TextDecorationType(underline=True)
+          styles.UNDERLINE_TEXT_DECORATION
         )
 
       if self.get_italic():
@@ -271,6 +271,9 @@ class TextDecorationType:
   line_through: typing.Optional[bool] = None
   overline: typing.Optional[bool] = None
 
+# shared by all elements that are underlined, rather than created for each element
+UNDERLINE_TEXT_DECORATION = TextDecorationType(underline=True)
+
 
 @dataclass(frozen=True)
 class TextEmphasisType:
@@ -25,44 +25,47 @@
 
 '''ttconv tt'''
 
+import contextlib
+import dataclasses
+import io
 import json
 import logging
-import os
 import sys
 import typing
-import xml.etree.ElementTree as et
 from argparse import ArgumentParser
 from enum import Enum
-from pathlib import Path
-from ttconv.filters.document_filter import DocumentFilter
-
-import ttconv.imsc.reader as imsc_reader
-import ttconv.imsc.writer as imsc_writer
-import ttconv.scc.reader as scc_reader
-import ttconv.scc.writer as scc_writer
-import ttconv.srt.writer as srt_writer
-import ttconv.srt.reader as srt_reader
-import ttconv.stl.reader as stl_reader
-import ttconv.vtt.reader as vtt_reader
-from ttconv.vtt.config import VTTWriterConfiguration
-import ttconv.vtt.writer as vtt_writer
+
+import ttconv.formats as formats
+from ttconv.cancellation import CancellationToken, ConversionCancelledError
 from ttconv.config import GeneralConfiguration
 from ttconv.config import ModuleConfiguration
-from ttconv.imsc.config import IMSCWriterConfiguration
-from ttconv.isd import ISDConfiguration
-from ttconv.scc.config import SccReaderConfiguration, SccWriterConfiguration
-from ttconv.stl.config import STLReaderConfiguration
-from ttconv.srt.config import SRTReaderConfiguration, SRTWriterConfiguration
+from ttconv.limits import ResourceLimits, ResourceLimitExceededError
 
 LOGGER = logging.getLogger("ttconv")
 
-CONFIGURATIONS = [
-  GeneralConfiguration,
-  IMSCWriterConfiguration,
-  ISDConfiguration,
-  SccReaderConfiguration,
-  SRTReaderConfiguration,
-]
+STDIO = "-"
+'''Path that designates standard input (`--input`) or standard output (`--output`)'''
+
+def _get_configurations() -> typing.List[ModuleConfiguration]:
+  # pylint: disable=import-outside-toplevel
+  from ttconv.cache import DocumentCacheConfiguration
+  from ttconv.isd import ISDConfiguration
+
+  configurations = [GeneralConfiguration, DocumentCacheConfiguration, ISDConfiguration, ResourceLimits]
+
+  for file_format in formats.builtin_formats():
+    for config_class in (file_format.load_reader_config(), file_format.load_writer_config()):
+      if config_class is not None:
+        configurations.append(config_class)
+
+  return configurations
+
+def __getattr__(name: str):
+  # CONFIGURATIONS is computed on first use since it requires all readers and writers to be imported
+  if name == "CONFIGURATIONS":
+    return _get_configurations()
+
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ProgressConsoleHandler(logging.StreamHandler):
@@ -138,7 +141,7 @@ def progress_str(progress_type: ProgressConsoleHandler.ProgressType, percent_pro
       if is_progress_bar_record:
         self.is_writing_progress_bar = True
         if percent_progress is not None and float(percent_progress) >= 1.0:
-          sys.stdout.write('\r\n')
+          stream.write('\r\n')
           self.is_writing_progress_bar = False
 
       self.flush()
@@ -201,6 +204,24 @@ def get_file_type(file_type: str, file_extension: str):
     return FileTypes(file_type.lower())
 
 
+def get_file_format(file_type: typing.Optional[str], file_extension: typing.Optional[str]) -> typing.Optional[formats.FileFormat]:
+  """Returns the format named `file_type`, or, if `file_type` is `None`, the format that uses the
+  file name extension `file_extension`. Raises `ValueError` if there is no such format."""
+
+  if file_type is None and file_extension is None:
+    return None
+
+  if file_type is not None:
+    file_format = formats.get_format(file_type)
+  else:
+    file_format = formats.get_format_by_extension(file_extension)
+
+  if file_format is None:
+    raise ValueError(f"{file_type if file_type is not None else file_extension!r} is not a known file type")
+
+  return file_format
+
+
 def read_config_from_json(config_class, json_data) -> typing.Optional[ModuleConfiguration]:
   """Returns a requested configuration from json data"""
   if config_class is None or json_data is None:
@@ -252,6 +273,7 @@ def decorator(func):
     for arg in args:
       parser.add_argument(*arg[0], **arg[1])
     parser.set_defaults(func=func)
+    return func
 
   if args is None:
     args = []
@@ -259,11 +281,13 @@ def decorator(func):
 
 
 @subcommand([
-  argument("-i", "--input", help="Input file path", required=True),
-  argument("-o", "--output", help="Output file path", required=True),
+  argument("-i", "--input", help="Input file path, or - to read from standard input", required=True),
+  argument("-o", "--output", help="Output file path, or - to write to standard output", required=True),
   argument("--itype", help="Input file type", required=False),
   argument("--otype", help="Output file type", required=False),
   argument("--filter", action="append", help="Document filter", required=False, default=[]),
+  argument("--begin", help="Begin of the conversion window, in seconds. Overrides the isd configuration.", required=False),
+  argument("--end", help="End of the conversion window, in seconds. Overrides the isd configuration.", required=False),
   argument("--config", help="Configuration in json. Overridden by --config_file.", required=False),
   argument("--config_file", help="Configuration file. Overrides --config.", required=False)
 ])
@@ -293,72 +317,55 @@ def convert(args):
     if general_config.log_level is not None:
       LOGGER.setLevel(general_config.log_level)
 
+  #
+  # Abort the conversion at the first progress point after the timeout, if any
+  #
+  token = CancellationToken(general_config.timeout if general_config is not None else None)
+
+  #
+  # Resource limits are passed to readers and writers only if specified, since readers and writers provided by other
+  # packages might not support them
+  #
+  limits = read_config_from_json(ResourceLimits, json_config_data)
+
+  limits_kwargs = {"limits": limits} if limits is not None else {}
+
   LOGGER.info("Input file is %s", inputfile)
   LOGGER.info("Output file is %s", outputfile)
 
-  _input_filename, input_file_extension = os.path.splitext(inputfile)
-  _output_filename, output_file_extension = os.path.splitext(outputfile)
-
-  reader_type = FileTypes.get_file_type(args.itype, input_file_extension)
-  writer_type = FileTypes.get_file_type(args.otype, output_file_extension)
-
-  if reader_type is FileTypes.TTML:
-    # 
-    # Parse the xml input file into an ElementTree
-    #
-    tree = et.parse(inputfile)
-
-    #
-    # Pass the parsed xml to the reader
-    #
-    model = imsc_reader.to_model(tree, progress_callback_read)
-
-  elif reader_type is FileTypes.SCC:
-    file_as_str = Path(inputfile).read_text()
-
-    #
-    # Read the config
-    #
-    reader_config = read_config_from_json(SccReaderConfiguration, json_config_data)
-
-    #
-    # Pass the parsed xml to the reader
-    #
-    model = scc_reader.to_model(file_as_str, reader_config, progress_callback_read)
-
-  elif reader_type is FileTypes.STL:
-    #
-    # Read the config
-    #
-    reader_config = read_config_from_json(STLReaderConfiguration, json_config_data)
-
-    #
-    # Open the file and pass it to the reader
-    #
-    with open(inputfile, "rb") as f:
-      model = stl_reader.to_model(f, reader_config, progress_callback_read)
-
-  elif reader_type is FileTypes.SRT:
-    #
-    # Read the config
-    #
-    reader_config = read_config_from_json(SRTReaderConfiguration, json_config_data)
-
-    #
-    # Open the file and pass it to the reader
-    #
-    with open(inputfile, "r", encoding="utf-8") as f:
-      model = srt_reader.to_model(f, reader_config, progress_callback_read)
-
-  elif reader_type is FileTypes.VTT:
-
-    #
-    # Open the file and pass it to the reader
-    #
-    with open(inputfile, "r", encoding="utf-8") as f:
-      model = vtt_reader.to_model(f, None, progress_callback_read)
+  #
+  # The input and output types cannot be inferred from standard input and output
+  #
+  if inputfile == STDIO and args.itype is None:
+    die("The input type (--itype) must be specified when reading from standard input")
+
+  if outputfile == STDIO and args.otype is None:
+    die("The output type (--otype) must be specified when writing to standard output")
 
+  #
+  # Compressed files and archive members are decompressed and compressed as they are read and written
+  #
+  import ttconv.archive as archive  # pylint: disable=import-outside-toplevel
+
+  if inputfile == STDIO:
+    input_context = contextlib.nullcontext(sys.stdin.buffer)
   else:
+    input_context = archive.open_source(inputfile)
+
+  if outputfile == STDIO:
+    output_context = contextlib.nullcontext(sys.stdout.buffer)
+  else:
+    output_context = archive.open_target(outputfile)
+
+  input_file_extension = archive.content_extension(inputfile)
+  output_file_extension = archive.content_extension(outputfile)
+
+  reader_format = get_file_format(args.itype, input_file_extension)
+  writer_format = get_file_format(args.otype, output_file_extension)
+
+  reader = reader_format.load_reader() if reader_format is not None else None
+
+  if reader is None:
     if args.itype is not None:
       exit_str = f'Input type {args.itype} is not supported'
     else:
@@ -366,12 +373,85 @@ def convert(args):
 
     die(exit_str)
 
+  writer = writer_format.load_writer() if writer_format is not None else None
+
+  if writer is None:
+    if args.otype is not None:
+      exit_str = f'Output type {args.otype} is not supported'
+    else:
+      exit_str = f'Output file is {args.output} is not supported'
+
+    die(exit_str)
+
+  writer_config = read_config_from_json(writer_format.load_writer_config(), json_config_data)
+
+  #
+  # Segmented WebVTT output consists of several files, which are named after the output file
+  #
+  if writer_format.name == "vtt" and getattr(writer_config, "segment_duration", None) is not None \
+    and (outputfile == STDIO or not archive.is_plain_path(outputfile)):
+    die("Segmented WebVTT output (segment_duration) must be written to a file")
+
+  #
+  # Look up the input document in the document cache, if any, using the reader type and configuration
+  #
+  document_cache = None
+  cache_key = None
+  model = None
+
+  with input_context as input_source:
+
+    if json_config_data is not None and "document_cache" in json_config_data:
+      # pylint: disable=import-outside-toplevel
+      from ttconv.cache import DocumentCache, DocumentCacheConfiguration
+
+      document_cache_config = read_config_from_json(DocumentCacheConfiguration, json_config_data)
+
+      if document_cache_config is not None and document_cache_config.directory is not None:
+        document_cache = DocumentCache(document_cache_config.directory, document_cache_config.max_size)
+
+        reader_json_config = json_config_data.get(f"{reader_format.name}_reader")
+
+        if input_source is inputfile:
+          with open(inputfile, "rb") as f:
+            cache_key = DocumentCache.make_key(f, reader_format.name, json.dumps(reader_json_config, sort_keys=True))
+        else:
+          # standard input and decompressed streams cannot be read twice, so they are buffered
+          input_source = io.BytesIO(input_source.read())
+          cache_key = DocumentCache.make_key(input_source, reader_format.name, json.dumps(reader_json_config, sort_keys=True))
+          input_source.seek(0)
+
+        model = document_cache.get(cache_key)
+
+    is_cached = model is not None
+
+    if is_cached:
+      LOGGER.info("Input document read from the document cache")
+
+      # the reader, which enforces the limits, is not called
+      if limits is not None:
+        limits.check_document(model)
+
+    else:
+      #
+      # Read the config
+      #
+      reader_config = read_config_from_json(reader_format.load_reader_config(), json_config_data)
+
+      #
+      # Pass the input file to the reader
+      #
+      model = reader(input_source, reader_config, token.wrap(progress_callback_read), **limits_kwargs)
+
   #
   # handle the case where the input file could not be read into the model
   #
   if model is None:
     die("Aborting due to invalid input file contents.")
 
+  if document_cache is not None and not is_cached:
+    document_cache.put(cache_key, model)
+
   #
   # apply document language
   #
@@ -382,7 +462,13 @@ def convert(args):
   # apply document filter
   #
 
+  if len(args.filter) > 0:
+    # pylint: disable=import-outside-toplevel
+    from ttconv.filters.document_filter import DocumentFilter
+
   for filter_name in args.filter:
+    token.check()
+
     doc_filter_class = DocumentFilter.get_filter_by_name(filter_name)
 
     if doc_filter_class is None:
@@ -398,83 +484,119 @@ def convert(args):
     doc_filter.process(model)
 
   #
-  # Write the output document
+  # Read the conversion window
   #
-  if writer_type is FileTypes.TTML:
-    #
-    # Read the config
-    #
-    writer_config = read_config_from_json(IMSCWriterConfiguration, json_config_data)
-
-    #
-    # Construct and configure the writer
-    #
-    tree_from_model = imsc_writer.from_model(model, writer_config, progress_callback_write)
-
-    #
-    # Write out the converted file
-    #
-    tree_from_model.write(outputfile, encoding="utf-8")
-
-  elif writer_type is FileTypes.SRT:
-    #
-    # Read the config
-    #
-    writer_config = read_config_from_json(SRTWriterConfiguration, json_config_data)
-
-    #
-    # Construct and configure the writer
-    #
-    srt_document = srt_writer.from_model(model, writer_config, progress_callback_write)
-
-    #
-    # Write out the converted file
-    #
-    with open(outputfile, "w", encoding="utf-8") as srt_file:
-      srt_file.write(srt_document)
-
-  elif writer_type is FileTypes.VTT:
-    #
-    # Read the config
-    #
-    writer_config = read_config_from_json(VTTWriterConfiguration, json_config_data)
-
-    #
-    # Construct and configure the writer
-    #
-    vtt_document = vtt_writer.from_model(model, writer_config, progress_callback_write)
-
-    #
-    # Write out the converted file
-    #
-    with open(outputfile, "w", encoding="utf-8") as vtt_file:
-      vtt_file.write(vtt_document)
-
-  elif writer_type is FileTypes.SCC:
-    #
-    # Read the config
-    #
-    writer_config = read_config_from_json(SccWriterConfiguration, json_config_data)
-
-    #
-    # Construct and configure the writer
-    #
-    scc_document = scc_writer.from_model(model, writer_config, progress_callback_write)
-
-    #
-    # Write out the converted file
-    #
-    with open(outputfile, "w", encoding="utf-8") as scc_file:
-      scc_file.write(scc_document)
+  from ttconv.isd import ISDConfiguration  # pylint: disable=import-outside-toplevel
 
+  isd_config = read_config_from_json(ISDConfiguration, json_config_data) or ISDConfiguration()
 
-  else:
-    if args.otype is not None:
-      exit_str = f'Output type {args.otype} is not supported'
-    else:
-      exit_str = f'Output file is {args.output} is not supported'
+  if args.begin is not None or args.end is not None:
+    # the options override the window of the configuration, whose other settings are retained
+    decoders = {field.name: field.metadata.get("decoder") for field in dataclasses.fields(ISDConfiguration)}
+    isd_config = dataclasses.replace(
+      isd_config,
+      begin=decoders["begin"](args.begin) if args.begin is not None else isd_config.begin,
+      end=decoders["end"](args.end) if args.end is not None else isd_config.end
+    )
 
-    die(exit_str)
+  #
+  # Write out the converted file
+  #
+  token.check()
+
+  # the writers remove the files they write if they do not complete
+  with output_context as output_target:
+    writer(model, output_target, writer_config, token.wrap(progress_callback_write), isd_config, **limits_kwargs)
+
+    if output_target is not outputfile:
+      output_target.flush()
+
+
+@subcommand([
+  argument("-i", "--input", nargs="+", help="Input files, directories or archives", required=True),
+  argument("-o", "--output", help="Output directory", required=True),
+  argument("--itype", help="Input file type. Only files of this type are read from directories and archives.",
+    required=False),
+  argument("--otype", help="Output file type", required=True),
+  argument("--filter", action="append", help="Document filter", required=False, default=[]),
+  argument("--begin", help="Begin of the conversion window, in seconds. Overrides the isd configuration.", required=False),
+  argument("--end", help="End of the conversion window, in seconds. Overrides the isd configuration.", required=False),
+  argument("--config", help="Configuration in json. Overridden by --config_file.", required=False),
+  argument("--config_file", help="Configuration file. Overrides --config.", required=False),
+  argument("--manifest", help="Manifest file. Defaults to .ttconv-manifest.json in the output directory.",
+    required=False),
+  argument("--workers", help="Number of worker processes. Defaults to the number of CPUs.", type=int, required=False),
+  argument("--force", help="Convert all documents, including those that are up to date", action="store_true")
+])
+def batch(args):
+  '''Convert the documents that changed since the last run'''
+
+  # pylint: disable=import-outside-toplevel
+  import ttconv.batch
+
+  config = args.config
+
+  if args.config_file is not None:
+    with open(args.config_file) as json_file:
+      config = json_file.read()
+
+  try:
+    result = ttconv.batch.build(
+      inputs=args.input,
+      output_dir=args.output,
+      otype=args.otype,
+      itype=args.itype,
+      filters=args.filter,
+      begin=args.begin,
+      end=args.end,
+      config=config,
+      manifest_path=args.manifest,
+      workers=args.workers,
+      force=args.force
+    )
+  except ValueError as e:
+    die(str(e))
+
+  LOGGER.info(
+    "%d document(s) converted, %d document(s) up to date, %d document(s) failed",
+    len(result.converted), len(result.skipped), len(result.failed)
+  )
+
+  if len(result.failed) > 0:
+    die(f"{len(result.failed)} document(s) could not be converted")
+
+
+@subcommand([
+  argument("--host", help="Address to listen on", required=False, default="127.0.0.1"),
+  argument("--port", help="Port to listen on", type=int, required=False, default=8620),
+  argument("--unix_socket", help="Unix socket path to listen on. Overrides --host and --port.", required=False),
+  argument("--workers", help="Number of worker processes. Defaults to the number of CPUs.", type=int, required=False),
+  argument("--max_pending", help="Maximum number of pending requests. Defaults to twice the number of workers.",
+    type=int, required=False),
+  argument("--max_input_size", help="Maximum size of an input document, in bytes", type=int, required=False,
+    default=64 * 1024 * 1024),
+  argument("--timeout", help="Maximum duration of a conversion, in seconds", type=float, required=False)
+])
+def serve(args):
+  '''Process conversion requests received over HTTP until interrupted'''
+
+  # pylint: disable=import-outside-toplevel
+  import ttconv.server
+
+  progress.display_progress_bar = False
+
+  try:
+    ttconv.server.serve(
+      host=args.host,
+      port=args.port,
+      unix_socket=args.unix_socket,
+      workers=args.workers,
+      max_pending=args.max_pending,
+      max_input_size=args.max_input_size,
+      timeout=args.timeout
+    )
+  except (OSError, ValueError) as e:
+    die(str(e))
 
 
 # Ensure that the handler is added only once/globally
@@ -491,7 +613,10 @@ def main(argv=None):
   if args.subcommand is None:
     cli.print_help()
   else:
-    args.func(args)
+    try:
+      args.func(args)
+    except (ConversionCancelledError, ResourceLimitExceededError) as e:
+      die(str(e))
 
 
 if __name__ == "__main__":
@@ -25,7 +25,12 @@
 
 '''Common utilities'''
 
+import contextlib
+import functools
+import io
+import os
 import re
+import stat
 import typing
 from fractions import Fraction
 import ttconv.style_properties as styles
@@ -34,8 +39,10 @@
 _DEC_COLOR_RE = re.compile(r"rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)")
 _DEC_COLORA_RE = re.compile(r"rgba\(\s*(\d+),\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)")
 
+@functools.lru_cache(maxsize=256)
 def parse_color(attr_value: str) -> styles.ColorType:
-  '''Parses the TTML \\<color\\> value contained in `attr_value`
+  '''Parses the TTML \\<color\\> value contained in `attr_value`. Since `styles.ColorType` is immutable, the same
+  instance is returned for recurring values.
   '''
 
   def _parse_color_component(value: str) -> int:
@@ -92,6 +99,91 @@ def _parse_color_component(value: str) -> int:
   raise ValueError("Bad Syntax")
 
 
+def _stream_size(stream: typing.IO) -> typing.Optional[int]:
+  # the size of the underlying file of other streams, e.g. decompressors, is not the size of the stream
+  if isinstance(stream, (io.FileIO, io.BufferedReader, io.BufferedRandom)):
+    try:
+      st = os.fstat(stream.fileno())
+      return st.st_size if stat.S_ISREG(st.st_mode) else None
+    except (AttributeError, OSError, ValueError):
+      pass
+
+  if isinstance(stream, io.StringIO):
+    return len(stream.getvalue())
+
+  if isinstance(stream, io.BytesIO):
+    return len(stream.getbuffer())
+
+  return None
+
+def stream_progress(stream: typing.IO) -> typing.Callable[[int], typing.Optional[float]]:
+  '''Returns a function that estimates the fraction of `stream` consumed so far from the number of characters, or
+  bytes, consumed so far, or returns `None` if the size of `stream` is not known, e.g. when reading from a pipe. The
+  position of the stream is not used since it reflects the data read ahead by the buffers of the stream, which can
+  hold a small file in its entirety.
+  '''
+
+  size = _stream_size(getattr(stream, "buffer", stream))
+
+  if size is None or size == 0:
+    return lambda _: None
+
+  def _progress(consumed: int) -> typing.Optional[float]:
+    return min(consumed / size, 1)
+
+  return _progress
+
+
+FileOrPath = typing.Union[str, os.PathLike, typing.BinaryIO]
+'''A file path or a binary file object, e.g. `sys.stdin.buffer`'''
+
+@contextlib.contextmanager
+def _open_path(path: typing.Union[str, os.PathLike], mode: str, **kwargs) -> typing.Iterator[typing.IO]:
+  f = open(path, mode, **kwargs)  # pylint: disable=consider-using-with,unspecified-encoding
+
+  try:
+    with f:
+      yield f
+  except BaseException:
+    # do not leave a truncated output file behind: the file was created or truncated when it was opened
+    if not mode.startswith("r") and os.path.exists(path):
+      os.remove(path)
+    raise
+
+@contextlib.contextmanager
+def open_text(file: FileOrPath, mode: str = "r", encoding: typing.Optional[str] = "utf-8") -> typing.Iterator[typing.TextIO]:
+  '''Opens `file`, which is either a path or a binary file object, for reading (`mode` is `r`) or writing (`mode` is
+  `w`) text. A binary file object is not closed on exit, and a text stream is read from it as it is consumed. A file
+  opened for writing at a path is removed if an exception is raised.'''
+
+  if isinstance(file, (str, os.PathLike)):
+    with _open_path(file, mode, encoding=encoding) as text_file:
+      yield text_file
+    return
+
+  text_file = io.TextIOWrapper(file, encoding=encoding, write_through=True)
+
+  try:
+    yield text_file
+  finally:
+    if mode != "r":
+      text_file.flush()
+    text_file.detach()
+
+@contextlib.contextmanager
+def open_binary(file: FileOrPath, mode: str = "r") -> typing.Iterator[typing.BinaryIO]:
+  '''Opens `file`, which is either a path or a binary file object, for reading (`mode` is `r`) or writing (`mode` is
+  `w`) bytes. A binary file object is not closed on exit. A file opened for writing at a path is removed if an exception
+  is raised.'''
+
+  if isinstance(file, (str, os.PathLike)):
+    with _open_path(file, mode + "b") as binary_file:
+      yield binary_file
+    return
+
+  yield file
+
+
 class DisjointIntervals:
   """A set of disjoint intervals"""
 
@@ -200,3 +292,21 @@ def __len__(self):
 
   def __iter__(self):
     return iter(self._intervals)
+
+@functools.lru_cache(maxsize=None)
+def ttconv_version() -> str:
+  '''Returns the version of the installed ttconv package, or `unknown`'''
+
+  try:
+    import importlib.metadata as metadata  # pylint: disable=import-outside-toplevel
+  except ImportError:
+    # Python 3.7
+    try:
+      import importlib_metadata as metadata  # pylint: disable=import-outside-toplevel
+    except ImportError:
+      return "unknown"
+
+  try:
+    return metadata.version("ttconv")
+  except metadata.PackageNotFoundError:
+    return "unknown"
@@ -28,8 +28,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from fractions import Fraction
+import typing
+
 from ttconv.config import ModuleConfiguration
 
+# MPEG-2 TS timestamp, i.e. 10 seconds at 90 kHz, to which the local time 00:00:00.000 of each segment is mapped if
+# `timestamp_map_mpegts` is not specified
+DEFAULT_SEGMENT_TIMESTAMP_MAP_MPEGTS = 900000
+
+def _decode_segment_duration(value) -> typing.Optional[Fraction]:
+  if value is None:
+    return None
+
+  duration = Fraction(str(value))
+
+  if duration <= 0:
+    raise ValueError(f"Invalid segment_duration '{value}' value. Expect a positive number of seconds.")
+
+  return duration
+
 @dataclass
 class VTTWriterConfiguration(ModuleConfiguration):
   """VTT writer configuration"""
@@ -46,3 +64,10 @@ def name(cls):
 
   # outputs cue identifier
   cue_id: bool = field(default=True, metadata={"decoder": bool})
+
+  # outputs an `X-TIMESTAMP-MAP` header that maps the local time 00:00:00.000 to the specified MPEG-2 TS timestamp
+  timestamp_map_mpegts: typing.Optional[int] = field(default=None, metadata={"decoder": lambda y: int(y) if y is not None else None})
+
+  # splits the output into segments of the specified duration, in seconds, each of which has an `X-TIMESTAMP-MAP`
+  # header, which uses `DEFAULT_SEGMENT_TIMESTAMP_MAP_MPEGTS` if `timestamp_map_mpegts` is not specified
+  segment_duration: typing.Optional[Fraction] = field(default=None, metadata={"decoder": _decode_segment_duration})
@@ -35,6 +35,8 @@
 
 from ttconv import model
 from ttconv import style_properties as styles
+from ttconv.limits import ResourceLimits
+from ttconv.utils import FileOrPath, open_text, stream_progress
 from ttconv.vtt.tokenizer import EndTagToken, StartTagToken, StringToken, CueTextTokenizer, TimestampTagToken, Token
 
 LOGGER = logging.getLogger(__name__)
@@ -44,6 +46,28 @@ def _none_terminated(iterator):
     yield item
   yield None
 
+def _iter_lines(data_file: typing.Iterable[str]):
+  """Yields the lines of `data_file`, which are separated by CRLF, LF or CR, after replacing NULL characters.
+  See https://www.w3.org/TR/webvtt1/#file-parsing"""
+  ends_with_newline = True
+
+  for chunk in data_file:
+    chunk = chunk.replace("\u0000", "\uFFFD")
+
+    ends_with_newline = chunk.endswith(("\u000A", "\u000D"))
+
+    if chunk.endswith("\u000A"):
+      chunk = chunk[:-1]
+
+    if chunk.endswith("\u000D"):
+      chunk = chunk[:-1]
+
+    yield from chunk.split("\u000D")
+
+  # as with str.split(), a trailing newline results in a trailing empty line
+  if ends_with_newline:
+    yield ""
+
 def _parse_cue_text(cue_text: str, paragraph: model.P, line_number: int):
   parser = _TextCueParser(paragraph, line_number)
 
@@ -134,7 +158,7 @@ def _handle_starttag(self, token: StartTagToken):
       span.set_style(styles.StyleProperties.FontStyle, styles.FontStyleType.italic)
 
     elif tag.startswith("u"):
-      span.set_style(styles.StyleProperties.TextDecoration, styles.TextDecorationType(underline=True))
+      span.set_style(styles.StyleProperties.TextDecoration, styles.UNDERLINE_TEXT_DECORATION)
 
     elif tag.startswith("lang"):
       try:
@@ -531,21 +555,24 @@ class _State(Enum):
     NOTE = 6
     STYLE = 7
 
-  # see https://www.w3.org/TR/webvtt1/#file-parsing
-  lines = data_file.read().replace("\u0000", "\uFFFD") \
-                          .replace("\u000D\u000A", "\u000A") \
-                          .replace("\u000D", "\u000A") \
-                          .split("\u000A")
+  progress = stream_progress(data_file)
+  consumed = 0
+
+  def _iter_chunks():
+    nonlocal consumed
+    for chunk in data_file:
+      consumed += len(chunk)
+      yield chunk
 
   state = _State.START
   doc = None              # output document
   div = None              # div into which cues will be inserted as p's
   current_p = None        # current p
 
-  for line_index, line in enumerate(_none_terminated(lines)):
+  for line_index, line in enumerate(_none_terminated(_iter_lines(_iter_chunks()))):
 
     if state is _State.START:
-      if not _VTT_FIRST_LINE_RE.fullmatch(line):
+      if line is None or not _VTT_FIRST_LINE_RE.fullmatch(line):
         LOGGER.error("The first line of the file does not start with WEBVTT")
         break
       doc = model.ContentDocument()
@@ -582,7 +609,9 @@ class _State(Enum):
         # skip over cue id
         continue
 
-      progress_callback(line_index/len(lines))
+      progress_value = progress(consumed)
+      if progress_value is not None:
+        progress_callback(progress_value)
 
       cue_params = line.split()
 
@@ -642,3 +671,21 @@ class _State(Enum):
       continue
 
   return doc
+
+def to_model_from_file(
+  file: FileOrPath,
+  _config = None,
+  progress_callback=lambda _: None,
+  limits: typing.Optional[ResourceLimits] = None
+  ) -> typing.Optional[model.ContentDocument]:
+  """Converts the WebVTT document read from `file`, which is a path or a binary file object, to the data model.
+  The document is read as it is converted. Returns `None` if the document does not start with the correct WebVTT
+  file signature. If specified, `limits.max_elements` is checked against the converted document."""
+
+  with open_text(file) as f:
+    doc = to_model(f, None, progress_callback)
+
+  if doc is not None and limits is not None:
+    limits.check_document(doc)
+
+  return doc
@@ -28,7 +28,7 @@
 from typing import Dict, Optional
 
 from ttconv.model import ContentElement
-from ttconv.style_properties import FontWeightType, StyleProperties, FontStyleType, TextDecorationType
+from ttconv.style_properties import ColorType, FontWeightType, StyleProperties, FontStyleType, TextDecorationType
 
 BOLD_TAG_IN = "<b>"
 BOLD_TAG_OUT = "</b>"
@@ -85,6 +85,11 @@ def is_element_underlined(element: ContentElement) -> bool:
   return text_decoration is not None and text_decoration.underline is True
 
 
+def to_hex_color(color: ColorType) -> str:
+  """Returns the hex code of a color"""
+  (r, g, b, a) = color.components
+  return "#{:02x}{:02x}{:02x}{:02x}".format(r, g, b, a)
+
 def get_color(element: ContentElement) -> Optional[str]:
   """Returns the text color hex code if present"""
   color = element.get_style(StyleProperties.Color)
@@ -92,8 +97,7 @@ def get_color(element: ContentElement) -> Optional[str]:
   if color is None:
     return None
 
-  (r, g, b, a) = color.components
-  return "#{:02x}{:02x}{:02x}{:02x}".format(r, g, b, a)
+  return to_hex_color(color)
 
 def get_background_color(element: ContentElement) -> Optional[str]:
   """Returns the background color hex code"""
@@ -102,8 +106,7 @@ def get_background_color(element: ContentElement) -> Optional[str]:
   if background_color is None:
     return None
 
-  (r, g, b, a) = background_color.components
-  return "#{:02x}{:02x}{:02x}{:02x}".format(r, g, b, a)
+  return to_hex_color(background_color)
   
 
 def get_color_classname(color_value: str):
@@ -26,29 +26,10 @@
 """WebVTT Cue Text tokenizer. See https://www.w3.org/TR/webvtt1/#webvtt-cue-text-tokenizer"""
 
 from __future__ import annotations
-from enum import Enum
 import re
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import html
 
-class StringBuf:
-  """Simple class that allows a string to be built from the concatenation of
-  multiple strings, starting with an initial string."""
-  def __init__(self, initial_value: str = None) -> None:
-    self.buf: List[str] = [initial_value] if initial_value is not None else []
-
-  def append(self, s: str) -> None:
-    self.buf.append(s)
-
-  def extend(self, sb: StringBuf) -> None:
-    self.buf.extend(sb.buf)
-
-  def __str__(self) -> str:
-    return "".join(self.buf)
-
-  def is_empty(self) -> bool:
-    return len(self.buf) == 0 or all(map(lambda x: len(x) == 0, self.buf))
-
 class Token:
   """Base class for WebVTT Cue Text tokens."""
   pass
@@ -80,171 +61,138 @@ def __init__(self, timestamp: str = "") -> None:
     self.timestamp = timestamp
 
 
+
+# characters that end a run of text
+_DATA_DELIMITERS_RE = re.compile(r"[&<]")
+
+# characters that end a tag name or class
+_TAG_NAME_DELIMITERS_RE = re.compile(r"[\t\n\f .>]")
+
+# characters that end an annotation
+_ANNOTATION_DELIMITERS_RE = re.compile(r"[&>]")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+def _find_tag_end(cue_text: str, position: int) -> Tuple[int, int]:
+  """Returns the position of the `>` that ends the tag starting at `position` (or the end of
+  `cue_text`) and the position that follows the tag"""
+  end = cue_text.find(">", position)
+  if end < 0:
+    return (len(cue_text), len(cue_text))
+  return (end, end + 1)
+
+def _tokenize_data(cue_text: str, position: int, result: List[str]) -> Tuple[Token, int]:
+  """Data state, where `result` contains the text accumulated so far"""
+  while True:
+    m = _DATA_DELIMITERS_RE.search(cue_text, position)
+
+    if m is None:
+      result.append(cue_text[position:])
+      return (StringToken("".join(result)), len(cue_text))
+
+    i = m.start()
+    result.append(cue_text[position:i])
+
+    if cue_text[i] == "<":
+      if any(result):
+        return (StringToken("".join(result)), i)
+      return _tokenize_tag(cue_text, i + 1)
+
+    # character reference, which extends to the next semicolon (excluded) or the end of the cue text
+    j = cue_text.find(";", i + 1)
+
+    if j < 0:
+      result.append(cue_text[i:])
+      return (StringToken("".join(result)), len(cue_text))
+
+    result.append(html.unescape(cue_text[i:j]))
+    position = j + 1
+
+def _tokenize_tag(cue_text: str, position: int) -> Tuple[Token, int]:
+  """Tag state, where `position` follows the `<` character"""
+  if position >= len(cue_text):
+    return (StringToken(), position)
+
+  c = cue_text[position]
+
+  if c in "\t\n\f ":
+    return _tokenize_annotation(cue_text, position + 1, "", [])
+
+  if c == ".":
+    return _tokenize_classes(cue_text, position + 1, "")
+
+  if c == "/":
+    end, next_position = _find_tag_end(cue_text, position + 1)
+    return (EndTagToken(cue_text[position + 1:end]), next_position)
+
+  if "0" <= c <= "9":
+    end, next_position = _find_tag_end(cue_text, position)
+    return (TimestampTagToken(cue_text[position:end]), next_position)
+
+  if c == ">":
+    return (StringToken(), position + 1)
+
+  m = _TAG_NAME_DELIMITERS_RE.search(cue_text, position + 1)
+
+  if m is None:
+    return (StartTagToken(cue_text[position:]), len(cue_text))
+
+  tag = cue_text[position:m.start()]
+
+  if m.group() == ">":
+    return (StartTagToken(tag), m.end())
+
+  if m.group() == ".":
+    return _tokenize_classes(cue_text, m.end(), tag)
+
+  return _tokenize_annotation(cue_text, m.end(), tag, [])
+
+def _tokenize_classes(cue_text: str, position: int, tag: str) -> Tuple[Token, int]:
+  """Start tag class state"""
+  classes: List[str] = []
+
+  while True:
+    m = _TAG_NAME_DELIMITERS_RE.search(cue_text, position)
+
+    if m is None:
+      classes.append(cue_text[position:])
+      return (StartTagToken(tag, classes), len(cue_text))
+
+    classes.append(cue_text[position:m.start()])
+
+    if m.group() == ">":
+      return (StartTagToken(tag, classes), m.end())
+
+    if m.group() != ".":
+      return _tokenize_annotation(cue_text, m.end(), tag, classes)
+
+    position = m.end()
+
+def _tokenize_annotation(cue_text: str, position: int, tag: str, classes: List[str]) -> Tuple[Token, int]:
+  """Start tag annotation state"""
+  m = _ANNOTATION_DELIMITERS_RE.search(cue_text, position)
+
+  if m is None:
+    return (StartTagToken(tag, classes, _WHITESPACE_RE.sub(" ", cue_text[position:].strip())), len(cue_text))
+
+  if m.group() == "&":
+    # a character reference within an annotation is treated as text that follows the tag name
+    return _tokenize_data(cue_text, m.start(), [tag])
+
+  return (StartTagToken(tag, classes, _WHITESPACE_RE.sub(" ", cue_text[position:m.start()].strip())), m.end())
+
 def CueTextTokenizer(cue_text: str):
   """Generator that outputs a sequence of WebVTT Cue Text tokens from a WebVTT
   Cue Text."""
-  EOF_MARKER = -1
-
-  class _State(Enum):
-    data = 1
-    tag = 2
-    data_cref = 3
-    start_tag = 4
-    start_tag_annot = 5
-    start_tag_class = 6
-    end_tag = 7
-    ts_tag = 8
-    annot_cref = 3
-
-  cue_text: str = cue_text
-  position: int = 0
-
-  # token loop
+
+  if "<" not in cue_text and "&" not in cue_text:
+    # plain text
+    if len(cue_text) > 0:
+      yield StringToken(cue_text)
+    return
+
+  position = 0
+
   while position < len(cue_text):
-    state: _State = _State.data
-    result: StringBuf = StringBuf()
-    classes: List[str] = []
-    buffer: StringBuf = StringBuf()
-
-    # codepoint loop
-    while True:
-      c = ord(cue_text[position]) if position < len(cue_text) else EOF_MARKER
-
-      if state is _State.data:
-        if c == ord("&"):
-          state = _State.data_cref
-          buffer = StringBuf("&")
-        elif c == ord("<"):
-          if result.is_empty():
-            state = _State.tag
-          else:
-            yield StringToken(str(result))
-            break
-        elif c == EOF_MARKER:
-          yield StringToken(str(result))
-          break
-        else:
-          result.append(chr(c))
-
-      elif state is _State.data_cref:
-        if c == ord(";"):
-          coded_entity = str(buffer)
-          decoded_entity = html.unescape(coded_entity)
-          if decoded_entity == coded_entity :
-            result.extend(buffer)
-          else:
-            result.append(decoded_entity)
-          state = _State.data
-        elif c == EOF_MARKER:
-          result.extend(buffer)
-          state = _State.data
-          continue
-        else:
-          buffer.append(chr(c))
-
-      elif state is _State.tag:
-        if c in (0x09, 0x0A, 0x0C, 0x20):
-          state = _State.start_tag_annot
-        elif c == ord("."):
-          state = _State.start_tag_class
-        elif c == ord("/"):
-          state = _State.end_tag
-        elif ord("0") <= c <= ord("9"):
-          result = StringBuf(chr(c))
-          state = _State.ts_tag
-        elif c in (ord(">"), EOF_MARKER):
-          if c == ord(">"):
-            position += 1
-          yield StringToken()
-          break
-        else:
-          result = StringBuf(chr(c))
-          state = _State.start_tag
-
-      elif state is _State.start_tag:
-        if c in (0x09, 0x0C, 0x20):
-          state = _State.start_tag_annot
-        elif c == 0x0A:
-          buffer = StringBuf(chr(c))
-          state = _State.start_tag_annot
-        elif c is ord("."):
-          state = _State.start_tag_class
-        elif c in (ord(">"), EOF_MARKER):
-          if c == ord(">"):
-            position += 1
-          yield StartTagToken(str(result))
-          break
-        else:
-          result.append(chr(c))
-
-      elif state is _State.start_tag_class:
-        if c in (0x09, 0x0C, 0x20):
-          classes.append(str(buffer))
-          buffer = StringBuf()
-          state = _State.start_tag_annot
-        elif c == 0x0A:
-          classes.append(str(buffer))
-          buffer = StringBuf(chr(c))
-          state = _State.start_tag_annot
-        elif c is ord("."):
-          classes.append(str(buffer))
-          buffer = StringBuf()
-        elif c in (EOF_MARKER, ord(">")):
-          if c == ord(">"):
-            position += 1
-          classes.append(str(buffer))
-          yield StartTagToken(str(result), classes)
-          break
-        else:
-          buffer.append(chr(c))
-
-      elif state is _State.start_tag_annot:
-
-        if c == ord("&"):
-          state = _State.annot_cref
-          buffer = StringBuf("&")
-        elif c in (ord(">"), EOF_MARKER):
-          if c == ord(">"):
-            position += 1
-          annot = re.sub(r"\s+", " ", str(buffer).strip())
-          yield StartTagToken(str(result), classes, annot)
-          break
-        else:
-          buffer.append(chr(c))
-
-      elif state is _State.annot_cref:
-        if c == ord(";"):
-          coded_entity = str(buffer)
-          decoded_entity = html.unescape(coded_entity)
-          if decoded_entity == coded_entity:
-            result.extend(buffer)
-          else:
-            result.append(decoded_entity)
-          state = _State.start_tag_annot
-        elif c in (EOF_MARKER, ord(">")):
-          result.extend(buffer)
-          state = _State.start_tag_annot
-          continue
-        else:
-          buffer.append(chr(c))
-
-      elif state is _State.end_tag:
-        if c in (ord(">"), EOF_MARKER):
-          if c == ord(">"):
-            position += 1
-          yield EndTagToken(str(result))
-          break
-        result.append(chr(c))
-
-      elif state is _State.ts_tag:
-        if c in (ord(">"), EOF_MARKER):
-          if c == ord(">"):
-            position += 1
-          yield TimestampTagToken(str(result))
-          break
-        result.append(chr(c))
-
-      else:
-        raise RuntimeError("Bad state")
-
-      position += 1
+    token, position = _tokenize_data(cue_text, position, [])
+    yield token
@@ -27,20 +27,25 @@
 
 from __future__ import annotations
 import dataclasses
+import itertools
 import logging
+import math
+import os
 from fractions import Fraction
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO, Tuple
 
 import ttconv.model as model
-from ttconv.vtt.config import VTTWriterConfiguration
+from ttconv.vtt.config import DEFAULT_SEGMENT_TIMESTAMP_MAP_MPEGTS, VTTWriterConfiguration
 import ttconv.vtt.style as style
 from ttconv.filters.isd.default_style_properties import DefaultStylePropertyValuesISDFilter
 from ttconv.filters.isd.merge_paragraphs import ParagraphsMergingISDFilter
 from ttconv.filters.isd.merge_regions import RegionsMergingISDFilter
 from ttconv.filters.isd.supported_style_properties import SupportedStylePropertiesISDFilter
-from ttconv.isd import ISD
+from ttconv.isd import ISD, ISDConfiguration, TimeGrid
+from ttconv.limits import ResourceLimits, limit_sink
 from ttconv.vtt.cue import VttCue
 from ttconv.vtt.css_class import CssClass
+from ttconv.utils import FileOrPath, open_text
 from ttconv.style_properties import DirectionType, ExtentType, PositionType, StyleProperties, FontStyleType, NamedColors, \
                                     FontWeightType, TextDecorationType, DisplayAlignType, TextAlignType
 
@@ -49,7 +54,7 @@
 class VttContext:
   """VTT writer context"""
 
-  def __init__(self, config: VTTWriterConfiguration):
+  def __init__(self, config: VTTWriterConfiguration, sink: Optional[TextIO] = None):
     self._captions_counter: int = 0
     self._begin: Fraction = Fraction(0)
     self._end: Fraction = Fraction(0)
@@ -59,6 +64,11 @@ def __init__(self, config: VTTWriterConfiguration):
     self._background_colors_used: Dict[str, str] = {}
     self._config = config
 
+    # if specified, cues are written to the sink, and released, as soon as they are final
+    self._sink = sink
+    self._written_count: int = 0
+    self._is_header_written = False
+
     self._filters = []
 
     if not self._config.line_position:
@@ -105,6 +115,99 @@ def __init__(self, config: VTTWriterConfiguration):
       })
     )
 
+  def _get_color_classname(self, color: str) -> str:
+    color_classname = self._colors_used.get(color)
+    if color_classname is None:
+      if self._is_header_written:
+        LOGGER.warning("Color %s was not declared in the STYLE block", color)
+      color_classname = style.get_color_classname(color)
+      self._colors_used[color] = color_classname
+      self._css_classes.append(CssClass("color", color, color_classname))
+    return color_classname
+
+  def _get_background_color_classname(self, bg_color: str) -> str:
+    bg_color_classname = self._background_colors_used.get(bg_color)
+    if bg_color_classname is None:
+      if self._is_header_written:
+        LOGGER.warning("Background color %s was not declared in the STYLE block", bg_color)
+      bg_color_classname = style.get_background_color_classname(bg_color)
+      self._background_colors_used[bg_color] = bg_color_classname
+      self._css_classes.append(CssClass("background-color", bg_color, bg_color_classname))
+    return bg_color_classname
+
+  def declare_colors(self, doc: model.ContentDocument):
+    """Declares a CSS class for each text and background color, other than the default ones, that can be
+    applied to the text of a span of `doc`, so that the STYLE block is complete before any cue is processed.
+    Colors that are specified but never displayed, e.g. outside of the conversion window, are also declared."""
+
+    def _specified_values(element: model.ContentElement, style_prop, inherited_values: List) -> List:
+      values = [step.value for step in element.iter_animation_steps() if step.style_property is style_prop]
+      value = element.get_style(style_prop)
+      if value is not None:
+        values.append(value)
+      elif values:
+        # the animated value is applied during only part of the active interval of the element
+        values.extend(inherited_values)
+      return values if values else inherited_values
+
+    body = doc.get_body()
+
+    if body is None:
+      return
+
+    initial_colors = [value for style_prop, value in doc.iter_initial_values() if style_prop is StyleProperties.Color]
+    has_regions = any(True for _ in doc.iter_regions())
+
+    # text colors that can be inherited by an element, where `None` stands for the color of its region, and
+    # region with which the element is associated
+    elements = [(body, [None], None)]
+
+    while elements:
+      element, inherited_colors, inherited_region = elements.pop()
+
+      begin = element.get_begin()
+      end = element.get_end()
+      if begin is not None and end is not None and end <= begin:
+        # the element is never active
+        continue
+
+      region = element.get_region() if element.get_region() is not None else inherited_region
+      colors = _specified_values(element, StyleProperties.Color, inherited_colors)
+
+      if (
+          isinstance(element, model.Span) and
+          (region is not None or not has_regions) and
+          any(isinstance(child, model.Text) and child.get_text() for child in element)
+        ):
+        region_colors = initial_colors if region is None else \
+          _specified_values(region, StyleProperties.Color, initial_colors)
+
+        for color in itertools.chain.from_iterable(region_colors if c is None else (c,) for c in colors):
+          if color != NamedColors.white.value:
+            self._get_color_classname(style.to_hex_color(color))
+
+        # background colors are not inherited
+        for bg_color in _specified_values(element, StyleProperties.BackgroundColor, []):
+          if bg_color != NamedColors.transparent.value:
+            self._get_background_color_classname(style.to_hex_color(bg_color))
+
+      elements.extend((child, colors, region) for child in reversed(list(element)))
+
+  def _write_cues(self, count: int):
+    """Writes the first `count` cues to the sink, preceded by the header if not already written, and
+    releases them"""
+    if not self._is_header_written:
+      self._sink.write(self.header())
+      self._is_header_written = True
+
+    for cue in self._paragraphs[:count]:
+      if self._written_count > 0:
+        self._sink.write("\n")
+      self._written_count += 1
+      self._sink.write(cue.to_string())
+
+    del self._paragraphs[:count]
+
   def process_inline_element(self, element: model.ContentElement, begin: Fraction, end: Optional[Fraction]):
     """Converts inline element (span and br) to VTT content"""
 
@@ -118,23 +221,13 @@ def process_inline_element(self, element: model.ContentElement, begin: Fraction,
 
       opened_color = False
       if color is not None:
-        if self._colors_used.get(color) is None:
-          color_classname = style.get_color_classname(color)
-          self._colors_used[color] = color_classname
-          self._css_classes.append(CssClass("color", color, color_classname))
-        else:
-          color_classname = self._colors_used[color]
+        color_classname = self._get_color_classname(color)
         self._paragraphs[-1].append_text(style.COLOR_TAG_IN.format(color_classname))
         opened_color = True
 
       opened_bg_color = False
       if bg_color is not None:
-        if self._background_colors_used.get(bg_color) is None:
-          bg_color_classname = style.get_background_color_classname(bg_color)
-          self._background_colors_used[bg_color] = bg_color_classname
-          self._css_classes.append(CssClass("background-color", bg_color, bg_color_classname))
-        else:
-          bg_color_classname = self._background_colors_used[bg_color]
+        bg_color_classname = self._get_background_color_classname(bg_color)
         self._paragraphs[-1].append_text(style.BG_COLOR_TAG_IN.format(bg_color_classname))
         opened_bg_color = True
 
@@ -251,6 +344,10 @@ def add_isd(self, isd: ISD, begin: Fraction, end: Optional[Fraction]):
     if is_isd_empty:
       LOGGER.debug("Skipping empty paragraph.")
 
+    if self._sink is not None:
+      # only the last cue can still be modified, see finish()
+      self._write_cues(len(self._paragraphs) - 1)
+
   def finish(self):
     """Checks and processes the last paragraph"""
 
@@ -267,6 +364,9 @@ def finish(self):
         LOGGER.warning("Set a default end value to paragraph (begin + 10s).")
         self._paragraphs[-1].set_end(self._paragraphs[-1].get_begin().to_seconds() + 10.0)
 
+    if self._sink is not None:
+      self._write_cues(len(self._paragraphs))
+
   def style_block(self):
     """Generated CSS INLINE STYLE Block"""
     style_block = ""
@@ -275,8 +375,36 @@ def style_block(self):
       style_block = "STYLE\n" + cue_default +"\n".join(css.to_string() for css in self._css_classes) + "\n\n"
     return style_block
 
+  def header(self, is_segment: bool = False) -> str:
+    """Generates the WebVTT file header, including the STYLE block. The header of a segment always includes an
+    `X-TIMESTAMP-MAP` header, which HLS requires."""
+    header = "WEBVTT\n"
+    timestamp_map_mpegts = self._config.timestamp_map_mpegts
+    if timestamp_map_mpegts is None and is_segment:
+      timestamp_map_mpegts = DEFAULT_SEGMENT_TIMESTAMP_MAP_MPEGTS
+    if timestamp_map_mpegts is not None:
+      header += f"X-TIMESTAMP-MAP=MPEGTS:{timestamp_map_mpegts},LOCAL:00:00:00.000\n"
+    return header + "\n" + self.style_block()
+
+  def segments(self, segment_duration: Fraction) -> List[str]:
+    """Splits the VTT content into documents, where the document at index `i` contains the cues that are active
+    during [i * segment_duration, (i + 1) * segment_duration). Cues that span multiple segments are repeated in each."""
+    segments: List[List[VttCue]] = []
+
+    for cue in self._paragraphs:
+      first_segment = math.floor(cue.get_begin().to_seconds() / segment_duration)
+      last_segment = math.ceil(cue.get_end().to_seconds() / segment_duration) - 1
+
+      while len(segments) <= last_segment:
+        segments.append([])
+
+      for i in range(first_segment, last_segment + 1):
+        segments[i].append(cue)
+
+    return [self.header(True) + "\n".join(p.to_string() for p in cues) for cues in segments]
+
   def __str__(self) -> str:
-    return "WEBVTT\n\n" + self.style_block() + "\n".join(p.to_string() for p in self._paragraphs)
+    return self.header() + "\n".join(p.to_string() for p in self._paragraphs)
 
 
 #
@@ -284,28 +412,139 @@ def __str__(self) -> str:
 #
 
 
-def from_model(doc: model.ContentDocument, config = None, progress_callback=lambda _: None) -> str:
-  """Converts the data model to a VTT document"""
-
-  # split progress between ISD construction and VTT writing
-  def _isd_progress(progress: float):
-    progress_callback(progress / 2)
+def from_model(
+  doc: model.ContentDocument,
+  config: Optional[VTTWriterConfiguration] = None,
+  progress_callback=lambda _: None,
+  isd_config: Optional[ISDConfiguration] = None,
+  limits: Optional[ResourceLimits] = None
+  ) -> str:
+  """Converts the data model to a VTT document. If specified, `isd_config` restricts the conversion to a window
+  of the document."""
+
+  vtt = str(_convert(doc, config, progress_callback, isd_config, None, limits))
+
+  if limits is not None:
+    ResourceLimits.check("max_output_size", limits.max_output_size, len(vtt))
+
+  return vtt
+
+def from_model_segmented(
+  doc: model.ContentDocument,
+  config: Optional[VTTWriterConfiguration] = None,
+  progress_callback=lambda _: None,
+  isd_config: Optional[ISDConfiguration] = None,
+  limits: Optional[ResourceLimits] = None
+  ) -> List[str]:
+  """Converts the data model to a sequence of VTT documents, where the document at index `i` covers
+  [i * `config.segment_duration`, (i + 1) * `config.segment_duration`), e.g. for HLS delivery. If specified,
+  `isd_config` restricts the conversion to a window of the document."""
+
+  if config is None or config.segment_duration is None:
+    raise ValueError("The segment duration must be specified")
+
+  segments = _convert(doc, config, progress_callback, isd_config, None, limits).segments(config.segment_duration)
+
+  if limits is not None:
+    ResourceLimits.check("max_output_size", limits.max_output_size, sum(len(segment) for segment in segments))
+
+  return segments
+
+def from_model_to_stream(
+  doc: model.ContentDocument,
+  sink: TextIO,
+  config: Optional[VTTWriterConfiguration] = None,
+  progress_callback=lambda _: None,
+  isd_config: Optional[ISDConfiguration] = None,
+  limits: Optional[ResourceLimits] = None
+  ):
+  """Converts the data model to a VTT document, which is written to `sink` one cue at a time, as soon as each
+  cue is final. Since the STYLE block precedes the cues, it declares all the colors that can be applied to the text
+  of the document (see `VttContext.declare_colors()`). If specified, `isd_config` restricts the conversion to a window of the
+  document and `limits` caps the resources used by the conversion."""
+
+  _convert(doc, config, progress_callback, isd_config, limit_sink(sink, limits), limits)
+
+def from_model_to_file(
+  doc: model.ContentDocument,
+  file: FileOrPath,
+  config: Optional[VTTWriterConfiguration] = None,
+  progress_callback=lambda _: None,
+  isd_config: Optional[ISDConfiguration] = None,
+  limits: Optional[ResourceLimits] = None
+  ):
+  """Converts the data model to a VTT document, which is written to `file`, a path or a binary file object, as it is
+  generated (see `from_model_to_stream()`). If `config.segment_duration` is specified, the document is instead
+  segmented (see `from_model_segmented()`) and segment `i` is written to `<path without extension>-<i><extension>`,
+  in which case `file` must be a path. The files written are removed if an exception is raised."""
+
+  if config is not None and config.segment_duration is not None:
+    if not isinstance(file, (str, os.PathLike)):
+      raise ValueError("Segmented WebVTT output must be written to a path")
+
+    root, ext = os.path.splitext(file)
+
+    segment_paths = []
+
+    try:
+      for i, vtt_segment in enumerate(from_model_segmented(doc, config, progress_callback, isd_config, limits)):
+        segment_paths.append(f"{root}-{i}{ext}")
+        with open_text(segment_paths[-1], "w") as vtt_file:
+          vtt_file.write(vtt_segment)
+    except BaseException:
+      # the segments already written are incomplete without the others
+      for segment_path in segment_paths:
+        if os.path.exists(segment_path):
+          os.remove(segment_path)
+      raise
+
+  else:
+    with open_text(file, "w") as vtt_file:
+      from_model_to_stream(doc, vtt_file, config, progress_callback, isd_config, limits)
+
+def _convert(
+  doc: model.ContentDocument,
+  config: Optional[VTTWriterConfiguration],
+  progress_callback,
+  isd_config: Optional[ISDConfiguration],
+  sink: Optional[TextIO] = None,
+  limits: Optional[ResourceLimits] = None
+  ) -> VttContext:
+
+  isd_config = isd_config if isd_config is not None else ISDConfiguration()
 
   # create context
-  vtt = VttContext(config if config is not None else VTTWriterConfiguration())
+  vtt = VttContext(config if config is not None else VTTWriterConfiguration(), sink)
+
+  if sink is not None:
+    vtt.declare_colors(doc)
+
+  # ISDs are computed as they are processed, and an ISD is processed once the next one, which
+  # determines its end, is available
+
+  isds = ISD.iter_isd_sequence(
+    doc,
+    progress_callback,
+    coalesce=True,
+    time_grid=TimeGrid(Fraction(1000)),
+    begin=isd_config.begin,
+    end=isd_config.end,
+    worker_threads=isd_config.worker_threads,
+    limits=limits
+  )
 
-  # Compute ISDs
-  isds = ISD.generate_isd_sequence(doc, _isd_progress)
+  previous: Optional[Tuple[Fraction, ISD]] = None
 
-  # process ISDs
-  for i, (begin, isd) in enumerate(isds):
+  for begin, isd in isds:
 
-    end = isds[i + 1][0] if i + 1 < len(isds) else None
+    if previous is not None:
+      vtt.add_isd(previous[1], previous[0], begin)
 
-    vtt.add_isd(isd, begin, end)
+    previous = (begin, isd)
 
-    progress_callback(0.5 + (i + 1) / len(isds) / 2)
+  if previous is not None:
+    vtt.add_isd(previous[1], previous[0], None)
 
   vtt.finish()
 
-  return str(vtt)
+  return vtt
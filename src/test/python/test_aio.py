@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for the asyncio API'''
+
+# pylint: disable=R0201,C0115,C0116
+
+import asyncio
+import concurrent.futures
+import io
+import unittest
+from pathlib import Path
+
+import ttconv.aio as aio
+import ttconv.scc.reader as scc_reader
+import ttconv.srt.reader as srt_reader
+import ttconv.srt.writer as srt_writer
+from ttconv.filters.doc.lcd import LCDDocFilter, LCDDocFilterConfig
+from ttconv.isd import ISD
+
+_SCC_PATH = "src/test/resources/scc/pop-on.scc"
+
+async def _collect(aiter) -> list:
+  return [item async for item in aiter]
+
+class AioTest(unittest.TestCase):
+
+  def setUp(self):
+    self.scc_content = Path(_SCC_PATH).read_text()
+
+  def test_to_model_from_model(self):
+    async def _convert():
+      doc = await aio.to_model(scc_reader.to_model, self.scc_content)
+      return await aio.from_model(srt_writer.from_model, doc)
+
+    self.assertEqual(
+      asyncio.run(_convert()),
+      srt_writer.from_model(scc_reader.to_model(self.scc_content))
+    )
+
+  def test_process_pool(self):
+    async def _convert(executor):
+      doc = await aio.to_model(scc_reader.to_model, self.scc_content, executor=executor)
+      doc = await aio.apply_filters(doc, [LCDDocFilter(LCDDocFilterConfig())], executor=executor)
+      return await aio.from_model(srt_writer.from_model, doc, executor=executor)
+
+    doc = scc_reader.to_model(self.scc_content)
+    LCDDocFilter(LCDDocFilterConfig()).process(doc)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+      self.assertEqual(asyncio.run(_convert(executor)), srt_writer.from_model(doc))
+
+      with self.assertRaises(ValueError):
+        asyncio.run(_collect(aio.iter_isd_sequence(doc, executor=executor)))
+
+  def test_iter_isd_sequence(self):
+    doc = scc_reader.to_model(self.scc_content)
+
+    isds = asyncio.run(_collect(aio.iter_isd_sequence(doc)))
+
+    self.assertEqual(
+      [offset for offset, _ in isds],
+      [offset for offset, _ in ISD.generate_isd_sequence(doc)]
+    )
+
+  def test_iter_output(self):
+    doc = scc_reader.to_model(self.scc_content)
+
+    chunks = asyncio.run(_collect(aio.iter_output(srt_writer.from_model_to_stream, doc)))
+
+    self.assertGreater(len(chunks), 1)
+    self.assertEqual("".join(chunks), srt_writer.from_model(doc))
+
+  def test_iter_output_early_exit(self):
+    doc = scc_reader.to_model(self.scc_content)
+
+    async def _first():
+      async for chunk in aio.iter_output(srt_writer.from_model_to_stream, doc):
+        return chunk
+      return None
+
+    self.assertTrue(asyncio.run(_first()).startswith("1\n"))
+
+  def test_iter_output_slow_consumer(self):
+    doc = srt_reader.to_model(io.StringIO("1\n00:00:01,000 --> 00:00:02,000\nHello\n"))
+
+    written = []
+
+    def _writer(doc, sink):
+      for i in range(50):
+        sink.write(str(i))
+        written.append(i)
+
+    async def _consume():
+      pending = []
+      async for _ in aio.iter_output(_writer, doc, max_pending_chunks=4):
+        # the consumer is slower than the writer
+        await asyncio.sleep(0.005)
+        pending.append(len(written) - len(pending))
+      return pending
+
+    pending = asyncio.run(_consume())
+
+    self.assertEqual(len(pending), 50)
+    self.assertLessEqual(max(pending), 5)
+
+  def test_iter_output_early_exit_blocked_writer(self):
+    doc = scc_reader.to_model(self.scc_content)
+
+    async def _first():
+      async for chunk in aio.iter_output(srt_writer.from_model_to_stream, doc, max_pending_chunks=1):
+        # the writer is blocked until the iteration is abandoned
+        await asyncio.sleep(0.05)
+        return chunk
+      return None
+
+    self.assertTrue(asyncio.run(_first()).startswith("1\n"))
+
+  def test_iter_output_error(self):
+    doc = srt_reader.to_model(io.StringIO("1\n00:00:01,000 --> 00:00:02,000\nHello\n"))
+
+    def _failing_writer(doc, sink):
+      sink.write("a")
+      raise RuntimeError()
+
+    with self.assertRaises(RuntimeError):
+      asyncio.run(_collect(aio.iter_output(_failing_writer, doc)))
+
+  def test_interleaving(self):
+    doc = scc_reader.to_model(self.scc_content)
+
+    async def _both():
+      return await asyncio.gather(
+        _collect(aio.iter_output(srt_writer.from_model_to_stream, doc)),
+        _collect(aio.iter_isd_sequence(doc))
+      )
+
+    chunks, isds = asyncio.run(_both())
+    self.assertEqual("".join(chunks), srt_writer.from_model(doc))
+    self.assertEqual(len(isds), len(ISD.generate_isd_sequence(doc)))
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for compressed files and archive members'''
+
+# pylint: disable=R0201,C0115,C0116
+
+import gzip
+import lzma
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+import ttconv.archive as archive
+import ttconv.srt.reader as srt_reader
+import ttconv.tt as tt
+
+SRT_PATH = "src/test/resources/srt/extended-tags.srt"
+
+STL_PATH = "src/test/resources/stl/sandflow/br_new_colors.stl"
+
+class ArchivePathTest(unittest.TestCase):
+
+  def test_split_member_path(self):
+    self.assertEqual(archive.split_member_path("a/b.zip!/c/ep01.stl"), ("a/b.zip", "c/ep01.stl"))
+    self.assertEqual(archive.split_member_path("b.tar.gz!/ep01.stl"), ("b.tar.gz", "ep01.stl"))
+    self.assertEqual(archive.split_member_path("ep01.stl"), ("ep01.stl", None))
+    self.assertEqual(archive.split_member_path("b.txt!/ep01.stl"), ("b.txt!/ep01.stl", None))
+    self.assertEqual(archive.split_member_path("b.zip!/"), ("b.zip!/", None))
+
+  def test_content_extension(self):
+    self.assertEqual(archive.content_extension("ep01.srt"), ".srt")
+    self.assertEqual(archive.content_extension("ep01.srt.gz"), ".srt")
+    self.assertEqual(archive.content_extension("ep01.SRT.XZ"), ".SRT")
+    self.assertEqual(archive.content_extension("b.zip!/ep01.stl"), ".stl")
+    self.assertEqual(archive.content_extension("b.zip!/ep01.stl.bz2"), ".stl")
+
+  def test_is_plain_path(self):
+    self.assertTrue(archive.is_plain_path("ep01.srt"))
+    self.assertFalse(archive.is_plain_path("ep01.srt.gz"))
+    self.assertFalse(archive.is_plain_path("b.zip!/ep01.stl"))
+
+class ArchiveIOTest(unittest.TestCase):
+
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    shutil.rmtree(self.directory, ignore_errors=True)
+
+  def _path(self, name: str) -> str:
+    return os.path.join(self.directory, name)
+
+  def test_open_source_plain(self):
+    with archive.open_source(SRT_PATH) as f:
+      self.assertEqual(f, SRT_PATH)
+
+  def test_open_source_compressed(self):
+    with open(SRT_PATH, "rb") as f:
+      srt_bytes = f.read()
+
+    with gzip.open(self._path("ep01.srt.gz"), "wb") as f:
+      f.write(srt_bytes)
+
+    with archive.open_source(self._path("ep01.srt.gz")) as f:
+      self.assertEqual(f.read(), srt_bytes)
+
+    with archive.open_source(self._path("ep01.srt.gz")) as f:
+      self.assertIsNotNone(srt_reader.to_model_from_file(f))
+
+  def test_open_source_zip_member(self):
+    with zipfile.ZipFile(self._path("a.zip"), "w") as f:
+      f.write(SRT_PATH, "dir/ep01.srt")
+
+    with archive.open_source(self._path("a.zip") + "!/dir/ep01.srt") as f:
+      self.assertIsNotNone(srt_reader.to_model_from_file(f))
+
+    with self.assertRaises(KeyError):
+      with archive.open_source(self._path("a.zip") + "!/ep02.srt"):
+        pass
+
+  def test_open_source_tar_member(self):
+    with tarfile.open(self._path("a.tar.gz"), "w:gz") as f:
+      f.add(SRT_PATH, "ep01.srt")
+
+    with archive.open_source(self._path("a.tar.gz") + "!/ep01.srt") as f:
+      self.assertIsNotNone(srt_reader.to_model_from_file(f))
+
+    with self.assertRaises(KeyError):
+      with archive.open_source(self._path("a.tar.gz") + "!/ep02.srt"):
+        pass
+
+  def test_iter_members(self):
+    with zipfile.ZipFile(self._path("a.zip"), "w") as f:
+      f.write(SRT_PATH, "ep01.srt")
+      f.writestr("dir/", b"")
+      f.write(STL_PATH, "dir/ep02.stl")
+
+    self.assertEqual(list(archive.iter_members(self._path("a.zip"))), ["ep01.srt", "dir/ep02.stl"])
+
+    with tarfile.open(self._path("a.tar"), "w") as f:
+      f.add(SRT_PATH, "ep01.srt")
+      f.add(STL_PATH, "ep02.stl")
+
+    self.assertEqual(list(archive.iter_members(self._path("a.tar"))), ["ep01.srt", "ep02.stl"])
+
+    with self.assertRaises(ValueError):
+      list(archive.iter_members(SRT_PATH))
+
+  def test_open_target_compressed(self):
+    with archive.open_target(self._path("ep01.vtt.xz")) as f:
+      f.write(b"WEBVTT\n")
+
+    with lzma.open(self._path("ep01.vtt.xz"), "rb") as f:
+      self.assertEqual(f.read(), b"WEBVTT\n")
+
+  def test_open_target_compressed_removed_on_error(self):
+    with self.assertRaises(RuntimeError):
+      with archive.open_target(self._path("ep01.vtt.gz")) as f:
+        f.write(b"WEBVTT\n")
+        raise RuntimeError()
+
+    self.assertFalse(os.path.exists(self._path("ep01.vtt.gz")))
+
+  def test_open_target_zip_member(self):
+    for name in ("ep01.vtt", "ep02.vtt"):
+      with archive.open_target(self._path("a.zip") + "!/" + name) as f:
+        f.write(b"WEBVTT\n")
+
+    with zipfile.ZipFile(self._path("a.zip")) as f:
+      self.assertEqual(f.namelist(), ["ep01.vtt", "ep02.vtt"])
+      self.assertEqual(f.read("ep02.vtt"), b"WEBVTT\n")
+
+    with self.assertRaises(ValueError):
+      with archive.open_target(self._path("a.zip") + "!/ep01.vtt") as f:
+        f.write(b"WEBVTT\n")
+
+  def test_open_target_member_not_added_on_error(self):
+    with self.assertRaises(RuntimeError):
+      with archive.open_target(self._path("a.tar") + "!/ep01.vtt") as f:
+        f.write(b"WEBVTT\n")
+        raise RuntimeError()
+
+    self.assertFalse(os.path.exists(self._path("a.tar")))
+
+  def test_open_target_tar_member(self):
+    with archive.open_target(self._path("a.tar") + "!/ep01.vtt") as f:
+      f.write(b"WEBVTT\n")
+
+    with tarfile.open(self._path("a.tar")) as f:
+      self.assertEqual(f.extractfile("ep01.vtt").read(), b"WEBVTT\n")
+
+    with self.assertRaises(ValueError):
+      with archive.open_target(self._path("a.tar.gz") + "!/ep01.vtt"):
+        pass
+
+  def test_convert_compressed(self):
+    with open(SRT_PATH, "rb") as f_in, gzip.open(self._path("ep01.srt.gz"), "wb") as f_out:
+      f_out.write(f_in.read())
+
+    tt.main(["convert", "-i", self._path("ep01.srt.gz"), "-o", self._path("ep01.vtt.xz")])
+
+    with lzma.open(self._path("ep01.vtt.xz"), "rt", encoding="utf-8") as f:
+      self.assertRegex(f.read(), "00:02:16.612 --> 00:02:19.376")
+
+  def test_convert_archive_members(self):
+    with zipfile.ZipFile(self._path("in.zip"), "w") as f:
+      f.write(STL_PATH, "ep01.stl")
+
+    tt.main(["convert", "-i", self._path("in.zip") + "!/ep01.stl", "-o", self._path("out.zip") + "!/ep01.srt"])
+
+    with zipfile.ZipFile(self._path("out.zip")) as f:
+      self.assertIn("Blue On Yellow", f.read("ep01.srt").decode("utf-8"))
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for incremental batch conversion'''
+
+# pylint: disable=R0201,C0115,C0116
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+import ttconv.batch as batch
+import ttconv.tt as tt
+
+SRT_PATHS = ("src/test/resources/srt/alignment.srt", "src/test/resources/srt/extended-tags.srt")
+
+STL_PATH = "src/test/resources/stl/sandflow/br_new_colors.stl"
+
+class BatchTest(unittest.TestCase):
+
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.input_dir = os.path.join(self.directory, "in")
+    self.output_dir = os.path.join(self.directory, "out")
+
+    os.makedirs(os.path.join(self.input_dir, "sub"))
+
+    for path in SRT_PATHS:
+      shutil.copy(path, self.input_dir)
+
+    shutil.copy(STL_PATH, os.path.join(self.input_dir, "sub"))
+
+    with open(os.path.join(self.input_dir, "notes.txt"), "w", encoding="utf-8") as f:
+      f.write("not a document")
+
+  def tearDown(self):
+    shutil.rmtree(self.directory, ignore_errors=True)
+
+  def _build(self, **kwargs) -> batch.BatchResult:
+    return batch.build([self.input_dir], self.output_dir, "vtt", workers=2, **kwargs)
+
+  def test_find_jobs(self):
+    jobs = batch.find_jobs([self.input_dir], "vtt")
+
+    self.assertEqual(
+      [job.output_name for job in jobs],
+      ["alignment.vtt", "extended-tags.vtt", "sub/br_new_colors.vtt"]
+    )
+
+    jobs = batch.find_jobs([self.input_dir], "vtt", itype="stl")
+
+    self.assertEqual([job.output_name for job in jobs], ["sub/br_new_colors.vtt"])
+
+  def test_find_jobs_archive(self):
+    archive_path = os.path.join(self.directory, "in.zip")
+
+    with zipfile.ZipFile(archive_path, "w") as f:
+      f.write(STL_PATH, "ep01.stl")
+      f.write(SRT_PATHS[0], "dir/ep02.srt")
+      f.writestr("readme.txt", "not a document")
+
+    jobs = batch.find_jobs([archive_path, SRT_PATHS[1] + ".gz"], "ttml")
+
+    self.assertEqual(jobs, [
+      batch.BatchJob(archive_path + "!/ep01.stl", "ep01.ttml"),
+      batch.BatchJob(archive_path + "!/dir/ep02.srt", "dir/ep02.ttml"),
+      batch.BatchJob(SRT_PATHS[1] + ".gz", "extended-tags.ttml")
+    ])
+
+  def test_find_jobs_conflict(self):
+    with self.assertRaises(ValueError):
+      batch.find_jobs([SRT_PATHS[0], SRT_PATHS[0]], "vtt")
+
+  def test_hash_parameters(self):
+    h = batch.hash_parameters("vtt", config_data={"general": {"progress_bar": False}, "document_cache": {}})
+
+    self.assertEqual(h, batch.hash_parameters("VTT"))
+    self.assertNotEqual(h, batch.hash_parameters("vtt", config_data={"general": {"document_lang": "fr"}}))
+    self.assertNotEqual(h, batch.hash_parameters("vtt", filters=["lcd"]))
+    self.assertNotEqual(h, batch.hash_parameters("vtt", config_data={"vtt_writer": {"line_position": True}}))
+
+  def test_incremental_build(self):
+    result = self._build()
+
+    self.assertEqual(sorted(result.converted), ["alignment.vtt", "extended-tags.vtt", "sub/br_new_colors.vtt"])
+    self.assertEqual(result.skipped, [])
+    self.assertEqual(result.failed, {})
+    self.assertTrue(os.path.exists(os.path.join(self.output_dir, "sub", "br_new_colors.vtt")))
+    self.assertTrue(os.path.exists(os.path.join(self.output_dir, batch.MANIFEST_NAME)))
+
+    # nothing changed
+
+    result = self._build()
+
+    self.assertEqual(result.converted, [])
+    self.assertEqual(len(result.skipped), 3)
+
+    # one input changed and one output was removed
+
+    with open(os.path.join(self.input_dir, "alignment.srt"), "a", encoding="utf-8") as f:
+      f.write("\n99\n00:10:00,000 --> 00:10:01,000\nAdded\n")
+
+    os.remove(os.path.join(self.output_dir, "extended-tags.vtt"))
+
+    result = self._build()
+
+    self.assertEqual(sorted(result.converted), ["alignment.vtt", "extended-tags.vtt"])
+    self.assertEqual(result.skipped, ["sub/br_new_colors.vtt"])
+
+    with open(os.path.join(self.output_dir, "alignment.vtt"), encoding="utf-8") as f:
+      self.assertIn("Added", f.read())
+
+    # one output was edited without changing its size
+
+    output_path = os.path.join(self.output_dir, "sub", "br_new_colors.vtt")
+
+    with open(output_path, "rb") as f:
+      data = bytearray(f.read())
+
+    data[-2] = ord("X") if data[-2] != ord("X") else ord("Y")
+
+    with open(output_path, "wb") as f:
+      f.write(data)
+
+    result = self._build()
+
+    self.assertEqual(result.converted, ["sub/br_new_colors.vtt"])
+
+    # the configuration changed
+
+    result = self._build(config=json.dumps({"vtt_writer": {"line_position": True}}))
+
+    self.assertEqual(len(result.converted), 3)
+
+    # rebuild requested
+
+    result = self._build(config=json.dumps({"vtt_writer": {"line_position": True}}), force=True)
+
+    self.assertEqual(len(result.converted), 3)
+
+  def test_failed_conversion(self):
+    with open(os.path.join(self.input_dir, "bad.vtt"), "w", encoding="utf-8") as f:
+      f.write("not a WebVTT document")
+
+    result = batch.build([self.input_dir], self.output_dir, "srt", workers=2)
+
+    self.assertEqual(list(result.failed), ["bad.srt"])
+    self.assertEqual(len(result.converted), 3)
+
+    manifest = batch.BuildManifest(os.path.join(self.output_dir, batch.MANIFEST_NAME))
+
+    self.assertIsNone(manifest.get("bad.srt"))
+    self.assertIsNotNone(manifest.get("alignment.srt"))
+
+    # failed conversions are attempted again
+
+    result = batch.build([self.input_dir], self.output_dir, "srt", workers=2)
+
+    self.assertEqual(list(result.failed), ["bad.srt"])
+    self.assertEqual(len(result.skipped), 3)
+
+  def test_unreadable_manifest(self):
+    os.makedirs(self.output_dir)
+
+    with open(os.path.join(self.output_dir, batch.MANIFEST_NAME), "w", encoding="utf-8") as f:
+      f.write("{")
+
+    self.assertEqual(len(self._build().converted), 3)
+
+  def test_tt_batch(self):
+    manifest_path = os.path.join(self.directory, "manifest.json")
+
+    tt.main(["batch", "-i", self.input_dir, "-o", self.output_dir, "--otype", "ttml", "--manifest", manifest_path,
+      "--workers", "1"])
+
+    self.assertTrue(os.path.exists(os.path.join(self.output_dir, "sub", "br_new_colors.ttml")))
+
+    with open(manifest_path, encoding="utf-8") as f:
+      self.assertEqual(len(json.load(f)["outputs"]), 3)
+
+  def test_tt_batch_unknown_type(self):
+    with self.assertRaises(SystemExit):
+      tt.main(["batch", "-i", self.input_dir, "-o", self.output_dir, "--otype", "stl"])
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for the cancellation of conversions'''
+
+# pylint: disable=R0201,C0115,C0116
+
+import os
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+import ttconv.scc.reader as scc_reader
+import ttconv.srt.writer as srt_writer
+import ttconv.tt as tt
+from ttconv.cancellation import CancellationToken, ConversionCancelledError, DeadlineExceededError
+from ttconv.isd import ISD
+
+_SCC_PATH = "src/test/resources/scc/mix-rows-roll-up.scc"
+
+class CancellationTokenTest(unittest.TestCase):
+
+  def test_no_deadline(self):
+    token = CancellationToken()
+    token.check()
+    self.assertIsNone(token.remaining())
+    self.assertFalse(token.is_cancelled())
+
+  def test_cancel(self):
+    token = CancellationToken(timeout=1000)
+    token.cancel()
+    self.assertTrue(token.is_cancelled())
+
+    with self.assertRaises(ConversionCancelledError):
+      token.check()
+
+  def test_deadline(self):
+    token = CancellationToken(timeout=0)
+    self.assertLessEqual(token.remaining(), 0)
+
+    with self.assertRaises(DeadlineExceededError):
+      token.check()
+
+  def test_bad_timeout(self):
+    with self.assertRaises(ValueError):
+      CancellationToken(timeout=-1)
+
+  def test_wrap(self):
+    progress = []
+    token = CancellationToken()
+    progress_callback = token.wrap(progress.append)
+
+    progress_callback(0.5)
+    token.cancel()
+
+    with self.assertRaises(ConversionCancelledError):
+      progress_callback(1)
+
+    self.assertEqual(progress, [0.5])
+
+class ConversionCancellationTest(unittest.TestCase):
+
+  def setUp(self):
+    self.scc_content = Path(_SCC_PATH).read_text()
+
+  def test_reader(self):
+    token = CancellationToken()
+    token.cancel()
+
+    with self.assertRaises(ConversionCancelledError):
+      scc_reader.to_model(self.scc_content, None, token.wrap())
+
+  def _cancel_after(self, token: CancellationToken, count: int):
+    progress = []
+
+    def _progress_callback(percent_progress: float):
+      progress.append(percent_progress)
+      if len(progress) == count:
+        token.cancel()
+
+    return token.wrap(_progress_callback), progress
+
+  def test_isd_sequence(self):
+    doc = scc_reader.to_model(self.scc_content)
+
+    for worker_threads in (1, 4):
+      token = CancellationToken()
+      progress_callback, progress = self._cancel_after(token, 3)
+
+      with self.assertRaises(ConversionCancelledError):
+        ISD.generate_isd_sequence(doc, progress_callback, worker_threads=worker_threads)
+
+      self.assertEqual(len(progress), 3)
+
+  def test_writer(self):
+    doc = scc_reader.to_model(self.scc_content)
+
+    with self.assertRaises(DeadlineExceededError):
+      srt_writer.from_model(doc, None, CancellationToken(timeout=0).wrap())
+
+  def test_tt_timeout(self):
+    with tempfile.TemporaryDirectory() as temp_dir:
+      output_path = os.path.join(temp_dir, "mix-rows-roll-up.srt")
+
+      with self.assertRaises(SystemExit):
+        tt.main([
+          "convert",
+          "-i", _SCC_PATH,
+          "-o", output_path,
+          "--config", '{"general": {"progress_bar": false, "log_level": "ERROR", "timeout": 0}}'
+        ])
+
+      self.assertFalse(os.path.exists(output_path))
+
+  def test_tt_writer_error(self):
+
+    def _failing_writer(_doc, sink, *_args, **_kwargs):
+      sink.write("1\n")
+      raise RuntimeError("writer failure")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+      output_path = os.path.join(temp_dir, "mix-rows-roll-up.srt")
+
+      with unittest.mock.patch("ttconv.srt.writer.from_model_to_stream", _failing_writer):
+        with self.assertRaises(RuntimeError):
+          tt.main([
+            "convert",
+            "-i", _SCC_PATH,
+            "-o", output_path,
+            "--config", '{"general": {"progress_bar": false, "log_level": "ERROR"}}'
+          ])
+
+      self.assertFalse(os.path.exists(output_path))
+
+  def test_tt_writer_error_before_open(self):
+
+    def _failing_writer(*_args, **_kwargs):
+      raise RuntimeError("writer failure")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+      output_path = os.path.join(temp_dir, "mix-rows-roll-up.ttml")
+
+      with open(output_path, "w", encoding="utf-8") as f:
+        f.write("previous")
+
+      with unittest.mock.patch("ttconv.imsc.writer.from_model", _failing_writer):
+        with self.assertRaises(RuntimeError):
+          tt.main([
+            "convert",
+            "-i", _SCC_PATH,
+            "-o", output_path,
+            "--config", '{"general": {"progress_bar": false, "log_level": "ERROR"}}'
+          ])
+
+      # the file was not opened by the conversion and is left unchanged
+      with open(output_path, "r", encoding="utf-8") as f:
+        self.assertEqual(f.read(), "previous")
+
+  def test_tt_segmented_writer_error(self):
+
+    def _failing_segments(*_args, **_kwargs):
+      yield "WEBVTT\n"
+      yield "WEBVTT\n"
+      raise RuntimeError("writer failure")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+      output_path = os.path.join(temp_dir, "mix-rows-roll-up.vtt")
+
+      with unittest.mock.patch("ttconv.vtt.writer.from_model_segmented", _failing_segments):
+        with self.assertRaises(RuntimeError):
+          tt.main([
+            "convert",
+            "-i", _SCC_PATH,
+            "-o", output_path,
+            "--config", '{"general": {"progress_bar": false, "log_level": "ERROR"}, "vtt_writer": {"segment_duration": 10}}'
+          ])
+
+      self.assertEqual(os.listdir(temp_dir), [])
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for the document cache'''
+
+# pylint: disable=R0201,C0115,C0116
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+import xml.etree.ElementTree as et
+
+import ttconv.imsc.reader as imsc_reader
+import ttconv.imsc.writer as imsc_writer
+import ttconv.model as model
+import ttconv.tt as tt
+from ttconv.cache import DocumentCache
+
+def _make_doc(text: str) -> model.ContentDocument:
+  return imsc_reader.to_model(et.ElementTree(et.fromstring(f"""<tt xmlns="http://www.w3.org/ns/ttml" xml:lang="en">
+  <body><div><p begin="1s" end="2s">{text}</p></div></body>
+</tt>""")))
+
+def _to_ttml(doc: model.ContentDocument) -> bytes:
+  return et.tostring(imsc_writer.from_model(doc).getroot())
+
+class DocumentCacheTest(unittest.TestCase):
+
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    shutil.rmtree(self.directory, ignore_errors=True)
+
+  def _entry_path(self, key: str) -> str:
+    return os.path.join(self.directory, key + ".ttcv")
+
+  def test_get_put(self):
+    cache = DocumentCache(self.directory)
+    key = DocumentCache.make_key(b"hello", "ttml")
+
+    self.assertIsNone(cache.get(key))
+
+    doc = _make_doc("hello")
+    cache.put(key, doc)
+
+    self.assertEqual(_to_ttml(cache.get(key)), _to_ttml(doc))
+
+  def test_make_key(self):
+    key = DocumentCache.make_key(b"hello", "scc", "{}")
+
+    self.assertEqual(key, DocumentCache.make_key(io.BytesIO(b"hello"), "scc", "{}"))
+    self.assertNotEqual(key, DocumentCache.make_key(b"hello", "scc", '{"text_align": "left"}'))
+    self.assertNotEqual(key, DocumentCache.make_key(b"hello", "srt", "{}"))
+    self.assertNotEqual(key, DocumentCache.make_key(b"hello!", "scc", "{}"))
+    self.assertNotEqual(DocumentCache.make_key(b"", "ab", "c"), DocumentCache.make_key(b"", "a", "bc"))
+
+  def test_make_key_version(self):
+    key = DocumentCache.make_key(b"hello", "scc", "{}")
+
+    with unittest.mock.patch("ttconv.cache.ttconv_version", return_value="0.0.0"):
+      self.assertNotEqual(key, DocumentCache.make_key(b"hello", "scc", "{}"))
+
+  def test_lru_eviction(self):
+    entry_size = len(open(self._write_entry(DocumentCache(self.directory), "a"), "rb").read())
+    cache = DocumentCache(self.directory, 3 * entry_size)
+
+    paths = [self._write_entry(cache, text) for text in ("a", "b", "c")]
+
+    for i, path in enumerate(paths):
+      os.utime(path, (1000 + i, 1000 + i))
+
+    # "a" becomes the most recently used entry, and "b" the least recently used one
+    self.assertIsNotNone(cache.get(DocumentCache.make_key(b"a")))
+
+    self._write_entry(cache, "d")
+
+    self.assertIsNotNone(cache.get(DocumentCache.make_key(b"a")))
+    self.assertIsNone(cache.get(DocumentCache.make_key(b"b")))
+    self.assertIsNotNone(cache.get(DocumentCache.make_key(b"c")))
+    self.assertIsNotNone(cache.get(DocumentCache.make_key(b"d")))
+
+  def _write_entry(self, cache: DocumentCache, text: str) -> str:
+    key = DocumentCache.make_key(text.encode())
+    cache.put(key, _make_doc(text))
+    return self._entry_path(key)
+
+  def test_corrupted_entry(self):
+    cache = DocumentCache(self.directory)
+    path = self._write_entry(cache, "a")
+
+    with open(path, "r+b") as f:
+      f.truncate(10)
+
+    self.assertIsNone(cache.get(DocumentCache.make_key(b"a")))
+    self.assertFalse(os.path.exists(path))
+
+  def test_clear(self):
+    cache = DocumentCache(self.directory)
+    self._write_entry(cache, "a")
+
+    cache.clear()
+
+    self.assertIsNone(cache.get(DocumentCache.make_key(b"a")))
+
+  def test_tt_convert(self):
+    config = '{"document_cache": {"directory": "%s"}}' % self.directory.replace("\\", "\\\\")
+
+    for _ in range(2):
+      tt.main(['convert',
+        '-i', "src/test/resources/scc/pop-on.scc",
+        '-o', "build/pop-on.cached.ttml",
+        '--config', config
+        ])
+
+    with open("build/pop-on.cached.ttml", "rb") as f:
+      cached_output = f.read()
+
+    tt.main(['convert',
+      '-i', "src/test/resources/scc/pop-on.scc",
+      '-o', "build/pop-on.ttml"
+      ])
+
+    with open("build/pop-on.ttml", "rb") as f:
+      self.assertEqual(cached_output, f.read())
+
+    self.assertEqual(len([e for e in os.listdir(self.directory) if e.endswith(".ttcv")]), 1)
+
+  def test_tt_convert_limits(self):
+    cache_config = '"document_cache": {"directory": "%s"}' % self.directory.replace("\\", "\\\\")
+
+    output_path = os.path.join(self.directory, "extended-tags.vtt")
+
+    # populate the cache
+    tt.main(['convert',
+      '-i', "src/test/resources/srt/extended-tags.srt",
+      '-o', output_path,
+      '--config', '{%s}' % cache_config
+      ])
+
+    os.remove(output_path)
+
+    # the limits also apply to documents read from the cache
+    with self.assertRaises(SystemExit):
+      tt.main(['convert',
+        '-i', "src/test/resources/srt/extended-tags.srt",
+        '-o', output_path,
+        '--config', '{%s, "limits": {"max_elements": 3}}' % cache_config
+        ])
+
+    self.assertFalse(os.path.exists(output_path))
+
+if __name__ == '__main__':
+  unittest.main()
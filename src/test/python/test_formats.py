@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for the format registry'''
+
+# pylint: disable=R0201,C0115,C0116
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import ttconv.formats as formats
+import ttconv.tt as tt
+
+def write_text(doc, path, _config=None, _progress_callback=None, _isd_config=None):
+  with open(path, "w", encoding="utf-8") as f:
+    for element in doc.get_body().dfs_iterator():
+      if element.__class__.__name__ == "Text":
+        f.write(element.get_text())
+
+class FormatRegistryTest(unittest.TestCase):
+
+  def test_get_format(self):
+    self.assertEqual(formats.get_format("srt").name, "srt")
+    self.assertEqual(formats.get_format("SRT").name, "srt")
+    self.assertIsNone(formats.get_format("asdf"))
+
+  def test_get_format_by_extension(self):
+    self.assertEqual(formats.get_format_by_extension(".vtt").name, "vtt")
+    self.assertEqual(formats.get_format_by_extension("TTML").name, "ttml")
+    self.assertIsNone(formats.get_format_by_extension(""))
+    self.assertIsNone(formats.get_format_by_extension(".asdf"))
+
+  def test_load(self):
+    stl = formats.get_format("stl")
+    self.assertIsNotNone(stl.load_reader())
+    self.assertEqual(stl.load_reader_config().name(), "stl_reader")
+    self.assertIsNone(stl.load_writer())
+    self.assertIsNone(stl.load_writer_config())
+
+  def test_register_format(self):
+    formats.register_format(formats.FileFormat(
+      "test_text",
+      extensions=("test_text",),
+      writer=f"{__name__}:write_text"
+    ))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+      output_path = os.path.join(temp_dir, "out.test_text")
+
+      tt.main([
+        "convert",
+        "-i", "src/test/resources/srt/alignment.srt",
+        "-o", output_path,
+        "--config", '{"general": {"progress_bar": false, "log_level": "WARN"}}'
+      ])
+
+      with open(output_path, encoding="utf-8") as f:
+        self.assertIn("Bottom", f.read())
+
+  def test_unsupported_output(self):
+    with self.assertRaises(SystemExit):
+      tt.main(["convert", "-i", "src/test/resources/srt/alignment.srt", "-o", "build/alignment.stl"])
+
+  def test_lazy_imports(self):
+    code = (
+      "import sys, ttconv.tt as tt;"
+      "tt.main(['convert', '-i', 'src/test/resources/srt/alignment.srt', '-o', sys.argv[1],"
+      " '--config', '{\"general\": {\"progress_bar\": false, \"log_level\": \"WARN\"}}']);"
+      "print(' '.join(sys.modules))"
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+      result = subprocess.run(
+        [sys.executable, "-c", code, os.path.join(temp_dir, "sample.vtt")],
+        stdout=subprocess.PIPE,
+        check=True,
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+      )
+
+    modules = result.stdout.decode().split()
+
+    self.assertIn("ttconv.srt.reader", modules)
+    self.assertIn("ttconv.vtt.writer", modules)
+    for module in ("ttconv.imsc.reader", "ttconv.scc.reader", "ttconv.stl.reader", "ttconv.srt.writer"):
+      self.assertNotIn(module, modules)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -146,5 +146,99 @@ def test_show_background(self):
     # all regions should be visible at 0.1s since "ABCDEF" is shown in r4
     self.assertEqual(len(list(isd.iter_regions())), 4)
 
+  def test_region_styles(self):
+    ttml_doc = """<tt xml:lang="en"
+    xmlns="http://www.w3.org/ns/ttml"
+    xmlns:tts="http://www.w3.org/ns/ttml#styling"
+    xmlns:ttp="http://www.w3.org/ns/ttml#parameter"
+    tts:extent="800px 400px">
+  <head>
+    <layout>
+      <region xml:id="r1" tts:extent="400px 40px" tts:origin="80px 20px" tts:padding="20px" tts:showBackground="always"/>
+      <region xml:id="r2" tts:extent="50% 50%" tts:origin="0% 50%" tts:showBackground="always">
+        <set begin="1s" end="2s" tts:origin="50% 50%"/>
+      </region>
+    </layout>
+  </head>
+  <body>
+    <div>
+      <p region="r1" begin="0s" end="1s">a</p>
+      <p region="r1" begin="1s" end="3s">b</p>
+      <p region="r2" begin="0s" end="3s">c</p>
+    </div>
+  </body>
+</tt>"""
+
+    doc = imsc_reader.to_model(et.ElementTree(et.fromstring(ttml_doc)))
+
+    sig_times = ISD.significant_times(doc)
+
+    self.assertEqual(list(sig_times), [0, 1, 2, 3])
+
+    for _ in range(2):
+      for t in (0, 1, 2):
+        isd = ISD.from_model(doc, t, sig_times)
+
+        r1 = isd.get_region("r1")
+
+        self.assertEqual(
+          r1.get_style(styles.StyleProperties.Extent),
+          styles.ExtentType(
+            height=styles.LengthType(10, styles.LengthType.Units.rh),
+            width=styles.LengthType(50, styles.LengthType.Units.rw)
+          )
+        )
+        self.assertEqual(
+          r1.get_style(styles.StyleProperties.Origin),
+          styles.CoordinateType(
+            x=styles.LengthType(10, styles.LengthType.Units.rw),
+            y=styles.LengthType(5, styles.LengthType.Units.rh)
+          )
+        )
+        self.assertEqual(
+          r1.get_style(styles.StyleProperties.Padding).before,
+          styles.LengthType(5, styles.LengthType.Units.rh)
+        )
+
+        r2 = isd.get_region("r2")
+
+        self.assertEqual(
+          r2.get_style(styles.StyleProperties.Origin).x,
+          styles.LengthType(50 if t == 1 else 0, styles.LengthType.Units.rw)
+        )
+
+    # the styles of the animated region are not cached
+
+    region_styles = [cached_doc.region_styles for cached_doc in sig_times.cache()]
+
+    self.assertEqual([len(i) for i in region_styles], [1, 0])
+
+  def test_default_region_styles(self):
+    ttml_doc = """<tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml">
+  <body>
+    <div>
+      <p begin="0s" end="1s">a</p>
+      <p begin="1s" end="2s">b</p>
+      <p begin="2s" end="3s">c</p>
+    </div>
+  </body>
+</tt>"""
+
+    doc = imsc_reader.to_model(et.ElementTree(et.fromstring(ttml_doc)))
+
+    sig_times = ISD.significant_times(doc)
+
+    self.assertEqual(list(sig_times), [0, 1, 2, 3])
+
+    for t in (0, 1, 2):
+      isd = ISD.from_model(doc, t, sig_times)
+      self.assertIsNotNone(isd.get_region(ISD.DEFAULT_REGION_ID))
+
+    # the default region, which is created for each ISD, has a single entry
+
+    region_styles = [cached_doc.region_styles for cached_doc in sig_times.cache()]
+
+    self.assertEqual([len(i) for i in region_styles], [1])
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2020, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for ISD fingerprinting and coalescing'''
+
+# pylint: disable=R0201,C0115,C0116
+
+import unittest
+import xml.etree.ElementTree as et
+import ttconv.imsc.reader as imsc_reader
+import ttconv.srt.writer as srt_writer
+from ttconv.isd import ISD
+
+_TTML_DOC = """<?xml version="1.0" encoding="UTF-8"?>
+<tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml" xmlns:tts="http://www.w3.org/ns/ttml#styling">
+  <body>
+    <div>
+      <p xml:id="p1" begin="0s" end="1s">hello</p>
+      <p xml:id="p2" begin="1s" end="2s">hello</p>
+      <p xml:id="p3" begin="2s" end="3s" tts:color="red">hello</p>
+    </div>
+  </body>
+</tt>"""
+
+class ISDFingerprintTests(unittest.TestCase):
+
+  def setUp(self):
+    self.doc = imsc_reader.to_model(et.ElementTree(et.fromstring(_TTML_DOC)))
+
+  def test_same_content(self):
+    isd0 = ISD.from_model(self.doc, 0)
+    isd1 = ISD.from_model(self.doc, 1)
+    isd2 = ISD.from_model(self.doc, 2)
+
+    self.assertEqual(isd0.fingerprint(), isd1.fingerprint())
+    self.assertTrue(isd0.has_same_content(isd1))
+    self.assertFalse(isd1.has_same_content(isd2))
+
+  def test_fingerprint_reset(self):
+    isd0 = ISD.from_model(self.doc, 0)
+    isd1 = ISD.from_model(self.doc, 1)
+
+    isd1.remove_region(ISD.DEFAULT_REGION_ID)
+
+    self.assertFalse(isd0.has_same_content(isd1))
+    self.assertTrue(isd1.has_same_content(ISD(self.doc)))
+
+  def test_coalesce(self):
+    isds = ISD.generate_isd_sequence(self.doc)
+    self.assertSequenceEqual([t for t, _ in isds], [0, 1, 2, 3])
+
+    isds = ISD.generate_isd_sequence(self.doc, coalesce=True)
+    self.assertSequenceEqual([t for t, _ in isds], [0, 2, 3])
+
+  def test_srt_writer(self):
+    self.assertEqual(srt_writer.from_model(self.doc), """1
+00:00:00,000 --> 00:00:02,000
+hello
+
+2
+00:00:02,000 --> 00:00:03,000
+<font color="#ff0000ff">hello</font>
+""")
+
+if __name__ == '__main__':
+  unittest.main()
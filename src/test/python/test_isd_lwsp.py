@@ -87,5 +87,27 @@ def test_lwsp_preserve(self):
 
     self.assertEqual(spans[2][0].get_text(), "is Mathilda")
 
+  def test_lwsp_across_isds(self):
+    doc = imsc_reader.to_model(et.ElementTree(et.fromstring("""<tt xmlns="http://www.w3.org/ns/ttml" xml:lang="en">
+  <body><div><p begin="0s" end="4s"><span>  hello  </span><span begin="1s" end="2s"> big </span><span begin="1s" end="3s"> wide </span><span>  world  </span></p></div></body>
+</tt>""")))
+
+    sig_times = ISD.significant_times(doc)
+
+    def _texts(offset):
+      isd = ISD.from_model(doc, offset, sig_times)
+      p = list(isd.iter_regions())[0][0][0][0]
+      return [span[0].get_text() for span in p]
+
+    # the second ISD at a given offset reuses the processed text
+
+    for _ in range(2):
+      self.assertEqual(_texts(0), ["hello ", "world"])
+      self.assertEqual(_texts(1), ["hello ", "big ", "wide ", "world"])
+      self.assertEqual(_texts(2), ["hello ", "wide ", "world"])
+      self.assertEqual(_texts(3), ["hello ", "world"])
+
+    self.assertEqual(len(sig_times.cache()[0].lwsp_cache), 3)
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for the generation of ISD sequences by multiple threads'''
+
+# pylint: disable=R0201,C0115,C0116,W0212
+
+from fractions import Fraction
+import unittest
+import xml.etree.ElementTree as et
+from pathlib import Path
+
+import ttconv.imsc.reader as imsc_reader
+import ttconv.scc.reader as scc_reader
+from ttconv.isd import ISD, ISDConfiguration
+
+class ISDThreadsTests(unittest.TestCase):
+
+  def setUp(self):
+    self.doc = scc_reader.to_model(Path("src/test/resources/scc/mix-rows-roll-up.scc").read_text())
+
+  def _assert_same_sequence(self, isds, expected_isds):
+    self.assertSequenceEqual([t for t, _ in isds], [t for t, _ in expected_isds])
+
+    for (_, isd), (_, expected_isd) in zip(isds, expected_isds):
+      self.assertTrue(isd.has_same_content(expected_isd))
+
+  def test_same_sequence(self):
+    expected_isds = ISD.generate_isd_sequence(self.doc, worker_threads=1)
+
+    self.assertGreater(len(expected_isds), 10)
+
+    self._assert_same_sequence(ISD.generate_isd_sequence(self.doc, worker_threads=4), expected_isds)
+
+  def test_same_sequence_with_options(self):
+    options = {"coalesce": True, "begin": Fraction(5), "end": Fraction(30)}
+
+    self._assert_same_sequence(
+      ISD.generate_isd_sequence(self.doc, worker_threads=3, **options),
+      ISD.generate_isd_sequence(self.doc, worker_threads=1, **options)
+    )
+
+  def test_shared_cache_is_not_modified(self):
+    # the document has no regions, so ISDs use a default region that is not in the cache
+    doc = imsc_reader.to_model(et.ElementTree(et.fromstring("""<tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml">
+  <body><div><p begin="1s" end="2s">hello</p></div></body>
+</tt>""")))
+
+    sig_times = ISD.significant_times(doc)
+
+    interval_caches = [dict(cached_doc.interval_cache) for cached_doc in sig_times.cache()]
+
+    for offset in sig_times:
+      ISD.from_model(doc, offset, sig_times)
+
+    self.assertEqual([cached_doc.interval_cache for cached_doc in sig_times.cache()], interval_caches)
+
+  def test_early_exit(self):
+    isds = ISD.iter_isd_sequence(self.doc, worker_threads=2)
+
+    first_offset, _ = next(isds)
+    isds.close()
+
+    self.assertEqual(first_offset, ISD.generate_isd_sequence(self.doc)[0][0])
+
+  def test_bad_worker_threads(self):
+    with self.assertRaises(ValueError):
+      ISD.generate_isd_sequence(self.doc, worker_threads=0)
+
+  def test_config(self):
+    self.assertIsNone(ISDConfiguration.parse({}).worker_threads)
+    self.assertEqual(ISDConfiguration.parse({"worker_threads": 4}).worker_threads, 4)
+
+    with self.assertRaises(ValueError):
+      ISDConfiguration.parse({"worker_threads": 0})
+
+    with self.assertRaises(ValueError):
+      ISDConfiguration.parse({"worker_threads": "4"})
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2020, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for snapping of significant times onto a time grid'''
+
+# pylint: disable=R0201,C0115,C0116
+
+from fractions import Fraction
+import unittest
+import xml.etree.ElementTree as et
+import ttconv.imsc.reader as imsc_reader
+from ttconv.isd import ISD, TimeGrid
+
+class ISDTimeGridTests(unittest.TestCase):
+
+  def test_snap(self):
+    self.assertEqual(TimeGrid(Fraction(1000)).snap(Fraction(10006, 10000)), Fraction(1001, 1000))
+    self.assertEqual(TimeGrid(Fraction(1000), round_down=True).snap(Fraction(10006, 10000)), Fraction(1))
+    self.assertEqual(TimeGrid(Fraction(30000, 1001), round_down=True).snap(Fraction(1)), Fraction(29 * 1001, 30000))
+
+  def test_bad_rate(self):
+    with self.assertRaises(ValueError):
+      TimeGrid(Fraction(0))
+
+  def test_sub_grid_times(self):
+    ttml_doc = """<?xml version="1.0" encoding="UTF-8"?>
+<tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml">
+  <body>
+    <div>
+      <p begin="1s" end="1.01s">flash</p>
+      <p begin="1.01s" end="2s">hello</p>
+    </div>
+  </body>
+</tt>"""
+    doc = imsc_reader.to_model(et.ElementTree(et.fromstring(ttml_doc)))
+
+    isds = ISD.generate_isd_sequence(doc, time_grid=TimeGrid(Fraction(25), round_down=True))
+
+    self.assertSequenceEqual([t for t, _ in isds], [0, 1, 2])
+
+    p = list(isds[1][1].iter_regions())[0][0][0][0]
+
+    self.assertEqual(p[0][0].get_text(), "hello")
+
+if __name__ == '__main__':
+  unittest.main()
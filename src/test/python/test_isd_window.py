@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2020, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for the generation of ISD sequences within a window'''
+
+# pylint: disable=R0201,C0115,C0116
+
+from fractions import Fraction
+import unittest
+import xml.etree.ElementTree as et
+import ttconv.imsc.reader as imsc_reader
+from ttconv.isd import ISD, ISDConfiguration
+
+_TTML_DOC = """<?xml version="1.0" encoding="UTF-8"?>
+<tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml">
+  <body>
+    <div>
+      <p begin="1s" end="3s">hello</p>
+      <p begin="4s" end="6s">bye</p>
+    </div>
+  </body>
+</tt>"""
+
+class ISDWindowTests(unittest.TestCase):
+
+  def setUp(self):
+    self.doc = imsc_reader.to_model(et.ElementTree(et.fromstring(_TTML_DOC)))
+
+  def test_no_window(self):
+    isds = ISD.generate_isd_sequence(self.doc)
+    self.assertSequenceEqual([t for t, _ in isds], [0, 1, 3, 4, 6])
+
+  def test_begin_end(self):
+    isds = ISD.generate_isd_sequence(self.doc, begin=Fraction(2), end=Fraction(5))
+    self.assertSequenceEqual([t for t, _ in isds], [2, 3, 4, 5])
+
+    p = list(isds[0][1].iter_regions())[0][0][0][0]
+    self.assertEqual(p[0][0].get_text(), "hello")
+
+    self.assertEqual(len(isds[-1][1]), 0)
+
+  def test_begin_on_sig_time(self):
+    isds = ISD.generate_isd_sequence(self.doc, begin=Fraction(3))
+    self.assertSequenceEqual([t for t, _ in isds], [3, 4, 6])
+
+  def test_end_only(self):
+    isds = ISD.generate_isd_sequence(self.doc, end=Fraction(4))
+    self.assertSequenceEqual([t for t, _ in isds], [0, 1, 3, 4])
+
+  def test_coalesce(self):
+    isds = ISD.generate_isd_sequence(self.doc, coalesce=True, begin=Fraction(3), end=Fraction(4))
+    self.assertSequenceEqual([t for t, _ in isds], [3])
+
+  def test_bad_window(self):
+    with self.assertRaises(ValueError):
+      ISD.generate_isd_sequence(self.doc, begin=Fraction(3), end=Fraction(3))
+
+  def test_config(self):
+    config = ISDConfiguration.parse({"begin": "1.5", "end": 2})
+    self.assertEqual(config.begin, Fraction(3, 2))
+    self.assertEqual(config.end, Fraction(2))
+
+    with self.assertRaises(ValueError):
+      ISDConfiguration.parse({"begin": "-1"})
+
+if __name__ == '__main__':
+  unittest.main()
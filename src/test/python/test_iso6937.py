@@ -27,6 +27,7 @@
 
 # pylint: disable=R0201,C0115,C0116
 
+import codecs
 import unittest
 from ttconv.stl import iso6937
 
@@ -44,5 +45,27 @@ def test_invalid_one_char_decode(self):
   def test_invalid_two_chars_decode(self):
     self.assertEqual(iso6937.decode(b'\xcdz', "replace")[0], '\uFFFD')
 
+  def test_mixed_decode(self):
+    self.assertEqual(iso6937.decode(b'Hello \xc1A\xcfs \xdc!'), ('Hello \u00C0\u0161 \u215B!', 13))
+
+  def test_invalid_char_strict_decode(self):
+    with self.assertRaises(UnicodeDecodeError) as cm:
+      iso6937.decode(b'\xc1Aa\x00')
+    self.assertEqual(cm.exception.start, 3)
+
+  def test_trailing_diacritic_decode(self):
+    self.assertEqual(iso6937.decode(b'a\xc1', "replace"), ('a\uFFFD', 2))
+
+  def test_codec(self):
+    self.assertEqual(b'ab\xc1Acd'.decode("iso6937"), 'ab\u00C0cd')
+    self.assertEqual(codecs.getdecoder("iso6937")(bytearray(b'\xdc')), ('\u215B', 1))
+
+  def test_incremental_decode(self):
+    decoder = codecs.getincrementaldecoder("iso6937")()
+    self.assertEqual(decoder.decode(b'ab\xc1'), 'ab')
+    self.assertEqual(decoder.decode(b'A\xcf'), '\u00C0')
+    self.assertEqual(decoder.decode(b'z', final=True), '\u017E')
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for resource limits'''
+
+# pylint: disable=R0201,C0115,C0116
+
+import io
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as et
+from pathlib import Path
+
+import ttconv.imsc.reader as imsc_reader
+import ttconv.scc.reader as scc_reader
+import ttconv.srt.reader as srt_reader
+import ttconv.srt.writer as srt_writer
+import ttconv.vtt.writer as vtt_writer
+import ttconv.tt as tt
+from ttconv.isd import ISD
+from ttconv.limits import ResourceLimits, ResourceLimitExceededError
+
+_TTML_DOC = """<tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml">
+  <body>
+    <div>
+      <p begin="1s" end="3s">hello</p>
+      <p begin="2s" end="6s">bye</p>
+    </div>
+  </body>
+</tt>"""
+
+_SCC_PATH = "src/test/resources/scc/mix-rows-roll-up.scc"
+
+class ResourceLimitsTest(unittest.TestCase):
+
+  def setUp(self):
+    self.doc = imsc_reader.to_model(et.ElementTree(et.fromstring(_TTML_DOC)))
+
+  def test_config(self):
+    self.assertEqual(ResourceLimits.parse({}), ResourceLimits())
+    self.assertEqual(ResourceLimits.parse({"max_elements": 10}).max_elements, 10)
+
+    with self.assertRaises(ValueError):
+      ResourceLimits.parse({"max_elements": -1})
+
+    with self.assertRaises(ValueError):
+      ResourceLimits.parse({"max_output_size": "10"})
+
+  def test_imsc_reader(self):
+    tree = et.ElementTree(et.fromstring(_TTML_DOC))
+
+    self.assertIsNotNone(imsc_reader.to_model(tree, limits=ResourceLimits(max_elements=100)))
+
+    with self.assertRaises(ResourceLimitExceededError) as cm:
+      imsc_reader.to_model(tree, limits=ResourceLimits(max_elements=4))
+
+    self.assertEqual(cm.exception.limit_name, "max_elements")
+
+  def test_significant_times(self):
+    self.assertEqual(len(ISD.significant_times(self.doc, ResourceLimits(max_significant_times=5))), 5)
+
+    with self.assertRaises(ResourceLimitExceededError):
+      ISD.significant_times(self.doc, ResourceLimits(max_significant_times=4))
+
+  def test_isd_elements(self):
+    isds = ISD.generate_isd_sequence(self.doc)
+    max_isd_elements = max(sum(1 for r in isd.iter_regions() for _ in r.dfs_iterator()) for _, isd in isds)
+
+    ISD.generate_isd_sequence(self.doc, limits=ResourceLimits(max_isd_elements=max_isd_elements))
+
+    with self.assertRaises(ResourceLimitExceededError):
+      ISD.generate_isd_sequence(self.doc, limits=ResourceLimits(max_isd_elements=max_isd_elements - 1))
+
+  def test_output_size(self):
+    doc = scc_reader.to_model(Path(_SCC_PATH).read_text())
+    srt = srt_writer.from_model(doc)
+
+    self.assertEqual(srt_writer.from_model(doc, limits=ResourceLimits(max_output_size=len(srt))), srt)
+
+    with self.assertRaises(ResourceLimitExceededError):
+      srt_writer.from_model(doc, limits=ResourceLimits(max_output_size=len(srt) - 1))
+
+    with self.assertRaises(ResourceLimitExceededError):
+      vtt_writer.from_model(doc, limits=ResourceLimits(max_output_size=10))
+
+    with self.assertRaises(ResourceLimitExceededError):
+      vtt_writer.from_model_to_stream(doc, io.StringIO(), limits=ResourceLimits(max_output_size=10))
+
+  def test_tt(self):
+    with tempfile.TemporaryDirectory() as temp_dir:
+      output_path = os.path.join(temp_dir, "out.srt")
+
+      with self.assertRaises(SystemExit):
+        tt.main([
+          "convert",
+          "-i", _SCC_PATH,
+          "-o", output_path,
+          "--config", '{"general": {"progress_bar": false, "log_level": "ERROR"}, "limits": {"max_output_size": 100}}'
+        ])
+
+      self.assertFalse(os.path.exists(output_path))
+
+      tt.main([
+        "convert",
+        "-i", _SCC_PATH,
+        "-o", output_path,
+        "--config", '{"general": {"progress_bar": false, "log_level": "ERROR"}, "limits": {"max_elements": 100000}}'
+      ])
+
+      self.assertTrue(os.path.exists(output_path))
+
+class ISDSequenceEstimateTest(unittest.TestCase):
+
+  def test_estimate(self):
+    doc = imsc_reader.to_model(et.ElementTree(et.fromstring(_TTML_DOC)))
+
+    estimate = ISD.estimate_sequence(doc)
+    isds = ISD.generate_isd_sequence(doc)
+
+    self.assertEqual(estimate.significant_times, len(isds))
+
+    isd_elements = [sum(1 for r in isd.iter_regions() for _ in r.dfs_iterator()) for _, isd in isds]
+
+    self.assertGreaterEqual(estimate.max_isd_elements, max(isd_elements))
+    self.assertGreaterEqual(estimate.total_isd_elements, sum(isd_elements))
+
+  def test_estimate_check(self):
+    doc = srt_reader.to_model(io.StringIO("1\n00:00:01,000 --> 00:00:02,000\nHello\n"))
+
+    estimate = ISD.estimate_sequence(doc)
+
+    estimate.check(ResourceLimits())
+
+    with self.assertRaises(ResourceLimitExceededError):
+      estimate.check(ResourceLimits(max_significant_times=estimate.significant_times - 1))
+
+if __name__ == '__main__':
+  unittest.main()
@@ -385,6 +385,44 @@ def test_copy_to(self):
 
     self.assertSequenceEqual(list(dest.iter_styles()), list(src.iter_styles()))
 
+  def test_copy_to_shared_styles(self):
+    src = model.ContentElement()
+    src.set_style(styles.StyleProperties.Color, styles.NamedColors.green.value)
+
+    dest = model.ContentElement()
+    src.copy_to(dest)
+
+    # styles are copied when either element modifies them
+
+    dest.set_style(styles.StyleProperties.Color, styles.NamedColors.red.value)
+    src.set_style(styles.StyleProperties.Opacity, 0.5)
+
+    self.assertEqual(src.get_style(styles.StyleProperties.Color), styles.NamedColors.green.value)
+    self.assertEqual(dest.get_style(styles.StyleProperties.Color), styles.NamedColors.red.value)
+    self.assertFalse(dest.has_style(styles.StyleProperties.Opacity))
+
+    other = model.ContentElement()
+    src.copy_to(other)
+    src.set_style(styles.StyleProperties.Color, None)
+
+    self.assertEqual(other.get_style(styles.StyleProperties.Color), styles.NamedColors.green.value)
+    self.assertEqual(other.get_style(styles.StyleProperties.Opacity), 0.5)
+
+    with self.assertRaises(ValueError):
+      other.set_style(styles.StyleProperties.Opacity, styles.NamedColors.red.value)
+
+  def test_copy_to_merged_styles(self):
+    src = model.ContentElement()
+    src.set_style(styles.StyleProperties.Color, styles.NamedColors.green.value)
+
+    dest = model.ContentElement()
+    dest.set_style(styles.StyleProperties.Opacity, 0.5)
+    src.copy_to(dest)
+
+    self.assertEqual(dest.get_style(styles.StyleProperties.Color), styles.NamedColors.green.value)
+    self.assertEqual(dest.get_style(styles.StyleProperties.Opacity), 0.5)
+    self.assertFalse(src.has_style(styles.StyleProperties.Opacity))
+
 class BodyTest(unittest.TestCase):
 
   def test_push_child(self):
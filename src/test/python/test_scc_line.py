@@ -28,7 +28,7 @@
 # pylint: disable=R0201,C0115,C0116,W0212
 import unittest
 
-from ttconv.scc.line import SccLine
+from ttconv.scc.line import SccLine, SccLineBuffer
 from ttconv.scc.caption_style import SccCaptionStyle
 from ttconv.time_code import SmpteTimeCode, FPS_29_97
 
@@ -97,3 +97,40 @@ def test_scc_line_from_str_with_paint_on_style(self):
     self.assertEqual(SmpteTimeCode(1, 3, 27, 29, FPS_29_97, False).to_temporal_offset(), scc_line.time_code.to_temporal_offset())
     self.assertEqual("01:03:27:29	{RDC}{RDC}{1504}{1504}HEY, THERE.", scc_line.to_disassembly())
     self.assertEqual(SccCaptionStyle.PaintOn, scc_line.get_style())
+
+  def test_scc_line_buffer_from_str(self):
+    scc_content = """Scenarist_SCC V1.0
+
+01:03:27:29	94ae 94ae 9420 9420 94f2 94f2 c845 d92c 2054 c845 5245 ae80 942c 942c 8080 8080 942f 942f
+
+01:03:28;02	9420 9420
+
+01:03:29:00	
+"""
+    lines = SccLineBuffer.from_str(scc_content)
+    self.assertEqual(3, len(lines))
+    self.assertEqual([0, 18, 20, 20], list(lines.offsets))
+    self.assertEqual(0x142e, lines.words[0])
+    self.assertEqual(0x4845, lines.words[6])
+
+    scc_lines = list(lines)
+    for (scc_line, line_str) in zip(scc_lines, [line for line in scc_content.splitlines() if line.startswith("01")]):
+      expected = SccLine.from_str(line_str)
+      self.assertEqual(expected.time_code, scc_line.time_code)
+      self.assertEqual(expected.time_code.is_drop_frame(), scc_line.time_code.is_drop_frame())
+      self.assertEqual([w.value for w in expected.scc_words], [w.value for w in scc_line.scc_words])
+      self.assertEqual(expected.to_disassembly(), scc_line.to_disassembly())
+
+    # iterating does not alter the buffered time codes
+    scc_lines[0].time_code.add_frames(10)
+    self.assertEqual(SmpteTimeCode(1, 3, 27, 29, FPS_29_97, False), next(iter(lines)).time_code)
+
+  def test_scc_line_buffer_from_invalid_str(self):
+    with self.assertRaises(ValueError):
+      SccLineBuffer.from_str("01:03:27:29	94ae 942")
+    with self.assertRaises(ValueError):
+      SccLineBuffer.from_str("01:03:27:29	94ae 94zz")
+
+  def test_scc_line_buffer_invalid_word_error(self):
+    with self.assertRaisesRegex(ValueError, "'94zz' in line: 01:03:27:30\t94ae 94zz"):
+      SccLineBuffer.from_str("01:03:27:29	94ae 9420\n\n01:03:27:30	94ae 94zz")
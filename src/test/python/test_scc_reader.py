@@ -35,7 +35,7 @@
 from ttconv.isd import ISD
 from ttconv.model import Br, P, ContentElement, CellResolutionType, Span
 from ttconv.scc.codes.attribute_codes import SccAttributeCode
-from ttconv.scc.reader import to_model, to_disassembly
+from ttconv.scc.reader import to_model, to_disassembly, SccIncrementalReader
 from ttconv.style_properties import StyleProperties, CoordinateType, LengthType, FontStyleType, NamedColors, TextDecorationType, \
   StyleProperty, ExtentType, ColorType, DisplayAlignType, ShowBackgroundType
 from ttconv.time_code import FPS_29_97, SmpteTimeCode
@@ -1542,5 +1542,49 @@ def test_skipping_channel_2_content(self):
     self.assertEqual(region_1, p_list[0].get_region())
 
 
+  def test_incremental_reader_lines(self):
+    paragraphs = []
+    reader = SccIncrementalReader(paragraph_callback=paragraphs.append)
+
+    reader.push_line("Scenarist_SCC V1.0")
+    reader.push_line("")
+    reader.push_line("00:00:00:00\t9420 9420 94f2 94f2 c845 d92c 2054 c845 5245 ae80 942f 942f")
+    self.assertEqual(0, len(paragraphs))
+
+    reader.push_line("00:00:02:00\t942c 942c")
+    self.assertEqual(1, len(paragraphs))
+    self.check_caption(paragraphs[0], "caption1", "00:00:00:10", "00:00:02:00", "HEY, THERE.")
+
+    doc = reader.flush()
+    self.assertIs(doc, reader.get_document())
+    self.assertEqual(1, len(paragraphs))
+    self.assertEqual(paragraphs, list(list(doc.get_body())[0]))
+
+  def test_incremental_reader_bytes(self):
+    paragraphs = []
+    reader = SccIncrementalReader(paragraph_callback=paragraphs.append)
+
+    time_code = SmpteTimeCode.parse("00:00:00:00", FPS_29_97)
+    reader.push_bytes(time_code, bytes.fromhex("94209420"))
+    reader.push_bytes(SmpteTimeCode.parse("00:00:00:02", FPS_29_97), bytes.fromhex("94f294f2c845d92c2054c8455245ae80942f942f"))
+    self.assertEqual("00:00:00:00", str(time_code))
+    self.assertEqual(0, len(paragraphs))
+
+    reader.flush()
+    self.assertEqual(1, len(paragraphs))
+    self.check_caption(paragraphs[0], "caption1", "00:00:00:10", None, "HEY, THERE.")
+
+    with self.assertRaises(ValueError):
+      reader.push_bytes(time_code, bytes.fromhex("942094"))
+
+  def test_incremental_reader_detached_paragraphs(self):
+    reader = SccIncrementalReader(paragraph_callback=lambda p: p.remove())
+
+    reader.push_line("00:00:00:00\t9420 9420 94f2 94f2 c845 d92c 2054 c845 5245 ae80 942f 942f")
+    reader.push_line("00:00:02:00\t942c 942c")
+    doc = reader.flush()
+
+    self.assertEqual(0, len(list(list(doc.get_body())[0])))
+
 if __name__ == '__main__':
   unittest.main()
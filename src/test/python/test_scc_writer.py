@@ -27,6 +27,7 @@
 
 # pylint: disable=R0201,C0115,C0116,W0212
 
+import io
 import json
 import os
 import unittest
@@ -283,6 +284,12 @@ def test_zero_start(self):
     with self.assertRaises(RuntimeError):
       scc_writer.from_model(model)
 
+    # nothing is written to the stream
+    sink = io.StringIO()
+    with self.assertRaises(RuntimeError):
+      scc_writer.from_model_to_stream(model, sink, SccWriterConfiguration(start_tc="00:00:00;00"))
+    self.assertEqual(sink.getvalue(), "")
+
     scc_from_model = scc_writer.from_model(model, SccWriterConfiguration(start_tc="01:00:00;00"))
     expected_scc="""Scenarist_SCC V1.0
 
@@ -331,5 +338,25 @@ def test_multi_regions(self):
     scc_from_model = scc_writer.from_model(model)
     self.assertEqual(scc_from_model, expected_scc)
 
+  def test_stream(self):
+    for root, _subdirs, files in os.walk("src/test/resources/scc"):
+      for filename in files:
+        (name, ext) = os.path.splitext(filename)
+        if ext == ".scc":
+          with self.subTest(name):
+            test_model = scc_reader.to_model(Path(os.path.join(root, filename)).read_text())
+            sink = io.StringIO()
+            scc_writer.from_model_to_stream(test_model, sink)
+            self.assertEqual(sink.getvalue(), scc_writer.from_model(test_model))
+
+  def test_stream_empty_document(self):
+    doc = ContentDocument()
+    doc.set_body(Body(doc))
+
+    sink = io.StringIO()
+    scc_writer.from_model_to_stream(doc, sink)
+    self.assertEqual(sink.getvalue(), "Scenarist_SCC V1.0\n\n")
+
+
 if __name__ == '__main__':
   unittest.main()
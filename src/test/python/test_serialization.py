@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for the binary serialization of the data model'''
+
+# pylint: disable=R0201,C0115,C0116
+
+import io
+import os
+import unittest
+import xml.etree.ElementTree as et
+from fractions import Fraction
+from pathlib import Path
+
+import ttconv.imsc.reader as imsc_reader
+import ttconv.imsc.writer as imsc_writer
+import ttconv.model as model
+import ttconv.scc.reader as scc_reader
+import ttconv.serialization as serialization
+import ttconv.style_properties as styles
+
+class SerializationTest(unittest.TestCase):
+
+  def _assert_same_document(self, doc: model.ContentDocument, doc_copy: model.ContentDocument):
+    self.assertEqual(
+      et.tostring(imsc_writer.from_model(doc).getroot()),
+      et.tostring(imsc_writer.from_model(doc_copy).getroot())
+    )
+
+  def test_scc_test_suite(self):
+    for root, _subdirs, files in os.walk("src/test/resources/scc"):
+      for filename in files:
+        (name, ext) = os.path.splitext(filename)
+        if ext == ".scc":
+          with self.subTest(name):
+            doc = scc_reader.to_model(Path(os.path.join(root, filename)).read_text())
+            data = serialization.dumps(doc)
+            doc_copy = serialization.loads(data)
+            self._assert_same_document(doc, doc_copy)
+            self.assertEqual(serialization.dumps(doc_copy), data)
+
+  def test_document(self):
+    doc = model.ContentDocument()
+    doc.set_lang("fr")
+    doc.set_content_profiles({"http://www.w3.org/ns/ttml/profile/imsc1.1/text"})
+    doc.set_cell_resolution(model.CellResolutionType(rows=20, columns=40))
+    doc.set_px_resolution(model.PixelResolutionType(width=640, height=480))
+    doc.set_active_area(model.ActiveAreaType(0.1, 0.15, 0.8, 0.7))
+    doc.set_display_aspect_ratio(Fraction(16, 9))
+    doc.put_initial_value(styles.StyleProperties.Color, styles.NamedColors.red.value)
+
+    region = model.Region("r1", doc)
+    region.set_style(
+      styles.StyleProperties.Extent,
+      styles.ExtentType(height=styles.LengthType(50, styles.LengthType.Units.pct), width=styles.LengthType(100))
+    )
+    doc.put_region(region)
+
+    body = model.Body(doc)
+    body.set_region(region)
+    doc.set_body(body)
+
+    div = model.Div(doc)
+    div.set_lang("en")
+    body.push_child(div)
+
+    p = model.P(doc)
+    p.set_id("p1")
+    p.set_begin(Fraction(1, 3))
+    p.set_end(Fraction(2))
+    p.set_space(model.WhiteSpaceHandling.PRESERVE)
+    p.add_animation_step(
+      model.DiscreteAnimationStep(styles.StyleProperties.Color, Fraction(1), None, styles.NamedColors.lime.value)
+    )
+    div.push_child(p)
+
+    span = model.Span(doc)
+    span.set_style(
+      styles.StyleProperties.FontFamily,
+      ("Times New Roman", styles.GenericFontFamilyType.monospaceSerif)
+    )
+    span.push_child(model.Text(doc, "hello"))
+    p.push_child(span)
+    p.push_child(model.Br(doc))
+
+    doc_copy = serialization.loads(serialization.dumps(doc))
+
+    self.assertEqual(doc_copy.get_lang(), "fr")
+    self.assertEqual(doc_copy.get_content_profiles(), doc.get_content_profiles())
+    self.assertEqual(doc_copy.get_cell_resolution(), doc.get_cell_resolution())
+    self.assertEqual(doc_copy.get_px_resolution(), doc.get_px_resolution())
+    self.assertEqual(doc_copy.get_active_area(), doc.get_active_area())
+    self.assertEqual(doc_copy.get_display_aspect_ratio(), Fraction(16, 9))
+    self.assertEqual(list(doc_copy.iter_initial_values()), list(doc.iter_initial_values()))
+
+    region_copy = doc_copy.get_region("r1")
+    self.assertEqual(region_copy.get_style(styles.StyleProperties.Extent), region.get_style(styles.StyleProperties.Extent))
+
+    body_copy = doc_copy.get_body()
+    self.assertIs(body_copy.get_region(), region_copy)
+
+    div_copy = body_copy.first_child()
+    self.assertEqual(div_copy.get_lang(), "en")
+
+    p_copy = div_copy.first_child()
+    self.assertEqual(p_copy.get_id(), "p1")
+    self.assertEqual(p_copy.get_begin(), Fraction(1, 3))
+    self.assertEqual(p_copy.get_end(), Fraction(2))
+    self.assertIs(p_copy.get_space(), model.WhiteSpaceHandling.PRESERVE)
+    self.assertEqual(list(p_copy.iter_animation_steps()), list(p.iter_animation_steps()))
+
+    span_copy, br_copy = list(p_copy)
+    self.assertIsInstance(br_copy, model.Br)
+    self.assertIs(br_copy.parent(), p_copy)
+    self.assertIs(span_copy.next_sibling(), br_copy)
+    self.assertEqual(span_copy.get_style(styles.StyleProperties.FontFamily), span.get_style(styles.StyleProperties.FontFamily))
+    self.assertEqual(span_copy.first_child().get_text(), "hello")
+
+    for element in body_copy.dfs_iterator():
+      self.assertIs(element.get_doc(), doc_copy)
+
+    self._assert_same_document(doc, doc_copy)
+
+  def test_deep_document(self):
+    doc = model.ContentDocument()
+    body = model.Body(doc)
+    doc.set_body(body)
+    div = model.Div(doc)
+    body.push_child(div)
+    p = model.P(doc)
+    div.push_child(p)
+
+    parent = p
+    for _ in range(10000):
+      span = model.Span(doc)
+      parent.push_child(span)
+      parent = span
+    parent.push_child(model.Text(doc, "deep"))
+
+    element = serialization.loads(serialization.dumps(doc)).get_body()
+    depth = 0
+    while element.has_children():
+      element = element.first_child()
+      depth += 1
+
+    self.assertEqual(depth, 10003)
+    self.assertEqual(element.get_text(), "deep")
+
+  def test_stream(self):
+    ttml_doc = et.ElementTree(et.fromstring("""<tt xmlns="http://www.w3.org/ns/ttml" xml:lang="en">
+  <body><div><p begin="1s" end="2s">Hello</p></div></body>
+</tt>"""))
+    doc = imsc_reader.to_model(ttml_doc)
+
+    f = io.BytesIO()
+    serialization.dump(doc, f)
+    f.seek(0)
+
+    self._assert_same_document(doc, serialization.load(f))
+
+  def test_empty_document(self):
+    doc = serialization.loads(serialization.dumps(model.ContentDocument()))
+
+    self.assertIsNone(doc.get_body())
+    self.assertEqual(len(list(doc.iter_regions())), 0)
+
+  def test_equal_values(self):
+    doc = model.ContentDocument()
+    body = model.Body(doc)
+    doc.set_body(body)
+
+    # values that compare equal but differ in type or sign are preserved
+    values = (
+      styles.LengthType(100),
+      styles.LengthType(100.0),
+      styles.LengthType(0.0),
+      styles.LengthType(-0.0)
+    )
+
+    for value in values:
+      div = model.Div(doc)
+      div.set_style(styles.StyleProperties.LineHeight, value)
+      body.push_child(div)
+
+    loaded_doc = serialization.loads(serialization.dumps(doc))
+
+    for value, div in zip(values, loaded_doc.get_body()):
+      loaded_value = div.get_style(styles.StyleProperties.LineHeight)
+      self.assertEqual(repr(loaded_value), repr(value))
+      self.assertIs(type(loaded_value.value), type(value.value))
+
+  def test_malformed(self):
+    doc = model.ContentDocument()
+    body = model.Body(doc)
+    doc.set_body(body)
+    data = serialization.dumps(doc)
+
+    with self.assertRaises(ValueError):
+      serialization.loads(b"TTML" + data[4:])
+
+    with self.assertRaises(ValueError):
+      serialization.loads(data[:8] + bytes([serialization.FORMAT_VERSION + 1, 0]) + data[10:])
+
+    with self.assertRaises(ValueError):
+      serialization.loads(data[:-1])
+
+    with self.assertRaises(ValueError):
+      serialization.loads(data + b"\x00")
+
+  def test_unsupported_element(self):
+
+    class CustomSpan(model.Span):
+      pass
+
+    doc = model.ContentDocument()
+    body = model.Body(doc)
+    doc.set_body(body)
+    div = model.Div(doc)
+    body.push_child(div)
+    p = model.P(doc)
+    div.push_child(p)
+    p.push_child(CustomSpan(doc))
+
+    with self.assertRaises(ValueError):
+      serialization.dumps(doc)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for the conversion service'''
+
+# pylint: disable=R0201,C0115,C0116,W0212
+
+import concurrent.futures.process
+import http.client
+import json
+import os
+import tempfile
+import threading
+import unittest
+import urllib.parse
+
+import ttconv.server as server
+import ttconv.tt as tt
+
+_SCC_PATH = "src/test/resources/scc/pop-on.scc"
+
+class ConversionServiceTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.service = server.ConversionService(workers=1)
+    cls.httpd = server.make_server(cls.service, port=0)
+    cls.thread = threading.Thread(target=cls.httpd.serve_forever, daemon=True)
+    cls.thread.start()
+
+  @classmethod
+  def tearDownClass(cls):
+    cls.httpd.shutdown()
+    cls.httpd.server_close()
+    cls.service.shutdown()
+
+  def _request(self, method: str, path: str, body: bytes = None, params: dict = None):
+    if params is not None:
+      path += "?" + urllib.parse.urlencode(params, doseq=True)
+    conn = http.client.HTTPConnection(*self.httpd.server_address[:2], timeout=60)
+    try:
+      conn.request(method, path, body)
+      response = conn.getresponse()
+      return response.status, response.read()
+    finally:
+      conn.close()
+
+  def test_convert(self):
+    with open(_SCC_PATH, "rb") as f:
+      data = f.read()
+
+    status, body = self._request("POST", "/convert", data, {"itype": "scc", "otype": "ttml"})
+    self.assertEqual(status, 200)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+      output_path = os.path.join(temp_dir, "pop-on.ttml")
+      tt.main(["convert", "-i", _SCC_PATH, "-o", output_path, "--config", '{"general": {"progress_bar": false}}'])
+      with open(output_path, "rb") as f:
+        self.assertEqual(body, f.read())
+
+  def test_convert_input_path(self):
+    status, body = self._request("POST", "/convert", b"", {"input": _SCC_PATH, "otype": "srt"})
+    self.assertEqual(status, 200)
+    self.assertIn(b"-->", body)
+
+  def test_bad_output_type(self):
+    with open(_SCC_PATH, "rb") as f:
+      data = f.read()
+
+    status, body = self._request("POST", "/convert", data, {"itype": "scc", "otype": "xyz"})
+    self.assertEqual(status, 400)
+    self.assertIn("error", json.loads(body))
+
+  def test_missing_output_type(self):
+    status, _ = self._request("POST", "/convert", b"", {"input": _SCC_PATH})
+    self.assertEqual(status, 400)
+
+  def test_status(self):
+    status, body = self._request("GET", "/status")
+    self.assertEqual(status, 200)
+    self.assertEqual(json.loads(body)["workers"], 1)
+
+  def test_timeout(self):
+    status, body = self._request("POST", "/convert", b"", {"input": _SCC_PATH, "otype": "srt", "timeout": "0"})
+    self.assertEqual(status, 504)
+    self.assertIn("error", json.loads(body))
+
+  def test_bad_timeout(self):
+    status, _ = self._request("POST", "/convert", b"", {"input": _SCC_PATH, "otype": "srt", "timeout": "abc"})
+    self.assertEqual(status, 400)
+
+  def test_unknown_resource(self):
+    status, _ = self._request("GET", "/convert")
+    self.assertEqual(status, 404)
+
+class BackpressureTest(unittest.TestCase):
+
+  def test_max_pending(self):
+    service = server.ConversionService(workers=1, max_pending=0)
+    httpd = server.make_server(service, port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+      conn = http.client.HTTPConnection(*httpd.server_address[:2], timeout=60)
+      conn.request("POST", "/convert?otype=ttml&input=" + urllib.parse.quote(_SCC_PATH), b"")
+      response = conn.getresponse()
+      response.read()
+      conn.close()
+
+      self.assertEqual(response.status, 503)
+      self.assertIsNotNone(response.getheader("Retry-After"))
+    finally:
+      httpd.shutdown()
+      httpd.server_close()
+      service.shutdown()
+
+  def test_max_input_size(self):
+    service = server.ConversionService(workers=1)
+    httpd = server.make_server(service, port=0, max_input_size=10)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+      conn = http.client.HTTPConnection(*httpd.server_address[:2], timeout=60)
+      conn.request("POST", "/convert?itype=scc&otype=ttml", b"x" * 11)
+      response = conn.getresponse()
+      response.read()
+      conn.close()
+
+      self.assertEqual(response.status, 413)
+    finally:
+      httpd.shutdown()
+      httpd.server_close()
+      service.shutdown()
+
+class WorkerLossTest(unittest.TestCase):
+
+  def test_worker_restart(self):
+    service = server.ConversionService(workers=1)
+
+    try:
+      # terminate the worker process abruptly
+      with self.assertRaises(concurrent.futures.process.BrokenProcessPool):
+        service._executor.submit(os._exit, 1).result()
+
+      with self.assertRaises(server.WorkerLostError):
+        service.try_convert(server.ConversionRequest(otype="srt", input_path=_SCC_PATH))
+
+      self.assertEqual(service.pending(), 0)
+
+      # later requests are processed by new worker processes
+      output = service.try_convert(server.ConversionRequest(otype="srt", input_path=_SCC_PATH))
+      self.assertIn(b"-->", output)
+    finally:
+      service.shutdown()
+
+if __name__ == '__main__':
+  unittest.main()
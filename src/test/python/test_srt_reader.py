@@ -579,6 +579,63 @@ def test_unbalanced_tag_2(self):
       self.assertIsNotNone(doc)
       if len(logs.output) != 2:
         self.fail(logs.output)
+  def test_markup_text_runs(self):
+    f = io.StringIO(r"""1
+00:02:16,612 --> 00:02:19,376
+<b>Hello
+my</b> name <foo>is</foo> &lt;Bob&gt;
+""")
+    with self.assertLogs() as logs:
+      doc = to_model(f)
+      self.assertEqual(len(logs.output), 2)
+
+    p_children = list(doc.get_body().first_child().first_child())
+    self.assertEqual(len(p_children), 2)
+
+    b_span = p_children[0]
+    self.assertEqual(b_span.get_style(styles.StyleProperties.FontWeight), styles.FontWeightType.bold)
+    b_children = list(b_span)
+    self.assertEqual(len(b_children), 3)
+    self.assertEqual(b_children[0].get_text(), "Hello")
+    self.assertIsInstance(b_children[1], model.Br)
+    self.assertEqual(b_children[2].get_text(), "my")
+
+    self.assertIsInstance(p_children[1], model.Span)
+    self.assertEqual(len(p_children[1]), 1)
+    self.assertEqual(p_children[1].first_child().get_text(), " name is <Bob>")
+
+  def test_font_color_unquoted(self):
+    f = io.StringIO(r"""1
+00:02:16,612 --> 00:02:19,376
+<font color=#00ff00>Hello</font>
+""")
+    doc = to_model(f)
+
+    span = doc.get_body().first_child().first_child().first_child()
+    self.assertEqual(span.get_style(styles.StyleProperties.Color), styles.ColorType((0, 255, 0, 255)))
+    self.assertEqual(span.first_child().get_text(), "Hello")
+
+
+  def test_progress(self):
+    f = io.StringIO("1\n00:00:01,000 --> 00:00:02,000\nHello\n\n2\n00:00:03,000 --> 00:00:04,000\nWorld\n")
+
+    progress = []
+    doc = to_model(f, progress_callback=progress.append)
+
+    self.assertEqual(len(doc.get_body().first_child()), 2)
+    self.assertEqual(len(progress), 2)
+    self.assertTrue(0 < progress[0] < progress[1] < 1)
+
+  def test_progress_file(self):
+    # the file is small enough to be read by the first read of the buffered stream
+    with open("src/test/resources/srt/alignment.srt", encoding="utf-8") as f:
+      progress = []
+      to_model(f, progress_callback=progress.append)
+
+    self.assertGreater(len(progress), 1)
+    self.assertEqual(progress, sorted(set(progress)))
+    self.assertLess(progress[-1], 1)
+
 
 if __name__ == '__main__':
   unittest.main()
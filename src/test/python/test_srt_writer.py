@@ -27,6 +27,7 @@
 
 # pylint: disable=R0201,C0115,C0116,W0212
 
+import io
 import os
 import unittest
 import xml.etree.ElementTree as et
@@ -384,5 +385,17 @@ def test_lwsp_filled_lines(self):
     model = srt_writer.from_model(imsc_reader.to_model(et.ElementTree(et.fromstring(ttml_doc_str))))
     self.assertEqual(expected_srt, model)
 
+  def test_stream(self):
+    for root, _subdirs, files in os.walk("src/test/resources/scc"):
+      for filename in files:
+        (name, ext) = os.path.splitext(filename)
+        if ext == ".scc":
+          with self.subTest(name):
+            test_model = scc_reader.to_model(Path(os.path.join(root, filename)).read_text())
+            sink = io.StringIO()
+            srt_writer.from_model_to_stream(test_model, sink)
+            self.assertEqual(sink.getvalue(), srt_writer.from_model(test_model))
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -27,6 +27,7 @@
 
 # pylint: disable=R0201,C0115,C0116
 
+import io
 import unittest
 from ttconv.imsc.designators import IMSC_11_TEXT_PROFILE_DESIGNATOR
 from ttconv.model import Br, Span
@@ -573,5 +574,25 @@ def test_content_profiles_presence(self):
       doc = ttconv.stl.reader.to_model(f)
       self.assertSetEqual({IMSC_11_TEXT_PROFILE_DESIGNATOR}, doc.get_content_profiles())
 
+  def test_user_data_tti_skipped(self):
+    with open("src/test/resources/stl/sandflow/multi_tti_subtitle.stl", "rb") as f:
+      data = f.read()
+
+    # insert a user data block (EBN = 0xFE) between the first two TTI blocks
+    user_data_block = bytes([1, 1, 0, 0xFE]) + b'\xAA' * 124
+    data = data[:1024 + 128] + user_data_block + data[1024 + 128:]
+
+    doc = ttconv.stl.reader.to_model(io.BytesIO(data))
+    text = doc.get_body().first_child().first_child().first_child().first_child().get_text()
+    self.assertEqual(text, "Foo Bar Baz")
+
+  def test_truncated_tti(self):
+    with open("src/test/resources/stl/sandflow/multi_tti_subtitle.stl", "rb") as f:
+      data = f.read()
+
+    with self.assertRaises(ValueError):
+      ttconv.stl.reader.to_model(io.BytesIO(data[:-1]))
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -30,8 +30,10 @@
 import os
 import io
 import unittest
+import unittest.mock
 from contextlib import redirect_stdout
 from contextlib import redirect_stderr
+from fractions import Fraction
 import ttconv.tt as tt
 
 class IMSCAppTest(unittest.TestCase):
@@ -276,5 +278,109 @@ def test_imsc11filter(self):
       '--filter', 'imsc11filter'
       ])
 
+  def test_window(self):
+    out_path = "build/window.vtt"
+
+    tt.main(['convert',
+      '-i', "src/test/resources/srt/extended-tags.srt",
+      '-o', out_path,
+      '--begin', '137',
+      '--end', '138.5'
+      ])
+
+    with open(out_path, encoding="utf-8") as f:
+      self.assertRegex(f.read(), "00:02:17.000 --> 00:02:18.500")
+
+  def test_window_retains_isd_config(self):
+    from ttconv.isd import ISD  # pylint: disable=import-outside-toplevel
+
+    with unittest.mock.patch.object(ISD, "iter_isd_sequence", wraps=ISD.iter_isd_sequence) as iter_isd_sequence:
+      tt.main(['convert',
+        '-i', "src/test/resources/srt/extended-tags.srt",
+        '-o', "build/window.vtt",
+        '--begin', '137',
+        '--config', '{"isd": {"end": 138.5, "worker_threads": 2}}'
+        ])
+
+    _, kwargs = iter_isd_sequence.call_args
+    self.assertEqual(kwargs["begin"], 137)
+    self.assertEqual(kwargs["end"], Fraction("138.5"))
+    self.assertEqual(kwargs["worker_threads"], 2)
+
+  def test_vtt_segments(self):
+    tt.main(['convert',
+      '-i', "src/test/resources/srt/extended-tags.srt",
+      '-o', "build/segments.vtt",
+      '--config', '{"vtt_writer": {"segment_duration": 60}}'
+      ])
+
+    with open("build/segments-2.vtt", encoding="utf-8") as f:
+      vtt = f.read()
+      self.assertRegex(vtt, "00:02:16.612 --> 00:02:19.376")
+      self.assertIn("X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000\n", vtt)
+
+  def test_convert_stdin_stdout(self):
+    with open("src/test/resources/srt/extended-tags.srt", "rb") as f:
+      stdin = io.TextIOWrapper(io.BytesIO(f.read()))
+
+    stdout = io.TextIOWrapper(io.BytesIO())
+
+    with unittest.mock.patch("sys.stdin", stdin), unittest.mock.patch("sys.stdout", stdout):
+      tt.main(['convert', '-i', '-', '--itype', 'srt', '-o', '-', '--otype', 'vtt'])
+
+    self.assertRegex(stdout.buffer.getvalue().decode("utf-8"), "00:02:16.612 --> 00:02:19.376")
+
+  def test_convert_stl_stdin_to_ttml_stdout(self):
+    with open("src/test/resources/stl/sandflow/br_new_colors.stl", "rb") as f:
+      stdin = io.TextIOWrapper(io.BytesIO(f.read()))
+
+    stdout = io.TextIOWrapper(io.BytesIO())
+
+    with unittest.mock.patch("sys.stdin", stdin), unittest.mock.patch("sys.stdout", stdout):
+      tt.main(['convert', '-i', '-', '--itype', 'stl', '-o', '-', '--otype', 'ttml'])
+
+    self.assertIn(b"http://www.w3.org/ns/ttml", stdout.buffer.getvalue())
+
+  def test_convert_stdin_to_file(self):
+    with open("src/test/resources/srt/extended-tags.srt", "rb") as f:
+      stdin = io.TextIOWrapper(io.BytesIO(f.read()))
+
+    with unittest.mock.patch("sys.stdin", stdin):
+      tt.main(['convert', '-i', '-', '--itype', 'srt', '-o', 'build/stdin.vtt'])
+
+    with open("build/stdin.vtt", encoding="utf-8") as f:
+      self.assertRegex(f.read(), "00:02:16.612 --> 00:02:19.376")
+
+  def test_convert_stdin_requires_itype(self):
+    with self.assertRaises(SystemExit):
+      tt.main(['convert', '-i', '-', '-o', 'build/stdin.vtt'])
+
+  def test_convert_stdout_requires_otype(self):
+    with self.assertRaises(SystemExit):
+      tt.main(['convert', '-i', 'src/test/resources/srt/extended-tags.srt', '-o', '-'])
+
+  def test_convert_segmented_vtt_stdout(self):
+    stdout = io.TextIOWrapper(io.BytesIO())
+
+    with unittest.mock.patch("sys.stdout", stdout), self.assertRaises(SystemExit):
+      tt.main(['convert',
+        '-i', "src/test/resources/srt/extended-tags.srt",
+        '-o', '-',
+        '--otype', 'vtt',
+        '--config', '{"vtt_writer": {"segment_duration": 60}}'
+        ])
+
+    self.assertEqual(stdout.buffer.getvalue(), b"")
+
+  def test_convert_segmented_vtt_compressed(self):
+    with self.assertRaises(SystemExit):
+      tt.main(['convert',
+        '-i', "src/test/resources/srt/extended-tags.srt",
+        '-o', "build/segments-compressed.vtt.gz",
+        '--config', '{"vtt_writer": {"segment_duration": 60}}'
+        ])
+
+    self.assertFalse(os.path.exists("build/segments-compressed.vtt.gz"))
+
 if __name__ == '__main__':
   unittest.main()
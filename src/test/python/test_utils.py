@@ -23,9 +23,10 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import io
 import unittest
 from fractions import Fraction
-from ttconv.utils import DisjointIntervals
+from ttconv.utils import DisjointIntervals, stream_progress
 
 class DisjointIntervalsTest(unittest.TestCase):
 
@@ -112,5 +113,35 @@ def test_add_invalid(self):
     with self.assertRaises(ValueError):
       di.add(Fraction(10), Fraction(10))
 
+class StreamProgressTest(unittest.TestCase):
+
+  def test_string_stream(self):
+    f = io.StringIO("abcd\nefgh\n")
+    progress = stream_progress(f)
+    self.assertEqual(progress(0), 0)
+    self.assertEqual(progress(len(f.readline())), 0.5)
+
+  def test_buffered_stream(self):
+    # the buffered stream reads the file in its entirety at once
+    f = io.TextIOWrapper(io.BytesIO(b"abcd\nefgh\n"), encoding="utf-8")
+    progress = stream_progress(f)
+    self.assertEqual(progress(len(f.readline())), 0.5)
+
+  def test_unknown_size(self):
+    f = io.TextIOWrapper(io.BufferedReader(_UnseekableStream(b"abcd\n")), encoding="utf-8")
+    self.assertIsNone(stream_progress(f)(0))
+
+class _UnseekableStream(io.RawIOBase):
+
+  def __init__(self, data: bytes):
+    self.data = io.BytesIO(data)
+
+  def readable(self):
+    return True
+
+  def readinto(self, b):
+    return self.data.readinto(b)
+
+
 if __name__ == '__main__':
   unittest.main()
\ No newline at end of file
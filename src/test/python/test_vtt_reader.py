@@ -516,5 +516,29 @@ def test_empty_file_2(self):
     self.assertIsNotNone(m)
     self.assertEqual(len(m.get_body()), 0)
 
+  def test_unseekable_stream(self):
+    data = b"WEBVTT\r\n\r\n00:00:01.000 --> 00:00:02.000\r\nHello\r\nWorld\r\n"
+    f = io.TextIOWrapper(io.BufferedReader(_UnseekableStream(data)), encoding="utf-8", newline="")
+
+    progress = []
+    doc = to_model(f, progress_callback=progress.append)
+
+    self.assertEqual(len(progress), 0)
+    p = doc.get_body().first_child().first_child()
+    self.assertEqual(p.get_begin(), 1)
+    self.assertEqual(len(p), 3)
+
+class _UnseekableStream(io.RawIOBase):
+
+  def __init__(self, data: bytes):
+    self.data = io.BytesIO(data)
+
+  def readable(self):
+    return True
+
+  def readinto(self, b):
+    return self.data.readinto(b)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -107,3 +107,28 @@ def test_tokenizer_multiline_incomplete_elements(self):
 
     with self.assertRaises(StopIteration):
       next(t)
+
+  def test_tokenizer_plain_text(self):
+    tokens = list(tokenizer.CueTextTokenizer("Plain text\nwith no markup"))
+
+    self.assertEqual(len(tokens), 1)
+    self.assertIsInstance(tokens[0], tokenizer.StringToken)
+    self.assertEqual(tokens[0].value, "Plain text\nwith no markup")
+
+    self.assertListEqual(list(tokenizer.CueTextTokenizer("")), [])
+
+  def test_tokenizer_annotation_and_references(self):
+    tokens = list(tokenizer.CueTextTokenizer("<v.loud  Bob\n Smith>Fish &amp; chips&unknown; &lt;<00:00:01.000>"))
+
+    self.assertIsInstance(tokens[0], tokenizer.StartTagToken)
+    self.assertEqual(tokens[0].tag, "v")
+    self.assertListEqual(tokens[0].classes, ["loud"])
+    self.assertEqual(tokens[0].annotation, "Bob Smith")
+
+    self.assertIsInstance(tokens[1], tokenizer.StringToken)
+    self.assertEqual(tokens[1].value, "Fish & chips&unknown <")
+
+    self.assertIsInstance(tokens[2], tokenizer.TimestampTagToken)
+    self.assertEqual(tokens[2].timestamp, "00:00:01.000")
+
+    self.assertEqual(len(tokens), 3)
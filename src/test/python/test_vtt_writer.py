@@ -27,6 +27,7 @@
 
 # pylint: disable=R0201,C0115,C0116,W0212
 
+import io
 import json
 import os
 import unittest
@@ -37,6 +38,8 @@
 import ttconv.imsc.reader as imsc_reader
 import ttconv.scc.reader as scc_reader
 import ttconv.stl.reader as stl_reader
+import ttconv.vtt.reader as vtt_reader
+from ttconv.isd import ISDConfiguration
 from ttconv.vtt.config import VTTWriterConfiguration
 import ttconv.vtt.writer as vtt_writer
 from ttconv.model import ContentDocument, Region, Body, Div, P, Span, Text, ContentElement
@@ -529,5 +532,164 @@ def test_noUnderline(self):
 <u>A</u>B<u>C</u>
 """)
 
+  def test_window(self):
+    ttml_doc_str = """<tt xmlns="http://www.w3.org/ns/ttml">
+  <body>
+    <div>
+      <p begin="00:00:01.000" end="00:00:03.000">A</p>
+      <p begin="00:00:04.000" end="00:00:07.000">B</p>
+      <p begin="00:00:08.000" end="00:00:09.000">C</p>
+    </div>
+  </body>
+</tt>"""
+
+    doc = imsc_reader.to_model(et.ElementTree(et.fromstring(ttml_doc_str)))
+
+    vtt_from_model = vtt_writer.from_model(doc, None, isd_config=ISDConfiguration(begin=Fraction(2), end=Fraction(5)))
+
+    self.assertEqual(vtt_from_model, """WEBVTT
+
+1
+00:00:02.000 --> 00:00:03.000
+A
+
+2
+00:00:04.000 --> 00:00:05.000
+B
+""")
+
+  def test_segments(self):
+    ttml_doc_str = """<tt xmlns="http://www.w3.org/ns/ttml">
+  <body>
+    <div>
+      <p begin="00:00:01.000" end="00:00:03.000">A</p>
+      <p begin="00:00:04.000" end="00:00:07.000">B</p>
+      <p begin="00:00:13.000" end="00:00:14.000">C</p>
+    </div>
+  </body>
+</tt>"""
+
+    doc = imsc_reader.to_model(et.ElementTree(et.fromstring(ttml_doc_str)))
+
+    config = VTTWriterConfiguration.parse({"segment_duration": 5, "timestamp_map_mpegts": 900000})
+
+    segments = vtt_writer.from_model_segmented(doc, config)
+
+    self.assertEqual(len(segments), 3)
+
+    self.assertEqual(segments[0], """WEBVTT
+X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
+
+1
+00:00:01.000 --> 00:00:03.000
+A
+
+2
+00:00:04.000 --> 00:00:07.000
+B
+""")
+
+    self.assertEqual(segments[1], """WEBVTT
+X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
+
+2
+00:00:04.000 --> 00:00:07.000
+B
+""")
+
+    self.assertEqual(segments[2], """WEBVTT
+X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
+
+3
+00:00:13.000 --> 00:00:14.000
+C
+""")
+
+  def test_segments_default_timestamp_map(self):
+    ttml_doc_str = """<tt xmlns="http://www.w3.org/ns/ttml">
+  <body>
+    <div>
+      <p begin="00:00:01.000" end="00:00:03.000">A</p>
+    </div>
+  </body>
+</tt>"""
+
+    doc = imsc_reader.to_model(et.ElementTree(et.fromstring(ttml_doc_str)))
+
+    segments = vtt_writer.from_model_segmented(doc, VTTWriterConfiguration.parse({"segment_duration": 5}))
+
+    self.assertEqual(segments, ["""WEBVTT
+X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000
+
+1
+00:00:01.000 --> 00:00:03.000
+A
+"""])
+
+    # the header is specific to segments
+    self.assertNotIn("X-TIMESTAMP-MAP", vtt_writer.from_model(doc))
+
+  def test_stream(self):
+    ttml_doc_str = """<?xml version="1.0" encoding="UTF-8"?>
+<tt xmlns="http://www.w3.org/ns/ttml"
+    xmlns:tts="http://www.w3.org/ns/ttml#styling">
+  <body>
+    <div>
+      <p begin="00:00:01.000" end="00:00:02.000">A</p>
+      <p begin="00:00:03.000" end="00:00:04.000"><span tts:color="red">B</span></p>
+    </div>
+  </body>
+</tt>"""
+
+    doc = imsc_reader.to_model(et.ElementTree(et.fromstring(ttml_doc_str)))
+
+    sink = io.StringIO()
+    vtt_writer.from_model_to_stream(doc, sink)
+
+    # the color of the second cue is declared before the first cue is written
+    self.assertEqual(sink.getvalue(), vtt_writer.from_model(doc))
+    self.assertEqual(sink.getvalue(), """WEBVTT
+
+STYLE
+::cue {
+  background-color: transparent;
+}
+::cue(.red) {
+  color: #ff0000ff;
+}
+
+1
+00:00:01.000 --> 00:00:02.000
+A
+
+2
+00:00:03.000 --> 00:00:04.000
+<c.red>B</c>
+""")
+
+  def test_stream_matches_from_model(self):
+    for path in sorted(Path("src/test/resources/ttml").glob("*.ttml")):
+      with self.subTest(path=path):
+        doc = imsc_reader.to_model(et.parse(path))
+
+        sink = io.StringIO()
+        vtt_writer.from_model_to_stream(doc, sink)
+
+        self.assertEqual(sink.getvalue(), vtt_writer.from_model(doc))
+
+    for path in sorted(Path("src/test/resources/vtt").glob("**/*.vtt")):
+      with self.subTest(path=path):
+        with open(path, encoding="utf-8") as f:
+          doc = vtt_reader.to_model(f)
+
+        if doc is None:
+          continue
+
+        sink = io.StringIO()
+        vtt_writer.from_model_to_stream(doc, sink)
+
+        self.assertEqual(sink.getvalue(), vtt_writer.from_model(doc))
+
+
 if __name__ == '__main__':
   unittest.main()